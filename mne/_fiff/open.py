@@ -9,7 +9,17 @@ from pathlib import Path
 import numpy as np
 from scipy.sparse import issparse
 
-from ..utils import _check_fname, _file_like, _validate_type, logger, verbose, warn
+from ..utils import (
+    _ArrayCache,
+    _check_fname,
+    _file_like,
+    _get_config_cached,
+    _validate_type,
+    logger,
+    object_size,
+    verbose,
+    warn,
+)
 from .constants import FIFF
 from .tag import Tag, _call_dict_names, _matrix_info, _read_tag_header, read_tag
 from .tree import dir_tree_find, make_dir_tree
@@ -144,6 +154,13 @@ def _fiff_open(fname, fid, preload):
         with fid as fid_old:
             fid = BytesIO(fid_old.read())
 
+    key = _dir_cache_key(fname)
+    cached = _dir_cache.lookup(key)
+    if cached is not None:
+        logger.debug(f"    Using cached tag directory for {fname}")
+        fid.seek(0)
+        return (fid,) + cached
+
     tag = _read_tag_header(fid, 0)
 
     #   Check that this looks like a fif file
@@ -192,6 +209,7 @@ def _fiff_open(fname, fid, preload):
             directory.append(tag)
 
     tree, _ = make_dir_tree(fid, directory, indent=1)
+    _dir_cache.add(key, tree, directory)
 
     logger.debug("[done]")
 
@@ -201,6 +219,67 @@ def _fiff_open(fname, fid, preload):
     return fid, tree, directory
 
 
+class _DirCache(_ArrayCache):
+    """Least-recently-used cache of the parsed tag directories of FIF files.
+
+    Unlike the array caches, its size is the number of files, set by the
+    ``MNE_FIFF_DIR_CACHE_SIZE`` config value. Callers get copies of the trees.
+    """
+
+    def lookup(self, key):
+        """Get the tree and directory of a file, None if they are not cached."""
+        if key is None:
+            return None
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            tree, directory = self._entries[key][0]
+        return _copy_tree(tree), list(directory)
+
+    def add(self, key, tree, directory):
+        """Add a parsed directory, evicting the least recently used ones."""
+        size = int(_get_config_cached(self.config_key, self.default_size))
+        if key is None or size <= 0:
+            return
+        # the tree nodes refer to the same tags as the directory
+        nbytes = object_size(key) + sum(object_size(vars(tag)) for tag in directory)
+        value = (_copy_tree(tree), list(directory))
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, nbytes)
+                self._nbytes += nbytes
+            while len(self._entries) > size:
+                self._nbytes -= self._entries.popitem(last=False)[1][1]
+
+
+# Parsed tag directories and trees of recently opened files, keyed by the
+# identity and modification state of the file on disk
+_dir_cache = _DirCache("fiff_dir", "MNE_FIFF_DIR_CACHE_SIZE", "32")
+
+
+def _dir_cache_key(fname):
+    """Get the directory cache key of a file, None if it cannot be cached."""
+    if not isinstance(fname, Path):  # file-like
+        return None
+    try:
+        stat = fname.stat()
+    except OSError:
+        return None
+    return (str(fname.resolve()), stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _copy_tree(tree):
+    """Copy the nodes of a directory tree (the tags themselves are shared)."""
+    tree = tree.copy()
+    if isinstance(tree["directory"], list):
+        tree["directory"] = list(tree["directory"])
+    tree["children"] = [_copy_tree(child) for child in tree["children"]]
+    return tree
+
+
 @verbose
 def show_fiff(
     fname,
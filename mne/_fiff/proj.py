@@ -328,6 +328,8 @@ class ProjMixin:
             )
             return self
 
+        if isinstance(self, BaseRaw):
+            self._check_no_deferred("Applying projectors")
         _projector, info = setup_proj(
             deepcopy(self.info), add_eeg_ref=False, activate=True
         )
@@ -2,6 +2,8 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+from functools import partial
+
 import numpy as np
 
 from ..defaults import DEFAULTS
@@ -409,6 +411,7 @@ def set_eeg_reference(
     %(set_eeg_reference_see_also_notes)s
     """
     from ..forward import Forward
+    from ..io import BaseRaw
 
     _check_can_reref(inst)
 
@@ -471,6 +474,16 @@ def set_eeg_reference(
     del projection  # not used anymore
 
     inst = inst.copy() if copy else inst
+    if isinstance(inst, BaseRaw) and inst._lazy and not inst.preload:
+        fun = partial(
+            set_eeg_reference,
+            ref_channels=ref_channels,
+            copy=False,
+            ch_type=ch_type,
+            forward=forward,
+            joint=joint,
+        )
+        return inst._defer_reference(fun), None
 
     if ref_channels == "REST":
         _validate_type(forward, Forward, 'forward when ref_channels="REST"')
@@ -0,0 +1,78 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from mne import create_info
+from mne._fiff import open as fiff_open_mod
+from mne._fiff.open import fiff_open
+from mne.io import RawArray, read_raw_fif
+from mne.utils import clear_cache, get_cache_info
+
+
+def test_dir_cache(tmp_path, monkeypatch):
+    """Test caching of parsed FIF tag directories."""
+    clear_cache("fiff_dir")
+    monkeypatch.setenv("MNE_FIFF_DIR_CACHE_SIZE", "2")
+    info = create_info(3, 1000.0, "eeg")
+    data = np.random.default_rng(0).standard_normal((3, 1000)).astype(np.float32)
+    raw = RawArray(data.astype(np.float64), info)
+    fnames = [tmp_path / f"test{ii}_raw.fif" for ii in range(3)]
+    for fname in fnames:
+        raw.save(fname)
+    fid, tree, directory = fiff_open(fnames[0])
+    fid.close()
+    assert get_cache_info()["fiff_dir"]["size"] == 1
+    assert get_cache_info()["fiff_dir"]["nbytes"] > 0
+
+    # a cache hit does not parse the file again and returns independent nodes
+    def _fail(*args, **kwargs):
+        raise AssertionError("tag directory re-parsed")
+
+    with monkeypatch.context() as m:
+        m.setattr(fiff_open_mod, "make_dir_tree", _fail)
+        for preload in (False, True):
+            fid, tree_2, directory_2 = fiff_open(fnames[0], preload=preload)
+            fid.close()
+            assert [t.pos for t in directory_2] == [t.pos for t in directory]
+            assert tree_2 == tree
+        tree_2["block"] = -1
+        tree_2["children"][0]["directory"].clear()
+        fid, tree_2, _ = fiff_open(fnames[0])
+        fid.close()
+        assert tree_2 == tree
+        raw_read = read_raw_fif(fnames[0])
+    assert_array_equal(raw_read.get_data(), data)
+
+    # least recently used files are evicted, modified files are re-parsed
+    for fname in fnames[1:]:
+        fiff_open(fname)[0].close()
+    info = get_cache_info()["fiff_dir"]
+    assert info["size"] == 2
+    assert info["hits"] >= 3
+    assert str(fnames[0]) not in [key[0] for key in fiff_open_mod._dir_cache._entries]
+    raw.copy().crop(0, 0.5).save(fnames[1], overwrite=True)
+    assert_array_equal(read_raw_fif(fnames[1]).get_data(), data[:, :501])
+
+    # concurrent opening from threads
+    def _open(fname):
+        fid, _, directory = fiff_open(fname)
+        fid.close()
+        return [tag.pos for tag in directory]
+
+    want = [_open(fname) for fname in fnames]
+    clear_cache("fiff_dir")
+    with ThreadPoolExecutor(4) as pool:
+        got = list(pool.map(_open, fnames * 10))
+    assert got == want * 10
+    assert get_cache_info()["fiff_dir"]["size"] == 2
+
+    monkeypatch.setenv("MNE_FIFF_DIR_CACHE_SIZE", "0")
+    clear_cache("fiff_dir")
+    assert get_cache_info()["fiff_dir"]["size"] == 0
+    fiff_open(fnames[0])[0].close()
+    assert get_cache_info()["fiff_dir"]["size"] == 0
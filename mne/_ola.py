@@ -187,6 +187,24 @@ class _Interp2:
         assert used.all()
         assert self._position == original_position + n_pts
 
+    def _seek(self, position):
+        """Move to a position without feeding the points before it."""
+        self._position = position
+        self._use_interp = None
+        n_points = len(self.control_points)
+        if n_points == 1 or position < self.control_points[0]:
+            self._left_idx = 0
+            self._left = self._right = None
+            return
+        left_idx = np.searchsorted(self.control_points, position, "right") - 1
+        if left_idx < n_points - 1:
+            self._left_idx = left_idx
+            self._left = self.values(self.control_points[left_idx])
+            self._right = None
+        else:  # only the right zero-order hold is left
+            self._left_idx = n_points - 2
+            self._left = self._right = self.values(self.control_points[-1])
+
     def feed(self, n_pts):
         """Feed data and get interpolated values."""
         # Convenience function for assembly
@@ -331,6 +349,53 @@ class _COLA:
                 f"    The final {delta / sfreq} s will be lumped into the final window"
             )
 
+    def _get_window(self, idx):
+        """Get the window for a processing chunk, adjusted at the edges."""
+        this_window = self._window.copy()
+        if idx == len(self.starts) - 1:
+            this_len = self.stops[idx] - self.starts[idx]
+            this_window = np.pad(
+                self._window, (0, this_len - len(this_window)), "constant"
+            )
+            for offset in range(self._step, len(this_window), self._step):
+                n_use = len(this_window) - offset
+                this_window[offset:] += self._window[:n_use]
+        if idx == 0:
+            for offset in range(self._n_samples - self._step, 0, -self._step):
+                this_window[:offset] += self._window[-offset:]
+        return this_window
+
+    def _split(self, n_splits):
+        """Split the processing chunks into contiguous groups.
+
+        Each group can be processed independently with :func:`_cola_process`
+        once all of its data are available, and the outputs of all groups are
+        then stored with :meth:`_store_split`.
+        """
+        splits = list()
+        for idx in np.array_split(np.arange(len(self.starts)), n_splits):
+            if len(idx):
+                windows = [self._get_window(ii) for ii in idx]
+                splits.append((self.starts[idx], self.stops[idx], windows))
+        return splits
+
+    def _store_split(self, splits, outs):
+        """Overlap-add and store the outputs of the groups from :meth:`_split`."""
+        assert self._idx == 0 and self._in_buffers is None
+        assert len(splits) == len(outs)
+        tail = None
+        for si, these_outs in enumerate(outs):
+            if tail is not None:
+                for out, this_tail in zip(these_outs, tail):
+                    out[..., : this_tail.shape[-1]] += this_tail
+            if si < len(splits) - 1:
+                n_store = splits[si + 1][0][0] - splits[si][0][0]
+            else:
+                n_store = these_outs[0].shape[-1]
+            self._store(*[out[..., :n_store] for out in these_outs])
+            tail = [out[..., n_store:] for out in these_outs]
+        self._idx = len(self.starts)
+
     @property
     def _in_offset(self):
         """Compute from current processing window start and buffer len."""
@@ -384,17 +449,7 @@ class _COLA:
         while self._idx < len(self.starts) and self._in_offset >= self.stops[self._idx]:
             start, stop = self.starts[self._idx], self.stops[self._idx]
             this_len = stop - start
-            this_window = self._window.copy()
-            if self._idx == len(self.starts) - 1:
-                this_window = np.pad(
-                    self._window, (0, this_len - len(this_window)), "constant"
-                )
-                for offset in range(self._step, len(this_window), self._step):
-                    n_use = len(this_window) - offset
-                    this_window[offset:] += self._window[:n_use]
-            if self._idx == 0:
-                for offset in range(self._n_samples - self._step, 0, -self._step):
-                    this_window[:offset] += self._window[-offset:]
+            this_window = self._get_window(self._idx)
             this_proc = [in_[..., :this_len].copy() for in_ in self._in_buffers]
             logger.debug(
                 f"    * {self.name}[:] Processing {start}:{stop} "
@@ -433,6 +488,27 @@ class _COLA:
                 ob[..., -delta:] = 0.0
 
 
+def _cola_process(process, datas, starts, stops, windows, **kwargs):
+    """Process and overlap-add a group of chunks from :meth:`_COLA._split`.
+
+    The data must span ``starts[0]`` to ``stops[-1]``, and so do the outputs.
+    """
+    offset = starts[0]
+    outs_all = None
+    for start, stop, window in zip(starts, stops, windows):
+        this_proc = [data[..., start - offset : stop - offset].copy() for data in datas]
+        outs = process(*this_proc, start=start, stop=stop, **kwargs)
+        if outs_all is None:
+            outs_all = [
+                np.zeros(out.shape[:-1] + (stops[-1] - offset,), out.dtype)
+                for out in outs
+            ]
+        for out, out_all in zip(outs, outs_all):
+            out *= window
+            out_all[..., start - offset : stop - offset] += out
+    return outs_all
+
+
 def _check_cola(win, nperseg, step, window_name, tol=1e-10):
     """Check whether the Constant OverLap Add (COLA) constraint is met."""
     # adapted from SciPy
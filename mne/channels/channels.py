@@ -616,6 +616,7 @@ class UpdateChannelsMixin:
         if isinstance(self, BaseRaw):
             if self._projector is not None:
                 _check_preload(self, f"{msg} after calling .apply_proj()")
+            self._check_no_deferred(msg.capitalize())
         else:
             _check_preload(self, msg)
 
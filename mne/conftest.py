@@ -1133,6 +1133,8 @@ def numba_conditional(monkeypatch, request):
         monkeypatch.setattr(
             cluster_level, "_where_first", cluster_level._where_first_fallback
         )
+        monkeypatch.setattr(cluster_level, "_get_labels_st", None)
+        monkeypatch.setattr(cluster_level, "_tfce_add", None)
         monkeypatch.setattr(numerics, "_arange_div", numerics._arange_div_fallback)
     if request.param == "Numba" and not has_numba:
         pytest.skip("Numba not installed")
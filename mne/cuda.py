@@ -126,7 +126,9 @@ def _set_cuda_device(device_id, verbose=None):
 # Repeated FFT multiplication
 
 
-def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"):
+def _setup_cuda_fft_multiply_repeated(
+    n_jobs, h, n_fft, kind="FFT FIR filtering", *, h_fft=None
+):
     """Set up repeated CUDA FFT multiplication with a given filter.
 
     Parameters
@@ -140,6 +142,8 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
         The number of points in the FFT.
     kind : str
         The kind to report to the user.
+    h_fft : array | None
+        The precomputed FFT of ``h`` with ``n_fft`` points, if available.
 
     Returns
     -------
@@ -166,7 +170,9 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
     -----
     This function is designed to be used with fft_multiply_repeated().
     """
-    cuda_dict = dict(n_fft=n_fft, rfft=rfft, irfft=irfft, h_fft=rfft(h, n=n_fft))
+    if h_fft is None:
+        h_fft = rfft(h, n=n_fft)
+    cuda_dict = dict(n_fft=n_fft, rfft=rfft, irfft=irfft, h_fft=h_fft)
     if isinstance(n_jobs, str):
         _check_option("n_jobs", n_jobs, ("cuda",))
         n_jobs = 1
@@ -318,7 +324,8 @@ def _fft_resample(x, new_len, npads, to_removes, cuda_dict=None, pad="reflect_li
     Parameters
     ----------
     x : 1-d array
-        The array to resample. Will be converted to float64 if necessary.
+        The array to resample. Will be converted to float64 if necessary
+        (float32 is kept).
     new_len : int
         The size of the output array (before removing padding).
     npads : tuple of int
@@ -340,7 +347,7 @@ def _fft_resample(x, new_len, npads, to_removes, cuda_dict=None, pad="reflect_li
     """
     cuda_dict = dict(use_cuda=False) if cuda_dict is None else cuda_dict
     # add some padding at beginning and end to make this work a little cleaner
-    if x.dtype != np.float64:
+    if x.dtype not in (np.float64, np.float32):
         x = x.astype(np.float64)
     x = _smart_pad(x, npads, pad)
     old_len = len(x)
@@ -57,6 +57,7 @@ from ._fiff.write import (
 from .annotations import (
     EpochAnnotationsMixin,
     _read_annotations_fif,
+    _sync_onset,
     _write_annotations,
     events_from_annotations,
 )
@@ -87,6 +88,8 @@ from .utils import (
     _convert_times,
     _ensure_events,
     _gen_events,
+    _get_float_dtype,
+    _n_epochs_per_batch,
     _on_missing,
     _path_like,
     _pl,
@@ -930,21 +933,44 @@ class BaseEpochs(
                 ignore_chs=self.info["bads"],
             )
 
+    def _is_good_epochs(self, data):
+        """Determine which of several epochs are good.
+
+        Returns a list with, for each epoch, None if it is good or the tuple
+        of reasons to drop it.
+        """
+        if self.reject is None and self.flat is None:
+            return [None] * len(data)
+        if self._reject_time is not None:
+            data = data[..., self._reject_time]
+        return _is_good_batch(
+            data,
+            self.ch_names,
+            self._channel_type_idx,
+            self.reject,
+            self.flat,
+            ignore_chs=self.info["bads"],
+        )
+
     @verbose
     def _detrend_offset_decim(self, epoch, picks, verbose=None):
         """Aux Function: detrend, baseline correct, offset, decim.
 
+        Works on a single epoch or on an array of epochs.
+
         Note: operates inplace
         """
         if (epoch is None) or isinstance(epoch, str):
             return epoch
 
         # Detrend
-        if self.detrend is not None:
+        if self.detrend is not None and epoch.size:
             # We explicitly detrend just data channels (not EMG, ECG, EOG which
             # are processed by baseline correction)
             use_picks = _pick_data_channels(self.info, exclude=())
-            epoch[use_picks] = detrend(epoch[use_picks], self.detrend, axis=1)
+            epoch[..., use_picks, :] = detrend(
+                epoch[..., use_picks, :], self.detrend, axis=-1
+            )
 
         # Baseline correct
         if self._do_baseline:
@@ -958,7 +984,7 @@ class BaseEpochs(
             )
 
         # Decimate if necessary (i.e., epoch not preloaded)
-        epoch = epoch[:, self._decim_slice]
+        epoch = epoch[..., self._decim_slice]
 
         # handle offset
         if self._offset is not None:
@@ -1609,15 +1635,71 @@ class BaseEpochs(
         """Get a given epoch from disk."""
         raise NotImplementedError
 
+    def _get_epochs_from_raw(self, idxs):
+        """Get several epochs from disk.
+
+        Returns
+        -------
+        data : array, shape (n_read, n_channels, n_times)
+            The epochs that could be read, in order.
+        reasons : list of str | None
+            For each requested epoch, None if it is in ``data``, else the
+            reason why it could not be read.
+        """
+        data, reasons = list(), list()
+        for idx in idxs:
+            epoch = self._get_epoch_from_raw(idx)
+            if epoch is None:
+                reasons.append("NO_DATA")
+            elif isinstance(epoch, str):
+                reasons.append(epoch)
+            elif epoch.shape[1] < len(self._raw_times):
+                reasons.append("TOO_SHORT")
+            else:
+                data.append(epoch)
+                reasons.append(None)
+        if len(data):
+            data = np.array(data)
+        else:
+            data = np.empty((0, len(self.ch_names), len(self._raw_times)))
+        return data, reasons
+
+    def _iter_epochs_from_raw(self, use_idx, reject=True):
+        """Load, process and reject epochs from disk in batches.
+
+        Yields the epoch indices of each batch, the good epochs of the batch
+        as a single array (unprojected in delayed SSP mode), and for each
+        epoch None if it is good or the tuple of reasons to drop it.
+        """
+        n_batch = _n_epochs_per_batch(8 * len(self.ch_names) * len(self._raw_times))
+        for b_start in range(0, len(use_idx), n_batch):
+            idxs = use_idx[b_start : b_start + n_batch]
+            epochs_noproj, reasons = self._get_epochs_from_raw(idxs)
+            epochs_noproj = self._detrend_offset_decim(
+                epochs_noproj, self._detrend_picks
+            )
+            epochs = self._project_epoch(epochs_noproj)
+            epochs_out = epochs_noproj if self._do_delayed_proj else epochs
+            bad_tuples = [None if reason is None else (reason,) for reason in reasons]
+            if reject:
+                epoch_bads = self._is_good_epochs(epochs)
+                read = [ii for ii, reason in enumerate(reasons) if reason is None]
+                for ii, bad_tuple in zip(read, epoch_bads):
+                    bad_tuples[ii] = bad_tuple
+                keep = [bad_tuple is None for bad_tuple in epoch_bads]
+                if not all(keep):
+                    epochs_out = epochs_out[np.array(keep, bool)]
+            yield idxs, epochs_out, bad_tuples
+
     def _project_epoch(self, epoch):
-        """Process a raw epoch based on the delayed param."""
+        """Process a raw epoch (or array of epochs) based on the delayed param."""
         # whenever requested, the first epoch is being projected.
         if (epoch is None) or isinstance(epoch, str):
             # can happen if t < 0 or reject based on annotations
             return epoch
         proj = self._do_delayed_proj or self.proj
         if self._projector is not None and proj is True:
-            epoch = np.dot(self._projector, epoch)
+            epoch = np.matmul(self._projector, epoch)
         return epoch
 
     def _handle_empty(self, on_empty, meth):
@@ -1744,21 +1826,22 @@ class BaseEpochs(
                 )
 
             # we need to load from disk, drop, and return data
-            detrend_picks = self._detrend_picks
-            for ii, idx in enumerate(use_idx):
+            n_out = 0
+            for idxs, epochs_out, bad_tuples in self._iter_epochs_from_raw(
+                use_idx, reject=False
+            ):
+                if any(bad_tuple is not None for bad_tuple in bad_tuples):
+                    raise RuntimeError(
+                        f"Could not read epochs {list(idxs)}: {bad_tuples}"
+                    )
                 # faster to pre-allocate memory here
-                epoch_noproj = self._get_epoch_from_raw(idx)
-                epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
-                if self._do_delayed_proj:
-                    epoch_out = epoch_noproj
-                else:
-                    epoch_out = self._project_epoch(epoch_noproj)
-                if ii == 0:
+                if n_out == 0:
                     data = np.empty(
                         (n_events, len(self.ch_names), len(self.times)),
-                        dtype=epoch_out.dtype,
+                        dtype=epochs_out.dtype,
                     )
-                data[ii] = epoch_out
+                data[n_out : n_out + len(epochs_out)] = epochs_out
+                n_out += len(epochs_out)
         else:
             # bads need to be dropped, this might occur after a preload
             # e.g., when calling drop_bad w/new params
@@ -1766,43 +1849,36 @@ class BaseEpochs(
             n_out = 0
             drop_log = list(self.drop_log)
             assert n_events == len(self.selection)
-            if not self.preload:
-                detrend_picks = self._detrend_picks
-            for idx, sel in enumerate(self.selection):
-                if self.preload:  # from memory
-                    if self._do_delayed_proj:
-                        epoch_noproj = self._data[idx]
-                        epoch = self._project_epoch(epoch_noproj)
-                    else:
-                        epoch_noproj = None
-                        epoch = self._data[idx]
-                else:  # from disk
-                    epoch_noproj = self._get_epoch_from_raw(idx)
-                    epoch_noproj = self._detrend_offset_decim(
-                        epoch_noproj, detrend_picks
-                    )
-                    epoch = self._project_epoch(epoch_noproj)
-
-                epoch_out = epoch_noproj if self._do_delayed_proj else epoch
-                is_good, bad_tuple = self._is_good_epoch(epoch, verbose=verbose)
-                if not is_good:
+            if self.preload:  # from memory
+                batches = self._iter_epochs_from_data()
+            else:  # from disk
+                batches = self._iter_epochs_from_raw(np.arange(n_events))
+            for idxs, epochs_out, bad_tuples in batches:
+                good_idx.extend(
+                    idx for idx, bad_tuple in zip(idxs, bad_tuples) if bad_tuple is None
+                )
+                for idx, bad_tuple in zip(idxs, bad_tuples):
+                    if bad_tuple is None:
+                        continue
                     assert isinstance(bad_tuple, tuple)
                     assert all(isinstance(x, str) for x in bad_tuple)
+                    sel = self.selection[idx]
                     drop_log[sel] = drop_log[sel] + bad_tuple
-                    continue
-                good_idx.append(idx)
 
-                # store the epoch if there is a reason to (output or update)
-                if out or self.preload:
+                # store the epochs if there is a reason to (output or update)
+                if (out or self.preload) and len(epochs_out):
                     # faster to pre-allocate, then trim as necessary
                     if n_out == 0 and not self.preload:
                         data = np.empty(
-                            (n_events, epoch_out.shape[0], epoch_out.shape[1]),
-                            dtype=epoch_out.dtype,
+                            (n_events,) + epochs_out.shape[1:],
+                            dtype=epochs_out.dtype,
                             order="C",
                         )
-                    data[n_out] = epoch_out
-                    n_out += 1
+                    # preloaded epochs that are all kept are already in place
+                    in_place = n_out == idxs[0] and len(epochs_out) == len(idxs)
+                    if not (self.preload and in_place):
+                        data[n_out : n_out + len(epochs_out)] = epochs_out
+                    n_out += len(epochs_out)
             self.drop_log = tuple(drop_log)
             del drop_log
 
@@ -1846,6 +1922,26 @@ class BaseEpochs(
             copy=copy,
         )
 
+    def _iter_epochs_from_data(self):
+        """Reject preloaded epochs in batches.
+
+        Yields the same as :meth:`_iter_epochs_from_raw`.
+        """
+        n_batch = _n_epochs_per_batch(
+            self._data.itemsize * np.prod(self._data.shape[1:])
+        )
+        for b_start in range(0, len(self._data), n_batch):
+            epochs_out = self._data[b_start : b_start + n_batch]
+            idxs = np.arange(b_start, b_start + len(epochs_out))
+            epochs = epochs_out
+            if self._do_delayed_proj:
+                epochs = self._project_epoch(epochs_out)
+            bad_tuples = self._is_good_epochs(epochs)
+            keep = np.array([bad_tuple is None for bad_tuple in bad_tuples], bool)
+            if not keep.all():
+                epochs_out = epochs_out[keep]
+            yield idxs, epochs_out, bad_tuples
+
     def _data_sel_copy_scale(
         self, data, *, select, orig_picks, picks, ch_factors, start, stop, copy
     ):
@@ -3702,6 +3798,72 @@ class Epochs(BaseEpochs):
         )
         return data
 
+    def _get_epochs_from_raw(self, idxs):
+        """Load several epochs from disk.
+
+        Epochs whose time windows overlap or nearly touch are read with a
+        single call to the Raw object and then extracted by indexing.
+        """
+        if self._raw is None:
+            # This should never happen, as raw=None only if preload=True
+            raise ValueError(
+                "An error has occurred, no valid raw file found. "
+                "Please report this to the mne-python "
+                "developers."
+            )
+        raw = self._raw
+        sfreq = raw.info["sfreq"]
+        n_times = len(self._raw_times)
+        event_samps = self.events[idxs, 0]
+        starts = np.round(event_samps + self._raw_times[0] * sfreq).astype(np.int64)
+        starts -= raw.first_samp
+        stops = starts + n_times
+        reasons = np.full(len(starts), None, object)
+        reasons[stops > raw.n_times] = "TOO_SHORT"
+        if self.reject_by_annotation and len(raw.annotations) > 0:
+            reject_tmin = self.reject_tmin
+            if reject_tmin is None:
+                reject_tmin = self._raw_times[0]
+            reject_starts = np.round(event_samps + reject_tmin * sfreq).astype(np.int64)
+            reject_starts -= raw.first_samp
+            reject_tmax = self.reject_tmax
+            if reject_tmax is None:
+                reject_tmax = self._raw_times[-1]
+            diff = int(round((self._raw_times[-1] - reject_tmax) * sfreq))
+            reject_stops = stops - diff
+            annot = raw.annotations
+            is_bad = np.array([d.lower().startswith("bad") for d in annot.description])
+            onset = _sync_onset(raw, annot.onset)[is_bad]
+            offset = onset + annot.duration[is_bad]
+            overlaps = (onset < reject_stops[:, np.newaxis] / sfreq) & (
+                offset > reject_starts[:, np.newaxis] / sfreq
+            )
+            descriptions = annot.description[is_bad]
+            for ii in np.where(overlaps.any(axis=1))[0]:
+                reasons[ii] = str(descriptions[np.argmax(overlaps[ii])])
+        reasons[starts < 0] = "NO_DATA"
+        use = np.array([reason is None for reason in reasons], bool)
+        use_starts, use_stops = starts[use], stops[use]
+        # group the windows that overlap or nearly touch, in time order
+        order = np.argsort(use_starts, kind="stable")
+        groups = np.split(
+            order, np.where(np.diff(use_starts[order]) > 2 * n_times)[0] + 1
+        )
+        data = None
+        for group in groups:
+            if not len(group):
+                continue
+            g_start, g_stop = use_starts[group].min(), use_stops[group].max()
+            logger.debug(f"    Getting {len(group)} epochs for {g_start}-{g_stop}")
+            segment = raw._getitem((self.picks, slice(g_start, g_stop)), False)
+            if data is None:
+                data = np.empty((use.sum(), len(segment), n_times), segment.dtype)
+            take = (use_starts[group] - g_start)[:, np.newaxis] + np.arange(n_times)
+            data[group] = segment[:, take].swapaxes(0, 1)
+        if data is None:
+            data = np.empty((0, len(self.ch_names), n_times))
+        return data, list(reasons)
+
 
 @fill_doc
 class EpochsArray(BaseEpochs):
@@ -3781,7 +3943,9 @@ class EpochsArray(BaseEpochs):
         raw_sfreq=None,
         verbose=None,
     ):
-        dtype = np.complex128 if np.any(np.iscomplex(data)) else np.float64
+        dtype = _get_float_dtype(
+            np.complex128 if np.any(np.iscomplex(data)) else np.float64
+        )
         data = np.asanyarray(data, dtype=dtype)
         if data.ndim != 3:
             raise ValueError(
@@ -4073,6 +4237,57 @@ def _is_good(
             return False, bad_tuple
 
 
+def _is_good_batch(data, ch_names, channel_type_idx, reject, flat, ignore_chs=()):
+    """Test which epochs are good, like _is_good with full_report=True.
+
+    Peak-to-peak amplitudes are computed for all epochs at once. Returns a
+    list with, for each epoch, None if it is good or the tuple of offending
+    channel names (or reasons for function criteria).
+    """
+    refls = [refl for refl in (reject, flat) if refl is not None]
+    if any(callable(criterion) for refl in refls for criterion in refl.values()):
+        bad_tuples = list()
+        for epoch in data:
+            _, bad_tuple = _is_good(
+                epoch,
+                ch_names,
+                channel_type_idx,
+                reject,
+                flat,
+                full_report=True,
+                ignore_chs=ignore_chs,
+            )
+            bad_tuples.append(bad_tuple)
+        return bad_tuples
+
+    checkable = np.array([c not in ignore_chs for c in ch_names], dtype=bool)
+    checks = list()
+    any_bad = np.zeros(len(data), bool)
+    for refl, f, t in zip([reject, flat], [np.greater, np.less], ["", "flat"]):
+        if refl is None:
+            continue
+        for key, criterion in refl.items():
+            idx = np.array(channel_type_idx[key], int)
+            if len(idx) == 0:
+                continue
+            e_idx = data[:, idx]
+            deltas = np.max(e_idx, axis=-1) - np.min(e_idx, axis=-1)
+            bad = np.logical_and(f(deltas, criterion), checkable[idx])
+            any_bad |= bad.any(axis=1)
+            checks.append((t, key.upper(), idx, bad))
+
+    bad_tuples = [None] * len(data)
+    for ii in np.where(any_bad)[0]:
+        bad_tuple = tuple()
+        for t, name, idx, bad in checks:
+            bad_names = [ch_names[ci] for ci in idx[bad[ii]]]
+            if len(bad_names) and not len(bad_tuple):
+                logger.info(f"    Rejecting {t} epoch based on {name} : {bad_names}")
+            bad_tuple += tuple(bad_names)
+        bad_tuples[ii] = bad_tuple
+    return bad_tuples
+
+
 def _read_one_epoch_file(f, tree, preload):
     """Read a single FIF file."""
     with f as fid:
@@ -4509,9 +4724,9 @@ class EpochsFIF(BaseEpochs):
         data = np.frombuffer(raw.fid.read(size), read_fmt)
         if read_fmt != fmt:
             data = data.view(fmt)
-            data = data.astype(np.complex128)
+            data = data.astype(_get_float_dtype(np.complex128))
         else:
-            data = data.astype(np.float64)
+            data = data.astype(_get_float_dtype(np.float64))
 
         data = _reshape_view(data, raw.epoch_shape)
         data *= raw.cals
@@ -54,6 +54,7 @@ from .utils import (
     _check_preload,
     _check_time_format,
     _convert_times,
+    _get_float_dtype,
     _scale_dataframe_data,
     _validate_type,
     check_fname,
@@ -1512,7 +1513,7 @@ class EvokedArray(Evoked):
         *,
         verbose=None,
     ):
-        dtype = np.complex128 if np.iscomplexobj(data) else np.float64
+        dtype = _get_float_dtype(np.complex128 if np.iscomplexobj(data) else np.float64)
         data = np.asanyarray(data, dtype=dtype)
 
         if data.ndim != 2:
@@ -1979,9 +1980,9 @@ def _read_evoked(fname, condition=None, kind="average", allow_maxshield=False):
             # Put the old style epochs together
             data = np.concatenate([e.data[None, :] for e in epoch], axis=0)
         if np.isrealobj(data):
-            data = data.astype(np.float64)
+            data = data.astype(_get_float_dtype(np.float64))
         else:
-            data = data.astype(np.complex128)
+            data = data.astype(_get_float_dtype(np.complex128))
 
         if first_time is not None and nsamp is not None:
             times = first_time + np.arange(nsamp) / info["sfreq"]
@@ -14,7 +14,7 @@ from scipy import fft, signal
 from scipy.stats import f as fstat
 
 from ._fiff.pick import _picks_to_idx
-from ._ola import _COLA
+from ._ola import _COLA, _Storer
 from .cuda import (
     _fft_multiply_repeated,
     _fft_resample,
@@ -25,9 +25,11 @@ from .cuda import (
 from .fixes import _reshape_view, minimum_phase
 from .parallel import parallel_func
 from .utils import (
+    _ArrayCache,
     _check_option,
     _check_preload,
     _ensure_int,
+    _get_float_dtype,
     _pl,
     _validate_type,
     logger,
@@ -39,6 +41,24 @@ from .utils import (
 # These values from Ifeachor and Jervis.
 _length_factors = dict(hann=3.1, hamming=3.3, blackman=5.0)
 
+# Designed filters and filter FFTs, keyed by their design parameters
+_filter_cache = _ArrayCache("filter", "MNE_FILTER_CACHE_SIZE", "64M")
+
+# Minimum duration of the blocks used when filtering non-preloaded raw data
+_STREAM_BLOCK_SEC = 10.0
+
+# Maximum duration of these blocks, which are otherwise made long compared to the
+# context read on either side of them (e.g., the decay of slow IIR filters)
+_STREAM_MAX_BLOCK_SEC = 60.0
+
+# Approximate size of the tapered spectra of each block of channels processed
+# at once by method="spectrum_fit"
+_MT_SPECTRUM_BLOCK_BYTES = 2**26
+
+# Approximate size of the blocks of the sinusoids fitted by method="spectrum_fit"
+# (bases that fit in a single block are cached)
+_LINE_BASIS_BLOCK_BYTES = 2**24
+
 
 def next_fast_len(target):
     """Find the next fast size of input data to `fft`, for zero-padding, etc.
@@ -300,6 +320,8 @@ def _overlap_add_filter(
 
     if phase == "zero-double":
         h = np.convolve(h, h[::-1])
+    # filter single-precision data in single precision
+    h = h.astype(np.result_type(x.dtype, np.float32), copy=False)
 
     # Determine FFT length to use
     min_fft = 2 * len(h) - 1
@@ -332,27 +354,40 @@ def _overlap_add_filter(
         )
 
     # Figure out if we should use CUDA
-    n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft)
+    h_fft = _filter_cache.get(("rfft", h, n_fft), fft.rfft, h, n=n_fft)
+    n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, h_fft=h_fft)
 
-    # Process each row separately
+    # Process each row separately, in one block of rows per job. The FFTs
+    # release the GIL, so threads avoid pickling the data for each job
     picks = _picks_to_idx(len(x), picks)
-    parallel, p_fun, _ = parallel_func(_1d_overlap_filter, n_jobs)
+    parallel, p_fun, n_jobs = parallel_func(
+        _overlap_filter_block, n_jobs, prefer="threads"
+    )
     if n_jobs == 1:
         for p in picks:
             x[p] = _1d_overlap_filter(
                 x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft
             )
     else:
+        blocks = [block for block in np.array_split(picks, n_jobs) if len(block)]
         data_new = parallel(
-            p_fun(x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft) for p in picks
+            p_fun(x[block], len(h), n_edge, phase, cuda_dict, pad, n_fft)
+            for block in blocks
         )
-        for pp, p in enumerate(picks):
-            x[p] = data_new[pp]
+        for block, block_new in zip(blocks, data_new):
+            x[block] = block_new
 
     x = _reshape_view(x, orig_shape)
     return x
 
 
+def _overlap_filter_block(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
+    """Do overlap-add FFT FIR filtering of each row of x in place."""
+    for ii in range(len(x)):
+        x[ii] = _1d_overlap_filter(x[ii], n_h, n_edge, phase, cuda_dict, pad, n_fft)
+    return x
+
+
 def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
     """Do one-dimensional overlap-add FFT FIR filtering."""
     # pad to reduce ringing
@@ -370,7 +405,7 @@ def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
         start = seg_idx * n_seg
         stop = (seg_idx + 1) * n_seg
         seg = x_ext[start:stop]
-        seg = np.concatenate([seg, np.zeros(n_fft - len(seg))])
+        seg = np.concatenate([seg, np.zeros(n_fft - len(seg), x_ext.dtype)])
 
         prod = _fft_multiply_repeated(seg, cuda_dict)
 
@@ -462,6 +497,25 @@ def _firwin_design(N, freq, gain, window, sfreq):
     return h
 
 
+def _design_fir(sfreq, freq, gain, N, phase, fir_window, fir_design):
+    """Design a FIR filter of length N from normalized gain control points."""
+    if fir_design == "firwin2":
+        fir_design = signal.firwin2
+    else:
+        assert fir_design == "firwin"
+        fir_design = partial(_firwin_design, sfreq=sfreq)
+    # construct symmetric (linear phase) filter
+    if phase == "minimum-half":
+        h = fir_design(N * 2 - 1, freq, gain, window=fir_window)
+        h = minimum_phase(h)
+    else:
+        h = fir_design(N, freq, gain, window=fir_window)
+        if phase == "minimum":
+            h = minimum_phase(h, half=False)
+    assert h.size == N
+    return h
+
+
 def _construct_fir_filter(
     sfreq, freq, gain, filter_length, phase, fir_window, fir_design
 ):
@@ -474,11 +528,6 @@ def _construct_fir_filter(
     If x is multi-dimensional, this operates along the last dimension.
     """
     assert freq[0] == 0
-    if fir_design == "firwin2":
-        fir_design = signal.firwin2
-    else:
-        assert fir_design == "firwin"
-        fir_design = partial(_firwin_design, sfreq=sfreq)
     # issue a warning if attenuation is less than this
     min_att_db = 12 if phase == "minimum-half" else 20
 
@@ -492,15 +541,10 @@ def _construct_fir_filter(
 
     # Use overlap-add filter with a fixed length
     N = _check_zero_phase_length(filter_length, phase, gain[-1])
-    # construct symmetric (linear phase) filter
-    if phase == "minimum-half":
-        h = fir_design(N * 2 - 1, freq, gain, window=fir_window)
-        h = minimum_phase(h)
-    else:
-        h = fir_design(N, freq, gain, window=fir_window)
-        if phase == "minimum":
-            h = minimum_phase(h, half=False)
-    assert h.size == N
+    key = ("fir", sfreq, freq, gain, N, phase, fir_window, fir_design)
+    h = _filter_cache.get(
+        key, _design_fir, sfreq, freq, gain, N, phase, fir_window, fir_design
+    ).copy()
     att_db, att_freq = _filter_attenuation(h, freq, gain)
     if phase == "zero-double":
         att_db += 6
@@ -581,6 +625,142 @@ def _iir_filter(x, iir_params, picks, n_jobs, copy, phase="zero"):
     return x
 
 
+def _filter_raw_stream(
+    raw, data, onsets, ends, filt, *, method, phase, picks, n_jobs, pad
+):
+    """Filter non-preloaded raw data block by block into ``data``.
+
+    Blocks are read with ``raw._read_segment`` together with enough context on
+    either side that the retained part does not see the block boundaries, so
+    the result matches filtering the preloaded data. Causal IIR filters instead
+    carry their state from one block to the next. Samples outside the
+    ``onsets``/``ends`` segments are copied unfiltered.
+    """
+    stateful = method == "iir" and phase == "forward"
+    if stateful:
+        n_ctx = 0
+        if "sos" in filt:
+            _check_coefficients(filt["sos"])
+        else:
+            _check_coefficients((filt["b"], filt["a"]))
+    else:
+        fun = _filter_block_fun(filt, method, phase, picks, n_jobs, pad)
+        n_ctx = _filter_context_len(filt, method, phase)
+    n_block = _stream_block_len(raw.info["sfreq"], n_ctx)
+    logger.info(
+        f"Streaming the filter over blocks of {n_block} samples "
+        f"({n_block / raw.info['sfreq']:0.3f} s)"
+    )
+    if n_ctx > n_block:
+        warn(
+            f"The filter needs {n_ctx} samples ({n_ctx / raw.info['sfreq']:0.1f} s) "
+            "of context on either side of each block, which is longer than the "
+            f"blocks themselves ({n_block} samples), so streaming reads each sample "
+            f"about {(n_block + 2 * n_ctx) / n_block:0.0f} times and uses memory "
+            "proportional to the context. Consider a filter with a shorter impulse "
+            "response (e.g., a higher l_freq or a lower IIR order)."
+        )
+    for start, stop, do_filter in _filter_spans(onsets, ends, raw.n_times):
+        zi = None
+        for b_start in range(start, stop, n_block):
+            b_stop = min(b_start + n_block, stop)
+            if not do_filter:
+                raw._read_segment(b_start, b_stop, data_buffer=data[:, b_start:b_stop])
+                continue
+            if stateful:
+                block = raw._read_segment(b_start, b_stop)
+                block[picks], zi = _iir_filter_step(block[picks], filt, zi)
+            else:
+                w_start = max(start, b_start - n_ctx)
+                w_stop = min(stop, b_stop + n_ctx)
+                block = raw._read_segment(w_start, w_stop)
+                fun(block)
+                block = block[:, b_start - w_start : b_stop - w_start]
+            data[:, b_start:b_stop] = block
+    return data
+
+
+def _stream_block_len(sfreq, n_ctx):
+    """Get the number of samples to process at once when streaming."""
+    n_block = max(int(np.ceil(_STREAM_BLOCK_SEC * sfreq)), 4 * n_ctx)
+    return min(n_block, max(int(np.ceil(_STREAM_MAX_BLOCK_SEC * sfreq)), 1))
+
+
+def _filter_spans(onsets, ends, n_times):
+    """Split samples into spans that are filtered or left untouched."""
+    spans = list()
+    last = 0
+    for start, stop in zip(onsets, ends):
+        if start > last:
+            spans.append((last, start, False))
+        if stop > start:
+            spans.append((start, stop, True))
+        last = max(last, stop)
+    if last < n_times:
+        spans.append((last, n_times, False))
+    return spans
+
+
+def _filter_block_fun(filt, method, phase, picks, n_jobs, pad):
+    """Get a function that filters a 2D block of data in place."""
+    if method == "fir":
+        return partial(
+            _overlap_add_filter,
+            h=filt,
+            n_fft=None,
+            phase=phase,
+            picks=picks,
+            n_jobs=n_jobs,
+            copy=False,
+            pad=pad,
+        )
+    return partial(
+        _iir_filter,
+        iir_params=filt,
+        picks=picks,
+        n_jobs=n_jobs,
+        copy=False,
+        phase=phase,
+    )
+
+
+def _filter_context_len(filt, method, phase):
+    """Get the number of samples a filtered sample depends on to either side."""
+    if method == "fir":
+        return len(filt) * (2 if phase == "zero-double" else 1)
+    return _iir_tail_len(filt)
+
+
+def _iir_tail_len(iir_params, rtol=1e-10, max_len=2**24):
+    """Get the length after which the IIR impulse response is negligible."""
+    n = max(int(iir_params["padlen"]), 1000)
+    while True:
+        x = np.zeros(n)
+        x[0] = 1.0
+        if "sos" in iir_params:
+            h = signal.sosfilt(iir_params["sos"], x)
+        else:
+            h = signal.lfilter(iir_params["b"], iir_params["a"], x)
+        tail = np.cumsum(np.abs(h)[::-1])[::-1]
+        idx = np.nonzero(tail < rtol * tail[0])[0]
+        if len(idx) or n >= max_len:
+            return int(idx[0]) if len(idx) else n
+        n *= 2
+
+
+def _iir_filter_step(x, iir_params, zi):
+    """Apply a causal IIR filter to one block, carrying the filter state."""
+    if "sos" in iir_params:
+        sos = iir_params["sos"]
+        if zi is None:
+            zi = np.zeros((len(sos), len(x), 2))
+        return signal.sosfilt(sos, x, axis=-1, zi=zi)
+    b, a = iir_params["b"], iir_params["a"]
+    if zi is None:
+        zi = np.zeros((len(x), max(len(a), len(b)) - 1))
+    return signal.lfilter(b, a, x, axis=-1, zi=zi)
+
+
 def estimate_ringing_samples(system, max_try=100000):
     """Estimate filter ringing.
 
@@ -847,7 +1027,9 @@ def construct_iir_filter(
             for key in ("rp", "rs"):
                 if key in iir_params:
                     kwargs[key] = iir_params[key]
-            system = signal.iirfilter(**kwargs)
+            system = deepcopy(
+                _filter_cache.get(("iirfilter", kwargs), signal.iirfilter, **kwargs)
+            )
             if phase in ("zero", "zero-double"):
                 ptype, pmul = "(effective, after forward-backward)", 2
             else:
@@ -862,13 +1044,15 @@ def construct_iir_filter(
                 raise ValueError(
                     "iir_params must have at least 'gstop' and 'gpass' (or N) entries."
                 )
-            system = signal.iirdesign(
-                Wp,
-                Ws,
-                iir_params["gpass"],
-                iir_params["gstop"],
-                ftype=ftype,
-                output=output,
+            args = (Wp, Ws, iir_params["gpass"], iir_params["gstop"])
+            kwargs = dict(ftype=ftype, output=output)
+            system = deepcopy(
+                _filter_cache.get(
+                    ("iirdesign", args, kwargs),
+                    signal.iirdesign,
+                    *args,
+                    **kwargs,
+                )
             )
 
     if system is None:
@@ -890,7 +1074,9 @@ def construct_iir_filter(
         logger.info(f"- Cutoff{_pl(f_pass)} at {edge_freqs} Hz: {cutoffs} dB")
     # now deal with padding
     if "padlen" not in iir_params:
-        padlen = estimate_ringing_samples(system)
+        padlen = _filter_cache.get(
+            ("ringing", system), estimate_ringing_samples, system
+        )
     else:
         padlen = iir_params["padlen"]
 
@@ -1525,32 +1711,11 @@ def notch_filter(
     """
     x = _check_filterable(x, "notch filtered", "notch_filter")
     iir_params, method = _check_method(method, iir_params, ["spectrum_fit"])
-
-    if freqs is not None:
-        freqs = np.atleast_1d(freqs)
-    elif method != "spectrum_fit":
-        raise ValueError("freqs=None can only be used with method spectrum_fit")
-
-    # Only have to deal with notch_widths for non-autodetect
-    if freqs is not None:
-        if notch_widths is None:
-            notch_widths = freqs / 200.0
-        elif np.any(notch_widths < 0):
-            raise ValueError("notch_widths must be >= 0")
-        else:
-            notch_widths = np.atleast_1d(notch_widths)
-            if len(notch_widths) == 1:
-                notch_widths = notch_widths[0] * np.ones_like(freqs)
-            elif len(notch_widths) != len(freqs):
-                raise ValueError(
-                    "notch_widths must be None, scalar, or the same length as freqs"
-                )
+    freqs, notch_widths = _check_notch_params(freqs, notch_widths, method)
 
     if method in ("fir", "iir"):
         # Speed this up by computing the fourier coefficients once
-        tb_2 = trans_bandwidth / 2.0
-        lows = [freq - nw / 2.0 - tb_2 for freq, nw in zip(freqs, notch_widths)]
-        highs = [freq + nw / 2.0 + tb_2 for freq, nw in zip(freqs, notch_widths)]
+        lows, highs, tb_2 = _notch_stop_bands(freqs, notch_widths, trans_bandwidth)
         xf = filter_data(
             x,
             Fs,
@@ -1586,6 +1751,38 @@ def notch_filter(
     return xf
 
 
+def _check_notch_params(freqs, notch_widths, method):
+    """Check notch frequencies and widths."""
+    if freqs is not None:
+        freqs = np.atleast_1d(freqs)
+    elif method != "spectrum_fit":
+        raise ValueError("freqs=None can only be used with method spectrum_fit")
+
+    # Only have to deal with notch_widths for non-autodetect
+    if freqs is not None:
+        if notch_widths is None:
+            notch_widths = freqs / 200.0
+        elif np.any(notch_widths < 0):
+            raise ValueError("notch_widths must be >= 0")
+        else:
+            notch_widths = np.atleast_1d(notch_widths)
+            if len(notch_widths) == 1:
+                notch_widths = notch_widths[0] * np.ones_like(freqs)
+            elif len(notch_widths) != len(freqs):
+                raise ValueError(
+                    "notch_widths must be None, scalar, or the same length as freqs"
+                )
+    return freqs, notch_widths
+
+
+def _notch_stop_bands(freqs, notch_widths, trans_bandwidth):
+    """Get the band-stop edges used for FIR and IIR notch filtering."""
+    tb_2 = trans_bandwidth / 2.0
+    lows = [freq - nw / 2.0 - tb_2 for freq, nw in zip(freqs, notch_widths)]
+    highs = [freq + nw / 2.0 + tb_2 for freq, nw in zip(freqs, notch_widths)]
+    return lows, highs, tb_2
+
+
 def _get_window_thresh(n_times, sfreq, mt_bandwidth, p_value):
     from .time_frequency.multitaper import _compute_mt_params
 
@@ -1614,39 +1811,96 @@ def _mt_spectrum_proc(
     """Call _mt_spectrum_remove."""
     # set up array for filtering, reshape to 2D, operate on last axis
     x, orig_shape, picks = _prep_for_filtering(x, copy, picks)
+    if len(picks):
+        cola, freq_list = _mt_spectrum_cola(
+            x,
+            sfreq,
+            line_freqs,
+            notch_widths,
+            mt_bandwidth,
+            p_value,
+            picks,
+            n_jobs,
+            filter_length,
+        )
+        # the windows are stored back into x once all their samples were fed
+        for start in range(0, x.shape[-1], cola._n_samples):
+            cola.feed(x[picks, start : start + cola._n_samples])
+        _log_notch_freqs(freq_list, line_freqs)
+    x = _reshape_view(x, orig_shape)
+    return x
+
+
+def _mt_spectrum_cola(
+    x,
+    sfreq,
+    line_freqs,
+    notch_widths,
+    mt_bandwidth,
+    p_value,
+    picks,
+    n_jobs,
+    filter_length,
+):
+    """Set up the removal of line noise from overlapping windows of data.
+
+    The picked channels are processed together, in blocks of channels that
+    are distributed across threads, and the results are stored into ``x``.
+    Also returns the list that gathers the frequencies removed from each
+    channel and window.
+    """
+    n_times = x.shape[-1]
     if isinstance(filter_length, str) and filter_length == "auto":
         filter_length = "10s"
     if filter_length is None:
-        filter_length = x.shape[-1]
-    filter_length = min(_to_samples(filter_length, sfreq, "", ""), x.shape[-1])
+        filter_length = n_times
+    filter_length = min(_to_samples(filter_length, sfreq, "", ""), n_times)
     get_wt = partial(
         _get_window_thresh, sfreq=sfreq, mt_bandwidth=mt_bandwidth, p_value=p_value
     )
     window_fun, threshold = get_wt(filter_length)
-    parallel, p_fun, n_jobs = parallel_func(_mt_spectrum_remove_win, n_jobs)
-    if n_jobs == 1:
-        freq_list = list()
-        for ii, x_ in enumerate(x):
-            if ii in picks:
-                x[ii], f = _mt_spectrum_remove_win(
-                    x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt
-                )
-                freq_list.append(f)
-    else:
-        data_new = parallel(
-            p_fun(x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt)
-            for xi, x_ in enumerate(x)
-            if xi in picks
+    parallel, p_fun, n_jobs = parallel_func(
+        _mt_spectrum_remove, n_jobs, prefer="threads"
+    )
+    # bound the size of the tapered spectra, and use all jobs
+    n_block = max(_MT_SPECTRUM_BLOCK_BYTES // (8 * window_fun.size), 1)
+    n_block = min(n_block, max(-(-len(picks) // n_jobs), 1))
+    freq_list = list()
+
+    def process(x_, *, start, stop):
+        outs = parallel(
+            p_fun(
+                x_[b_start : b_start + n_block],
+                sfreq,
+                line_freqs,
+                notch_widths,
+                window_fun,
+                threshold,
+                get_wt,
+            )
+            for b_start in range(0, len(x_), n_block)
         )
-        freq_list = [d[1] for d in data_new]
-        data_new = np.array([d[0] for d in data_new])
-        x[picks, :] = data_new
+        for out in outs:
+            freq_list.extend(out[1])
+        return (np.concatenate([out[0] for out in outs]),)  # must return a tuple
+
+    n_overlap = (filter_length + 1) // 2
+    cola = _COLA(
+        process,
+        _Storer(x, picks=picks),
+        n_times,
+        filter_length,
+        n_overlap,
+        sfreq,
+        verbose=False,
+    )
+    return cola, freq_list
+
 
+def _log_notch_freqs(freq_list, line_freqs):
     # report found frequencies, but do some sanitizing first by binning into
     # 1 Hz bins
-    counts = Counter(
-        sum((np.unique(np.round(ff)).tolist() for f in freq_list for ff in f), list())
-    )
+    counts = Counter(sum((np.unique(np.round(f)).tolist() for f in freq_list), list()))
     kind = "Detected" if line_freqs is None else "Removed"
     found_freqs = (
         "\n".join(
@@ -1657,29 +1911,58 @@ def _mt_spectrum_proc(
     )
     logger.info(f"{kind} notch frequencies (Hz):\n{found_freqs}")
 
-    x = _reshape_view(x, orig_shape)
-    return x
-
 
-def _mt_spectrum_remove_win(
-    x, sfreq, line_freqs, notch_widths, window_fun, threshold, get_thresh
+def _mt_spectrum_stream(
+    raw,
+    data,
+    onsets,
+    ends,
+    *,
+    line_freqs,
+    notch_widths,
+    mt_bandwidth,
+    p_value,
+    picks,
+    n_jobs,
+    filter_length,
 ):
-    n_times = x.shape[-1]
-    n_samples = window_fun.shape[1]
-    n_overlap = (n_samples + 1) // 2
-    x_out = np.zeros_like(x)
-    rm_freqs = list()
+    """Remove line noise from non-preloaded raw data block by block into ``data``.
 
-    # Define how to process a chunk of data
-    def process(x_, *, start, stop):
-        out = _mt_spectrum_remove(
-            x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_thresh
-        )
-        rm_freqs.append(out[1])
-        return (out[0],)  # must return a tuple
-
-    _COLA(process, x_out, n_times, n_samples, n_overlap, sfreq, verbose=False).feed(x)
-    return x_out, rm_freqs
+    Each contiguous segment is fed to the overlap-add windows as its blocks are
+    read with ``raw._read_segment``, so the result matches processing the
+    preloaded data. Samples outside the ``onsets``/``ends`` segments are copied
+    unfiltered.
+    """
+    sfreq = raw.info["sfreq"]
+    n_block = _stream_block_len(sfreq, 0)
+    logger.info(
+        f"Streaming the filter over blocks of {n_block} samples "
+        f"({n_block / sfreq:0.3f} s)"
+    )
+    freq_list = list()
+    for start, stop, do_filter in _filter_spans(onsets, ends, raw.n_times):
+        if do_filter and len(picks):
+            cola, this_freq_list = _mt_spectrum_cola(
+                data[:, start:stop],
+                sfreq,
+                line_freqs,
+                notch_widths,
+                mt_bandwidth,
+                p_value,
+                picks,
+                n_jobs,
+                filter_length,
+            )
+        for b_start in range(start, stop, n_block):
+            b_stop = min(b_start + n_block, stop)
+            raw._read_segment(b_start, b_stop, data_buffer=data[:, b_start:b_stop])
+            if do_filter and len(picks):
+                # the picked samples are overwritten once they have been fed
+                cola.feed(data[picks, b_start:b_stop])
+        if do_filter and len(picks):
+            freq_list.extend(this_freq_list)
+    _log_notch_freqs(freq_list, line_freqs)
+    return data
 
 
 def _mt_spectrum_remove(
@@ -1692,9 +1975,10 @@ def _mt_spectrum_remove(
     """
     from .time_frequency.multitaper import _mt_spectra
 
-    assert x.ndim == 1
-    if x.shape[-1] != window_fun.shape[-1]:
-        window_fun, threshold = get_thresh(x.shape[-1])
+    assert x.ndim == 2
+    n_times = x.shape[-1]
+    if n_times != window_fun.shape[-1]:
+        window_fun, threshold = get_thresh(n_times)
     # drop the even tapers
     n_tapers = len(window_fun)
     tapers_odd = np.arange(0, n_tapers, 2)
@@ -1706,24 +1990,22 @@ def _mt_spectrum_remove(
 
     # sum of squares across tapers (1, )
     H0_sq = sum_squared(H0)
+    freqs = fft.rfftfreq(n_times, 1.0 / sfreq)
 
-    # make "time" vector
-    rads = 2 * np.pi * (np.arange(x.size) / float(sfreq))
-
-    # compute mt_spectrum (returning n_ch, n_tapers, n_freq)
-    x_p, freqs = _mt_spectra(x[np.newaxis, :], window_fun, sfreq)
+    if line_freqs is None:
+        # figure out which freqs to remove using F stat
 
-    # sum of the product of x_p and H0 across tapers (1, n_freqs)
-    x_p_H0 = np.sum(x_p[:, tapers_odd, :] * H0[np.newaxis, :, np.newaxis], axis=1)
+        # compute mt_spectrum (returning n_ch, n_tapers, n_freq)
+        x_p, _ = _mt_spectra(x, window_fun, sfreq)
 
-    # resulting calculated amplitudes for all freqs
-    A = x_p_H0 / H0_sq
+        # sum of the product of x_p and H0 across tapers (n_ch, n_freqs)
+        x_p_H0 = np.sum(x_p[:, tapers_odd, :] * H0[np.newaxis, :, np.newaxis], axis=1)
 
-    if line_freqs is None:
-        # figure out which freqs to remove using F stat
+        # resulting calculated amplitudes for all freqs
+        A = x_p_H0 / H0_sq
 
         # estimated coefficient
-        x_hat = A * H0[:, np.newaxis]
+        x_hat = A[:, np.newaxis] * H0[:, np.newaxis]
 
         # numerator for F-statistic
         num = (n_tapers - 1) * (A * A.conj()).real * H0_sq
@@ -1734,9 +2016,11 @@ def _mt_spectrum_remove(
         den[den == 0] = np.inf
         f_stat = num / den
 
-        # find frequencies to remove
-        indices = np.where(f_stat > threshold)[1]
-        rm_freqs = freqs[indices]
+        # find frequencies to remove, which differ across channels
+        use = f_stat > threshold
+        rm_freqs = [freqs[this_use] for this_use in use]
+        indices = np.where(use.any(axis=0))[0]
+        A = np.where(use[:, indices], A[:, indices], 0)
     else:
         # specify frequencies
         indices_1 = np.unique([np.argmin(np.abs(freqs - lf)) for lf in line_freqs])
@@ -1746,21 +2030,44 @@ def _mt_spectrum_remove(
         ]
         indices_2 = np.where(np.any(np.array(indices_2), axis=0))[0]
         indices = np.unique(np.r_[indices_1, indices_2])
-        rm_freqs = freqs[indices]
+        rm_freqs = [freqs[indices]] * len(x)
+
+        # same DC/Nyquist scaling as _mt_spectra
+        scaling = np.where((indices == 0) | (2 * indices == n_times), np.sqrt(2), 1.0)
+        x_w = (x - np.mean(x, axis=-1, keepdims=True)) * (H0 @ tapers_use)
+        # The tapered spectra are only needed at a few frequencies, and their
+        # sum weighted by H0 is the spectrum of a single combined taper, so
+        # the amplitudes are DFTs at these bins, i.e., a small matrix product
+        A = sum(
+            x_w[:, sl] @ basis.conj().T for sl, basis in _line_basis(n_times, indices)
+        )
+        A /= scaling * H0_sq
 
-    fits = list()
-    for ind in indices:
-        c = 2 * A[0, ind]
-        fit = np.abs(c) * np.cos(freqs[ind] * rads + np.angle(c))
-        fits.append(fit)
+    # fitted sinusoids |c| cos(2 pi f t + angle(c)) with c = 2 A are summed, and
+    # subtracted from data
+    out = np.empty(x.shape, np.result_type(x.dtype, np.float64))
+    for sl, basis in _line_basis(n_times, indices):
+        out[:, sl] = x[:, sl] - ((2 * A) @ basis).real
+    return out, rm_freqs
 
-    if len(fits) == 0:
-        datafit = 0.0
-    else:
-        # fitted sinusoids are summed, and subtracted from data
-        datafit = np.sum(fits, axis=0)
 
-    return x - datafit, rm_freqs
+def _line_basis(n_times, indices):
+    """Generate the complex sinusoids of the given DFT bins in blocks of time."""
+    n_block = max(_LINE_BASIS_BLOCK_BYTES // (16 * max(len(indices), 1)), 1)
+    if n_block >= n_times:
+        key = ("spectrum_fit", n_times, indices)
+        yield slice(None), _filter_cache.get(key, _line_basis_block, n_times, indices)
+        return
+    for start in range(0, n_times, n_block):
+        stop = min(start + n_block, n_times)
+        yield slice(start, stop), _line_basis_block(n_times, indices, start, stop)
+
+
+def _line_basis_block(n_times, indices, start=0, stop=None):
+    """Get the complex sinusoids of the given DFT bins for some samples."""
+    stop = n_times if stop is None else stop
+    times = np.arange(start, stop)
+    return np.exp(2j * np.pi * np.outer(indices, times) / n_times)
 
 
 def _check_filterable(x, kind="filtered", alternative="filter"):
@@ -1786,7 +2093,7 @@ def _check_filterable(x, kind="filtered", alternative="filter"):
             )
     _validate_type(x, (np.ndarray, list, tuple), f"Data to be {kind}")
     x = np.asanyarray(x)
-    if x.dtype != np.float64:
+    if x.dtype not in (np.float64, _get_float_dtype()):
         raise ValueError(f"Data to be {kind} must be real floating, got {x.dtype}")
     return x
 
@@ -1959,6 +2266,7 @@ def _resample_fft(x_flat, *, ratio, final_len, pad, window, npad, n_jobs):
     else:
         W = fft.ifftshift(signal.get_window(window, orig_len))
     W *= float(new_len) / float(orig_len)
+    W = W.astype(np.result_type(x_flat.dtype, np.float32), copy=False)
 
     # figure out if we should use CUDA
     n_jobs, cuda_dict = _setup_cuda_fft_resample(n_jobs, W, new_len)
@@ -2520,6 +2828,12 @@ class FilterMixin:
         When working on SourceEstimates the sample rate of the original
         data is inferred from tstep.
 
+        If the ``MNE_DATA_DTYPE`` config value is ``"float32"``, data stored in
+        single precision are FIR filtered in single precision, which matches
+        double precision filtering to about ``1e-5`` times the peak amplitude.
+        IIR filters are always applied in double precision. See
+        :ref:`data-precision` for details.
+
         For more information, see the tutorials
         :ref:`disc-filtering` and :ref:`tut-filter-resample` and
         :func:`mne.filter.create_filter`.
@@ -6,7 +6,14 @@
 
 import numpy as np
 
-from ...utils import _check_option, _validate_type, fill_doc, logger, verbose
+from ...utils import (
+    _check_option,
+    _get_float_dtype,
+    _validate_type,
+    fill_doc,
+    logger,
+    verbose,
+)
 from ..base import BaseRaw
 
 
@@ -27,7 +34,8 @@ class RawArray(BaseRaw):
     copy : {'data', 'info', 'both', 'auto', None}
         Determines what gets copied on instantiation. "auto" (default)
         will copy info, and copy "data" only if necessary to get to
-        double floating point precision.
+        double floating point precision (single precision if the
+        ``MNE_DATA_DTYPE`` config value is ``"float32"``).
 
         .. versionadded:: 0.18
     %(verbose)s
@@ -54,7 +62,9 @@ class RawArray(BaseRaw):
     def __init__(self, data, info, first_samp=0, copy="auto", verbose=None):
         _validate_type(info, "info", "info")
         _check_option("copy", copy, ("data", "info", "both", "auto", None))
-        dtype = np.complex128 if np.any(np.iscomplex(data)) else np.float64
+        dtype = _get_float_dtype(
+            np.complex128 if np.any(np.iscomplex(data)) else np.float64
+        )
         orig_data = data
         data = np.asanyarray(orig_data, dtype=dtype)
         if data.ndim != 2:
@@ -80,7 +90,7 @@ class RawArray(BaseRaw):
                 "to get to double floating point precision"
             )
         logger.info(
-            f"Creating RawArray with {dtype.__name__} data, "
+            f"Creating RawArray with {dtype.name} data, "
             f"n_channels={data.shape[0]}, n_times={data.shape[1]}"
         )
         super().__init__(
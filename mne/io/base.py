@@ -3,14 +3,18 @@
 # Copyright the MNE-Python contributors.
 
 import os
+import re
 import shutil
 from collections import defaultdict
 from contextlib import nullcontext
 from copy import deepcopy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
+from functools import cached_property, partial
 from inspect import getfullargspec
+from io import BytesIO
 from pathlib import Path
+from textwrap import indent
 
 import numpy as np
 
@@ -38,11 +42,7 @@ from .._fiff.write import (
     end_block,
     start_and_end_file,
     start_block,
-    write_complex64,
-    write_complex128,
-    write_dau_pack16,
-    write_double,
-    write_float,
+    start_file,
     write_id,
     write_int,
     write_string,
@@ -61,9 +61,21 @@ from ..event import concatenate_events, find_events
 from ..filter import (
     FilterMixin,
     _check_fun,
+    _check_method,
+    _check_notch_params,
     _check_resamp_noop,
+    _filt_check_picks,
+    _filt_update_info,
+    _filter_block_fun,
+    _filter_context_len,
+    _filter_raw_stream,
+    _filter_spans,
+    _mt_spectrum_stream,
+    _notch_stop_bands,
     _resamp_ratio_len,
     _resample_stim_channels,
+    _stream_block_len,
+    create_filter,
     notch_filter,
     resample,
 )
@@ -85,6 +97,7 @@ from ..utils import (
     _convert_times,
     _file_like,
     _get_argvalues,
+    _get_float_dtype,
     _get_stim_channel,
     _pl,
     _scale_dataframe_data,
@@ -101,9 +114,19 @@ from ..utils import (
     verbose,
     warn,
 )
+from ..utils.docs import docdict
 from ..viz import _RAW_CLIP_DEF, plot_raw
 
 
+def _add_memmap_filter_doc(func):
+    """Document ``memmap`` before the Returns section of a docstring (decorator)."""
+    doc = func.__doc__
+    match = re.search(r"^( *)Returns\n", doc, re.MULTILINE)
+    entry = indent(docdict["memmap_filter"].strip("\n"), match.group(1))
+    func.__doc__ = f"{doc[: match.start()]}{entry}\n\n{doc[match.start() :]}"
+    return func
+
+
 @fill_doc
 class BaseRaw(
     ProjMixin,
@@ -202,10 +225,20 @@ class BaseRaw(
     ):
         # wait until the end to preload data, but triage here
         if isinstance(preload, np.ndarray):
-            # some functions (e.g., filtering) only work w/64-bit data
-            if preload.dtype not in (np.float64, np.complex128):
+            # some functions (e.g., filtering) only work w/64-bit data, unless
+            # single precision was requested
+            dtypes = ("float64", "complex128")
+            dtypes += tuple(
+                _get_float_dtype(dt).name
+                for dt in dtypes
+                if _get_float_dtype(dt).name not in dtypes
+            )
+            if preload.dtype not in dtypes:
+                extra = ""
+                if preload.dtype in (np.float32, np.complex64):
+                    extra = ' (single precision needs MNE_DATA_DTYPE="float32")'
                 raise RuntimeError(
-                    f"datatype must be float64 or complex128, not {preload.dtype}"
+                    f"datatype must be one of {dtypes}, not {preload.dtype}{extra}"
                 )
             if preload.dtype != dtype:
                 raise ValueError("preload and dtype must match")
@@ -298,6 +331,8 @@ class BaseRaw(
             orig_units = _check_orig_units(orig_units)
         self._orig_units = orig_units or dict()  # always a dict
         self._projector = None
+        self._lazy = False
+        self._lazy_ops = list()
         self._dtype_ = dtype
         self.set_annotations(None)
         self._cropped_samp = first_samps[0]
@@ -337,6 +372,7 @@ class BaseRaw(
                     "Cannot change compensation on data where projectors have been "
                     "applied."
                 )
+            self._check_no_deferred("Changing the compensation grade")
             # Figure out what operator to use (varies depending on preload)
             from_comp = current_comp if self.preload else self._read_comp_grade
             comp = make_compensator(self.info, from_comp, grade)
@@ -397,7 +433,12 @@ class BaseRaw(
 
         if start >= stop:
             raise ValueError("No data in this range")
+        if self._lazy_ops:
+            return self._read_segment_deferred(start, stop, sel, data_buffer)
+        return self._read_segment_undeferred(start, stop, sel, data_buffer)
 
+    def _read_segment_undeferred(self, start, stop, sel, data_buffer):
+        """Read a chunk of raw data without applying deferred operations."""
         #  Initialize the data and calibration vector
         if sel is None:
             n_out = self.info["nchan"]
@@ -408,7 +449,7 @@ class BaseRaw(
         del sel
         assert n_out <= self.info["nchan"]
         data_shape = (n_out, stop - start)
-        dtype = self._dtype
+        dtype = _get_float_dtype(self._dtype)
         if isinstance(data_buffer, np.ndarray):
             if data_buffer.shape != data_shape:
                 raise ValueError(
@@ -486,6 +527,62 @@ class BaseRaw(
             offset += n_read
         return data
 
+    def _read_segment_deferred(self, start, stop, sel, data_buffer):
+        """Read a chunk of raw data with the deferred operations applied."""
+        n_out = self.info["nchan"] if sel is None else len(sel)
+        data_shape = (n_out, stop - start)
+        if isinstance(data_buffer, np.ndarray):
+            if data_buffer.shape != data_shape:
+                raise ValueError(
+                    f"data_buffer has incorrect shape: "
+                    f"{data_buffer.shape} != {data_shape}"
+                )
+            data = data_buffer
+        else:
+            data = _allocate_data(
+                data_buffer, data_shape, _get_float_dtype(self._dtype)
+            )
+        idx = slice(None) if sel is None else _convert_slice(sel)
+        n_ctx = sum(op.n_ctx for op in self._lazy_ops)
+        n_block = _stream_block_len(self.info["sfreq"], n_ctx)
+        for b_start in range(start, stop, n_block):
+            b_stop = min(b_start + n_block, stop)
+            block = self._read_deferred(b_start, b_stop, len(self._lazy_ops))
+            data[:, b_start - start : b_stop - start] = block[idx]
+        return data
+
+    def _read_deferred(self, start, stop, n_ops):
+        """Read all channels with the first ``n_ops`` deferred operations applied.
+
+        Each operation reads the output of the previous one over its segments
+        (clipped to the requested samples), with its own context on either
+        side, so that the result does not depend on how the data are blocked.
+        """
+        if n_ops == 0:
+            return self._read_segment_undeferred(start, stop, None, None)
+        op = self._lazy_ops[n_ops - 1]
+        if op.onsets is None:
+            spans = [(0, self.n_times, True)]
+        else:
+            spans = _filter_spans(op.onsets, op.ends, self.n_times)
+        data = np.empty(
+            (self.info["nchan"], stop - start), _get_float_dtype(self._dtype)
+        )
+        for s_start, s_stop, apply in spans:
+            p_start, p_stop = max(s_start, start), min(s_stop, stop)
+            if p_start >= p_stop:
+                continue
+            out = slice(p_start - start, p_stop - start)
+            if not apply:
+                data[:, out] = self._read_deferred(p_start, p_stop, n_ops - 1)
+                continue
+            w_start = max(s_start, p_start - op.n_ctx)
+            w_stop = min(s_stop, p_stop + op.n_ctx)
+            block = self._read_deferred(w_start, w_stop, n_ops - 1)
+            op.fun(block)
+            data[:, out] = block[:, p_start - w_start : p_stop - w_start]
+        return data
+
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file.
 
@@ -605,12 +702,89 @@ class BaseRaw(
         logger.info(
             f"Reading 0 ... {len(t) - 1}  =  {0.0:9.3f} ... {t[-1]:9.3f} secs..."
         )
-        self._data = self._read_segment(data_buffer=data_buffer)
+        self._set_preloaded_data(self._read_segment(data_buffer=data_buffer))
+
+    def _set_preloaded_data(self, data):
+        """Replace on-disk reading by data that were read in full."""
+        self._data = data
         assert len(self._data) == self.info["nchan"]
         self.preload = True
         self._comp = None  # no longer needed
+        self._lazy_ops = list()  # already applied while reading
         self.close()
 
+    def set_lazy(self, lazy=True):
+        """Defer processing of non-preloaded data until the data are read.
+
+        Parameters
+        ----------
+        lazy : bool
+            If True (default), :meth:`filter`, :meth:`notch_filter`, and
+            :meth:`set_eeg_reference` called on non-preloaded data record the
+            operation instead of requiring the data to be loaded. If False,
+            further operations require the data to be loaded again (operations
+            already recorded are still applied).
+
+        Returns
+        -------
+        raw : instance of Raw
+            The raw object. Operates in place.
+
+        Notes
+        -----
+        The recorded operations are applied in a single pass over the data,
+        block by block, whenever data are read: by :meth:`load_data`,
+        :meth:`get_data`, indexing, epoching, saving, or plotting. Only the
+        requested time range (plus the context each filter needs) is read
+        and processed, and because non-preloaded data can already be cropped
+        and picked without reading them, calling :meth:`crop` and :meth:`pick`
+        before the deferred operations means that only the selected channels
+        and times are ever materialized.
+
+        While operations are pending, methods that change which data are read
+        (e.g., :meth:`crop`, :meth:`pick`, :meth:`apply_proj`, or
+        :meth:`append`) require the data to be loaded first, and methods that
+        always need all of the data in memory (e.g., :meth:`resample`) are not
+        deferred.
+
+        .. versionadded:: 1.13
+        """
+        _validate_type(lazy, bool, "lazy")
+        self._lazy = lazy
+        return self
+
+    def _check_no_deferred(self, msg):
+        """Require loaded data if operations are pending."""
+        if self._lazy_ops:
+            _check_preload(self, f"{msg} with deferred operations pending")
+
+    def _defer_reference(self, fun):
+        """Record a re-referencing as a channel-mixing matrix."""
+        from .array import RawArray
+
+        # All re-referencing schemes mix channels linearly sample by sample,
+        # so the operator is obtained by re-referencing an identity matrix
+        probe = RawArray(
+            np.eye(self.info["nchan"]), self.info.copy(), first_samp=0, verbose=False
+        )
+        fun(probe)
+
+        def _active(info):
+            return [p["desc"] for p in info["projs"] if p["active"]]
+
+        if _active(probe.info) != _active(self.info):
+            _check_preload(self, "Removing an applied average reference projection")
+        with self.info._unlock():
+            self.info["custom_ref_applied"] = probe.info["custom_ref_applied"]
+            self.info["projs"] = probe.info["projs"]
+        mat = probe._data
+        rows = np.where((mat != np.eye(len(mat))).any(axis=1))[0]
+        logger.info("Deferring the re-referencing until the data are read")
+        self._lazy_ops.append(
+            _DeferredOp(fun=partial(_mix_rows, rows=rows, mat=mat[rows]))
+        )
+        return self
+
     @property
     def _first_time(self):
         return self.first_samp / float(self.info["sfreq"])
@@ -1157,8 +1331,11 @@ class BaseRaw(
 
         return self
 
-    # Need a separate method because the default pad is different for raw
+    # Need a separate method because the default pad is different for raw and
+    # unloaded data can be filtered into a memory-mapped file
+    @_add_memmap_filter_doc
     @copy_doc(FilterMixin.filter)
+    @verbose
     def filter(
         self,
         l_freq,
@@ -1176,7 +1353,40 @@ class BaseRaw(
         skip_by_annotation=("edge", "bad_acq_skip"),
         pad="reflect_limited",
         verbose=None,
+        *,
+        memmap=None,
     ):
+        if not self.preload and (memmap is not None or self._lazy):
+            update_info, picks = _filt_check_picks(self.info, picks, l_freq, h_freq)
+            iir_params, method = _check_method(method, iir_params)
+            if pad is None and method != "iir":
+                pad = "edge"
+            filt = create_filter(
+                None,
+                self.info["sfreq"],
+                l_freq,
+                h_freq,
+                filter_length,
+                l_trans_bandwidth,
+                h_trans_bandwidth,
+                method,
+                iir_params,
+                phase,
+                fir_window,
+                fir_design,
+            )
+            self._filter_unloaded(
+                memmap,
+                filt,
+                method=method,
+                phase=phase,
+                picks=picks,
+                n_jobs=n_jobs,
+                pad=pad,
+                skip_by_annotation=skip_by_annotation,
+            )
+            _filt_update_info(self.info, update_info, l_freq, h_freq)
+            return self
         return super().filter(
             l_freq,
             h_freq,
@@ -1214,6 +1424,8 @@ class BaseRaw(
         pad="reflect_limited",
         skip_by_annotation=("edge", "bad_acq_skip"),
         verbose=None,
+        *,
+        memmap=None,
     ):
         """Notch filter a subset of channels.
 
@@ -1253,6 +1465,10 @@ class BaseRaw(
             .. versionadded:: 0.15
         %(skip_by_annotation)s
         %(verbose)s
+        %(memmap_filter)s
+
+            With ``method='spectrum_fit'``, the data must be written to a
+            memmap, deferring the filtering is not supported.
 
         Returns
         -------
@@ -1270,7 +1486,7 @@ class BaseRaw(
         "picks". By default the data of the Raw object is modified inplace.
 
         The Raw object has to have the data loaded e.g. with ``preload=True``
-        or ``self.load_data()``.
+        or ``self.load_data()``, unless ``memmap`` is given.
 
         .. note:: If n_jobs > 1, more memory is required as
                   ``len(picks) * n_times`` additional time points need to
@@ -1280,6 +1496,46 @@ class BaseRaw(
         """
         fs = float(self.info["sfreq"])
         picks = _picks_to_idx(self.info, picks, exclude=(), none="data_or_ica")
+        if not self.preload and (memmap is not None or self._lazy):
+            iir_params, method = _check_method(method, iir_params, ["spectrum_fit"])
+            freqs, notch_widths = _check_notch_params(freqs, notch_widths, method)
+            if method == "spectrum_fit":
+                return self._notch_spectrum_fit_unloaded(
+                    memmap,
+                    freqs,
+                    notch_widths=notch_widths,
+                    mt_bandwidth=mt_bandwidth,
+                    p_value=p_value,
+                    picks=picks,
+                    n_jobs=n_jobs,
+                    filter_length=filter_length,
+                    skip_by_annotation=skip_by_annotation,
+                )
+            lows, highs, tb_2 = _notch_stop_bands(freqs, notch_widths, trans_bandwidth)
+            filt = create_filter(
+                None,
+                fs,
+                highs,
+                lows,
+                filter_length,
+                tb_2,
+                tb_2,
+                method,
+                iir_params,
+                phase,
+                fir_window,
+                fir_design,
+            )
+            return self._filter_unloaded(
+                memmap,
+                filt,
+                method=method,
+                phase=phase,
+                picks=picks,
+                n_jobs=n_jobs,
+                pad=pad,
+                skip_by_annotation=skip_by_annotation,
+            )
         _check_preload(self, "raw.notch_filter")
         onsets, ends = _annotations_starts_stops(self, skip_by_annotation, invert=True)
         logger.info(
@@ -1307,6 +1563,74 @@ class BaseRaw(
             )
         return self
 
+    def _filter_unloaded(
+        self, memmap, filt, *, method, phase, picks, n_jobs, pad, skip_by_annotation
+    ):
+        """Filter non-preloaded data into a memmap, or defer the filtering."""
+        onsets, ends = _annotations_starts_stops(self, skip_by_annotation, invert=True)
+        logger.info(
+            "Filtering raw data in %d contiguous segment%s", len(onsets), _pl(onsets)
+        )
+        if method == "fir" and len(onsets):
+            len_x = (ends - onsets).max()
+            if len(filt) > len_x:
+                warn(
+                    f"filter_length ({len(filt)}) is longer than the signal ({len_x}), "
+                    "distortion is likely. Reduce filter length or filter a longer "
+                    "signal."
+                )
+        if memmap is None:
+            logger.info("Deferring the filtering until the data are read")
+            self._lazy_ops.append(
+                _DeferredOp(
+                    fun=_filter_block_fun(filt, method, phase, picks, n_jobs, pad),
+                    n_ctx=_filter_context_len(filt, method, phase),
+                    onsets=onsets,
+                    ends=ends,
+                )
+            )
+            return self
+        _validate_type(memmap, "path-like", "memmap")
+        data = _allocate_data(
+            memmap, (self.info["nchan"], self.n_times), _get_float_dtype(self._dtype)
+        )
+        _filter_raw_stream(
+            self,
+            data,
+            onsets,
+            ends,
+            filt,
+            method=method,
+            phase=phase,
+            picks=picks,
+            n_jobs=n_jobs,
+            pad=pad,
+        )
+        self._set_preloaded_data(data)
+        return self
+
+    def _notch_spectrum_fit_unloaded(
+        self, memmap, freqs, *, skip_by_annotation, **kwargs
+    ):
+        """Remove line noise from non-preloaded data into a memmap."""
+        if memmap is None:
+            raise ValueError(
+                "Non-preloaded data can only be filtered with method='spectrum_fit' "
+                "into a memmap, pass memmap or load the data first with "
+                "raw.load_data()"
+            )
+        _validate_type(memmap, "path-like", "memmap")
+        onsets, ends = _annotations_starts_stops(self, skip_by_annotation, invert=True)
+        logger.info(
+            "Filtering raw data in %d contiguous segment%s", len(onsets), _pl(onsets)
+        )
+        data = _allocate_data(
+            memmap, (self.info["nchan"], self.n_times), _get_float_dtype(self._dtype)
+        )
+        _mt_spectrum_stream(self, data, onsets, ends, line_freqs=freqs, **kwargs)
+        self._set_preloaded_data(data)
+        return self
+
     @verbose
     def resample(
         self,
@@ -1477,6 +1801,7 @@ class BaseRaw(
         assert np.array_equal(n_news, self._last_samps - self._first_samps + 1)
         self._data = new_data
         self.preload = True
+        self._lazy_ops = list()  # already applied while reading
         lowpass = self.info.get("lowpass")
         lowpass = np.inf if lowpass is None else lowpass
         with self.info._unlock():
@@ -1646,6 +1971,7 @@ class BaseRaw(
             >>> print(raw2.first_samp)  # doctest: +SKIP
             0
         """
+        self._check_no_deferred("raw.crop")
         max_time = (self.n_times - 1) / self.info["sfreq"]
         if tmax is None:
             tmax = max_time
@@ -1755,6 +2081,8 @@ class BaseRaw(
         split_size="2GB",
         split_naming="neuromag",
         verbose=None,
+        *,
+        n_jobs=None,
     ):
         """Save raw data to file.
 
@@ -1808,6 +2136,11 @@ class BaseRaw(
 
             .. versionadded:: 0.17
         %(verbose)s
+        %(n_jobs)s
+            When the data are split into several files, the files are written
+            concurrently (using threads).
+
+            .. versionadded:: 1.13
 
         Returns
         -------
@@ -1895,7 +2228,9 @@ class BaseRaw(
 
         cfg = _RawFidWriterCfg(buffer_size, split_size, drop_small_buffer, fmt)
         raw_fid_writer = _RawFidWriter(self, info, picks, projector, start, stop, cfg)
-        filenames = _write_raw(raw_fid_writer, fname, split_naming, overwrite)
+        filenames = _write_raw(
+            raw_fid_writer, fname, split_naming, overwrite, n_jobs=n_jobs
+        )
         return filenames
 
     @verbose
@@ -2165,6 +2500,8 @@ class BaseRaw(
                 preload = False
 
         if preload is False:
+            for raw in all_raws:
+                raw._check_no_deferred("raw.append")
             if self.preload:
                 self._data = None
             self.preload = False
@@ -2192,6 +2529,7 @@ class BaseRaw(
                     _data[:, c_ns[ri] : c_ns[ri + 1]] = raws[ri]._data
             self._data = _data
             self.preload = True
+            self._lazy_ops = list()
 
         # now combine information from each raw file to construct new self
         annotations = self.annotations
@@ -2635,6 +2973,20 @@ class BaseRaw(
             print(msg)
 
 
+@dataclass
+class _DeferredOp:
+    """An operation on non-preloaded data, applied when the data are read."""
+
+    fun: callable  # modifies (n_channels, n_times) data in place
+    n_ctx: int = 0  # samples of context needed on either side
+    onsets: np.ndarray | None = None  # segments to operate on (default: all)
+    ends: np.ndarray | None = None
+
+
+def _mix_rows(data, *, rows, mat):
+    data[rows] = mat @ data
+
+
 def _allocate_data(preload, shape, dtype):
     """Allocate data in memory or in memmap for preloading."""
     if preload in (None, True):  # None comes from _read_segment
@@ -2812,7 +3164,7 @@ class _RawShell:
 MAX_N_SPLITS = 100
 
 
-def _write_raw(raw_fid_writer, fpath, split_naming, overwrite):
+def _write_raw(raw_fid_writer, fpath, split_naming, overwrite, n_jobs=None):
     """Write raw file with splitting."""
     dir_path = fpath.parent
     _check_fname(
@@ -2827,6 +3179,17 @@ def _write_raw(raw_fid_writer, fpath, split_naming, overwrite):
     split_fnames = _make_split_fnames(
         fpath.name, n_splits=MAX_N_SPLITS + 1, split_naming=split_naming
     )
+    parallel, p_fun, n_jobs = parallel_func(_write_raw_part, n_jobs, prefer="threads")
+    if n_jobs > 1:
+        return _write_raw_parallel(
+            raw_fid_writer,
+            fpath,
+            split_fnames,
+            split_naming,
+            overwrite,
+            parallel,
+            p_fun,
+        )
     is_next_split, prev_fname = True, None
     output_fnames = []
     for part_idx in range(0, MAX_N_SPLITS):
@@ -2851,11 +3214,9 @@ def _write_raw(raw_fid_writer, fpath, split_naming, overwrite):
             logger.info(f"Closing {use_fpath}")
         if bids_special_behavior and is_next_split:
             logger.info(f"Renaming BIDS split file {fpath.name}")
-            prev_fname = dir_path / split_fnames[0]
-            shutil.move(use_fpath, prev_fname)
-            output_fnames.append(prev_fname)
-        else:
-            output_fnames.append(use_fpath)
+            use_fpath = dir_path / split_fnames[0]
+            shutil.move(fpath, use_fpath)
+        output_fnames.append(use_fpath)
         prev_fname = use_fpath
     else:
         raise RuntimeError(f"Exceeded maximum number of splits ({MAX_N_SPLITS}).")
@@ -2864,6 +3225,47 @@ def _write_raw(raw_fid_writer, fpath, split_naming, overwrite):
     return output_fnames
 
 
+def _write_raw_parallel(
+    raw_fid_writer, fpath, split_fnames, split_naming, overwrite, parallel, p_fun
+):
+    """Write the split files of a raw file concurrently."""
+    # The split boundaries only depend on the sizes of the tags, so all parts
+    # (and the file names linking them) can be laid out before writing any data
+    dir_path = fpath.parent
+    parts = list()
+    start, prev_fname = raw_fid_writer.start, None
+    for part_idx in range(0, MAX_N_SPLITS):
+        plan = raw_fid_writer.plan(part_idx, start, prev_fname)
+        if part_idx == 0 and not (split_naming == "bids" and plan.split):
+            use_fpath = fpath
+        else:
+            use_fpath = dir_path / split_fnames[part_idx]
+        _check_fname(use_fpath, overwrite)
+        parts.append(
+            (use_fpath, part_idx, start, prev_fname, split_fnames[part_idx + 1], plan)
+        )
+        if not plan.split:
+            break
+        start, prev_fname = plan.stop, use_fpath
+    else:
+        raise RuntimeError(f"Exceeded maximum number of splits ({MAX_N_SPLITS}).")
+    logger.info(f"Writing {len(parts)} file{_pl(parts)} in parallel")
+    parallel(p_fun(raw_fid_writer, *part) for part in parts)
+    raw_fid_writer.start = parts[-1][-1].stop
+    logger.info("[done]")
+    return [part[0] for part in parts]
+
+
+def _write_raw_part(
+    raw_fid_writer, use_fpath, part_idx, start, prev_fname, next_fname, plan
+):
+    """Write one file of a split raw file."""
+    logger.info(f"Writing {use_fpath}")
+    with start_and_end_file(use_fpath) as fid:
+        raw_fid_writer._write(fid, part_idx, start, prev_fname, next_fname, plan)
+        logger.info(f"Closing {use_fpath}")
+
+
 class _ReservedFilename:
     def __init__(self, fname: Path):
         self.fname = fname
@@ -2902,6 +3304,17 @@ class _RawFidWriterCfg:
         object.__setattr__(self, "data_type", type_dict[self.fmt])
 
 
+@dataclass(frozen=True)
+class _RawPartPlan:
+    """The buffers to write to one file of a split raw file."""
+
+    buffers: list  # (first, last, n_skip) with n_skip skipped buffers before
+    stop: int  # the first sample not written to this file
+    split: bool  # whether the data continue in the next file
+    header: bytes = None  # the rendered tags before the data buffers
+    data_kind: int = None  # the kind of the data block started by the header
+
+
 class _RawFidWriter:
     def __init__(self, raw, info, picks, projector, start, stop, cfg):
         self.raw = raw
@@ -2918,22 +3331,52 @@ class _RawFidWriter:
         self.cfg = cfg
 
     def write(self, fid, part_idx, prev_fname, next_fname):
-        self._check_start_stop_within_bounds()
+        self.start = self._write(fid, part_idx, self.start, prev_fname, next_fname)
+        is_next_split = self.start < self.stop
+        return is_next_split
+
+    def plan(self, part_idx, start, prev_fname):
+        """Lay out the buffers of a file without writing any data."""
+        self._check_start_stop_within_bounds(start)
+        # The measurement info is rendered here rather than when writing the
+        # file, as writing it is not thread-safe (it changes the log level)
+        fid = BytesIO()
+        start_file(fid)
+        n_file = fid.tell()
         start_block(fid, FIFF.FIFFB_MEAS)
-        _write_raw_metadata(
-            fid,
+        self._write_metadata(fid, self.info)
+        data_kind = _write_raw_data_start(
+            self.raw, self.info, fid, part_idx, start, prev_fname
+        )
+        plan = _plan_raw_buffers(
+            self.raw,
             self.info,
-            self.cfg.data_type,
-            self.cfg.reset_range,
-            self.raw.annotations,
+            part_idx,
+            start,
+            self.stop,
+            self.cfg.buffer_size,
+            fid.tell(),
+            self.cfg.split_size,
+            self.cfg.drop_small_buffer,
+            self._itemsize,
         )
-        self.start = _write_raw_data(
+        header = fid.getvalue()[n_file:]
+        return replace(plan, header=header, data_kind=data_kind)
+
+    def _write(self, fid, part_idx, start, prev_fname, next_fname, plan=None):
+        self._check_start_stop_within_bounds(start)
+        if plan is None:
+            start_block(fid, FIFF.FIFFB_MEAS)
+            self._write_metadata(fid, self.info)
+        else:  # parts planned upfront are written concurrently
+            fid.write(plan.header)
+        start = _write_raw_data(
             self.raw,
             self.info,
             self.picks,
             fid,
             part_idx,
-            self.start,
+            start,
             self.stop,
             self.cfg.buffer_size,
             prev_fname,
@@ -2942,19 +3385,33 @@ class _RawFidWriter:
             self.projector,
             self.cfg.drop_small_buffer,
             self.cfg.fmt,
+            plan=plan,
         )
         end_block(fid, FIFF.FIFFB_MEAS)
-        is_next_split = self.start < self.stop
-        return is_next_split
+        return start
+
+    def _write_metadata(self, fid, info):
+        _write_raw_metadata(
+            fid,
+            info,
+            self.cfg.data_type,
+            self.cfg.reset_range,
+            self.raw.annotations,
+        )
+
+    @cached_property
+    def _itemsize(self):
+        is_complex = np.iscomplexobj(self.raw[self.picks[0], self.start][0])
+        return _raw_buffer_dtype(self.cfg.fmt, is_complex)[1].itemsize
 
-    def _check_start_stop_within_bounds(self):
+    def _check_start_stop_within_bounds(self, start):
         # we've done something wrong if we hit this
         n_times_max = len(self.raw.times)
         error_msg = (
-            f"Can't write raw file with no data: {self.start} -> {self.stop} "
+            f"Can't write raw file with no data: {start} -> {self.stop} "
             f"(max: {n_times_max}) requested"
         )
-        if self.start >= self.stop or self.stop > n_times_max:
+        if start >= self.stop or self.stop > n_times_max:
             raise RuntimeError(error_msg)
 
 
@@ -2973,8 +3430,80 @@ def _write_raw_data(
     projector,
     drop_small_buffer,
     fmt,
+    *,
+    plan=None,
 ):
-    # Start the raw data
+    if plan is None:
+        data_kind = _write_raw_data_start(raw, info, fid, part_idx, start, prev_fname)
+    else:  # the header was already written
+        data_kind = plan.data_kind
+    pos_prev = fid.tell()
+    if plan is None:
+        is_complex = np.iscomplexobj(raw[picks[0], start][0])
+        plan = _plan_raw_buffers(
+            raw,
+            info,
+            part_idx,
+            start,
+            stop,
+            buffer_size,
+            pos_prev,
+            split_size,
+            drop_small_buffer,
+            _raw_buffer_dtype(fmt, is_complex)[1].itemsize,
+        )
+
+    # Write the blocks, reading and converting runs of contiguous buffers at once
+    cals = np.array([ch["cal"] * ch["range"] for ch in info["chs"]])
+    max_samp = max(_WRITE_CHUNK_BYTES // (8 * len(picks)), buffer_size)
+    chunks = list()
+    for first, last, n_skip in plan.buffers:
+        if (
+            n_skip
+            or not chunks
+            or chunks[-1][-1][1] != first
+            or last - chunks[-1][0][0] > max_samp
+        ):
+            chunks.append(list())
+        chunks[-1].append((first, last, n_skip))
+    for chunk in chunks:
+        if chunk[0][2] > 0:
+            # Write out an empty buffer instead of data
+            write_int(fid, FIFF.FIFF_DATA_SKIP, chunk[0][2])
+            # These two NOPs appear to be optional (MaxFilter does not do
+            # it, but some acquisition machines do) so let's not bother.
+            # write_nop(fid)
+            # write_nop(fid)
+        c_first, c_last = chunk[0][0], chunk[-1][1]
+        data, times = raw[picks, c_first:c_last]
+        assert len(times) == c_last - c_first
+
+        if projector is not None:
+            data = np.dot(projector, data)
+
+        logger.debug(f"Writing FIF {c_first:6d} ... {c_last:6d} ...")
+        bounds = [first - c_first for first, _, _ in chunk] + [c_last - c_first]
+        _write_raw_buffers(fid, data, cals, fmt, bounds)
+
+    if plan.split:
+        start_block(fid, FIFF.FIFFB_REF)
+        write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
+        write_string(fid, FIFF.FIFF_REF_FILE_NAME, next_fname.name)
+        if info["meas_id"] is not None:
+            write_id(fid, FIFF.FIFF_REF_FILE_ID, info["meas_id"])
+        write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx + 1)
+        end_block(fid, FIFF.FIFFB_REF)
+
+    end_block(fid, data_kind)
+    return plan.stop
+
+
+# Maximum amount of (float64) data to read and convert at once when writing
+_WRITE_CHUNK_BYTES = 2**22
+
+
+def _write_raw_data_start(raw, info, fid, part_idx, start, prev_fname):
+    """Start the raw data block of a file."""
     data_kind = "IAS_" if info.get("maxshield", False) else ""
     data_kind = getattr(FIFF, f"FIFFB_{data_kind}RAW_DATA")
     start_block(fid, data_kind)
@@ -2992,8 +3521,22 @@ def _write_raw_data(
             write_id(fid, FIFF.FIFF_REF_FILE_ID, info["meas_id"])
         write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx - 1)
         end_block(fid, FIFF.FIFFB_REF)
+    return data_kind
 
-    pos_prev = fid.tell()
+
+def _plan_raw_buffers(
+    raw,
+    info,
+    part_idx,
+    start,
+    stop,
+    buffer_size,
+    pos_prev,
+    split_size,
+    drop_small_buffer,
+    itemsize,
+):
+    """Determine which buffers go to a file from the sizes of their tags."""
     if pos_prev > split_size:
         raise ValueError(
             'file is larger than "split_size" after writing '
@@ -3020,37 +3563,27 @@ def _write_raw_data(
                     "output buffer_size, will be written as zeroes."
                 )
 
-    cals = [ch["cal"] * ch["range"] for ch in info["chs"]]
-    # Write the blocks
+    buffers = list()
     n_current_skip = 0
     new_start = start
+    split = False
     for first, last in zip(firsts, lasts):
+        last = int(last)
+        pos = pos_prev
         if do_skips:
             if ((first >= sk_onsets) & (last <= sk_ends)).any():
                 # Track how many we have
                 n_current_skip += 1
                 continue
             elif n_current_skip > 0:
-                # Write out an empty buffer instead of data
-                write_int(fid, FIFF.FIFF_DATA_SKIP, n_current_skip)
-                # These two NOPs appear to be optional (MaxFilter does not do
-                # it, but some acquisition machines do) so let's not bother.
-                # write_nop(fid)
-                # write_nop(fid)
-                n_current_skip = 0
-        data, times = raw[picks, first:last]
-        assert len(times) == last - first
-
-        if projector is not None:
-            data = np.dot(projector, data)
-
-        if drop_small_buffer and (first > start) and (len(times) < buffer_size):
+                pos += 20  # FIFF_DATA_SKIP tag
+        if drop_small_buffer and (first > start) and (last - first < buffer_size):
             logger.info("Skipping data chunk due to small buffer ... [done]")
             break
-        logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
-        _write_raw_buffer(fid, data, cals, fmt)
+        buffers.append((first, last, n_current_skip))
+        n_current_skip = 0
 
-        pos = fid.tell()
+        pos += 16 + len(info["chs"]) * (last - first) * itemsize
         this_buff_size_bytes = pos - pos_prev
         overage = pos - split_size + _NEXT_FILE_BUFFER
         if overage > 0:
@@ -3073,19 +3606,10 @@ def _write_raw_data(
             pos >= split_size - this_buff_size_bytes - _NEXT_FILE_BUFFER
             and first + buffer_size < stop
         ):
-            start_block(fid, FIFF.FIFFB_REF)
-            write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
-            write_string(fid, FIFF.FIFF_REF_FILE_NAME, next_fname.name)
-            if info["meas_id"] is not None:
-                write_id(fid, FIFF.FIFF_REF_FILE_ID, info["meas_id"])
-            write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx + 1)
-            end_block(fid, FIFF.FIFFB_REF)
-
+            split = True
             break
         pos_prev = pos
-
-    end_block(fid, data_kind)
-    return new_start
+    return _RawPartPlan(buffers=buffers, stop=new_start, split=split)
 
 
 @fill_doc
@@ -3122,6 +3646,26 @@ def _write_raw_metadata(fid, info, data_type, reset_range, annotations):
         _write_annotations(fid, annotations)
 
 
+def _raw_buffer_dtype(fmt, is_complex):
+    """Get the FIFF type and on-disk dtype of raw buffers."""
+    _check_option("fmt", fmt, ["short", "int", "single", "double"])
+    if not is_complex:
+        return dict(
+            short=(FIFF.FIFFT_DAU_PACK16, np.dtype(">i2")),
+            int=(FIFF.FIFFT_INT, np.dtype(">i4")),
+            single=(FIFF.FIFFT_FLOAT, np.dtype(">f4")),
+            double=(FIFF.FIFFT_DOUBLE, np.dtype(">f8")),
+        )[fmt]
+    if fmt == "single":
+        return FIFF.FIFFT_COMPLEX_FLOAT, np.dtype(">c8")
+    elif fmt == "double":
+        return FIFF.FIFFT_COMPLEX_FLOAT, np.dtype(">c16")
+    else:
+        raise ValueError(
+            'only "single" and "double" supported for writing complex data'
+        )
+
+
 def _write_raw_buffer(fid, buf, cals, fmt):
     """Write raw buffer.
 
@@ -3138,37 +3682,40 @@ def _write_raw_buffer(fid, buf, cals, fmt):
         float for each item. This will be doubled for complex datatypes. Note
         that short and int formats cannot be used for complex data.
     """
-    if buf.shape[0] != len(cals):
-        raise ValueError("buffer and calibration sizes do not match")
+    _write_raw_buffers(fid, buf, cals, fmt, [0, buf.shape[1]])
 
-    _check_option("fmt", fmt, ["short", "int", "single", "double"])
 
-    cast_int = False  # allow unsafe cast
-    if np.isrealobj(buf):
-        if fmt == "short":
-            write_function = write_dau_pack16
-            cast_int = True
-        elif fmt == "int":
-            write_function = write_int
-            cast_int = True
-        elif fmt == "single":
-            write_function = write_float
-        else:
-            write_function = write_double
-    else:
-        if fmt == "single":
-            write_function = write_complex64
-        elif fmt == "double":
-            write_function = write_complex128
-        else:
-            raise ValueError(
-                'only "single" and "double" supported for writing complex data'
-            )
+def _write_raw_buffers(fid, buf, cals, fmt, bounds):
+    """Write consecutive raw buffers.
+
+    Parameters
+    ----------
+    fid : file descriptor
+        an open raw data file.
+    buf : array
+        The data of all buffers.
+    cals : array
+        Calibration factors.
+    fmt : str
+        The format, see :func:`_write_raw_buffer`.
+    bounds : array-like of int
+        The sample boundaries of the buffers within ``buf``.
+    """
+    if buf.shape[0] != len(cals):
+        raise ValueError("buffer and calibration sizes do not match")
 
+    fiff_type, dtype = _raw_buffer_dtype(fmt, np.iscomplexobj(buf))
+    # Calibrate and convert all buffers at once; the FIF layout is
+    # time-major, so each buffer is then a contiguous block of rows
     buf = buf / np.ravel(cals)[:, None]
-    if cast_int:
-        buf = buf.astype(np.int32)
-    write_function(fid, FIFF.FIFF_DATA_BUFFER, buf)
+    if fmt in ("short", "int"):
+        buf = buf.astype(np.int32)  # allow unsafe cast
+    buf = np.ascontiguousarray(buf.T, dtype=dtype)
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        this_buf = buf[first:last]
+        header = [FIFF.FIFF_DATA_BUFFER, fiff_type, this_buf.nbytes]
+        fid.write(np.array(header + [FIFF.FIFFV_NEXT_SEQ], dtype=">i4").tobytes())
+        fid.write(this_buf.tobytes())
 
 
 def _check_raw_compatibility(raw):
@@ -11,7 +11,7 @@ import numpy as np
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import read_meas_info
 from ..._fiff.open import _fiff_get_fid, _get_next_fname, fiff_open
-from ..._fiff.tag import _call_dict, read_tag
+from ..._fiff.tag import _call_dict, _simple_dict, read_tag
 from ..._fiff.tree import dir_tree_find
 from ..._fiff.utils import _mult_cal_one
 from ...annotations import Annotations, _read_annotations_fif
@@ -400,7 +400,9 @@ class Raw(BaseRaw):
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file."""
         n_bad = 0
-        with _fiff_get_fid(self._raw_extras[fi]["filename"]) as fid:
+        fname = self._raw_extras[fi]["filename"]
+        mmap = _raw_memmap(fname)
+        with _fiff_get_fid(fname) as fid:
             bounds = self._raw_extras[fi]["bounds"]
             ents = self._raw_extras[fi]["ent"]
             nchan = self._raw_extras[fi]["orig_nchan"]
@@ -420,10 +422,16 @@ class Raw(BaseRaw):
                 # only read data if it exists
                 if ent is None:
                     continue  # just use zeros for gaps
-                # faster to always read full tag, taking advantage of knowing the header
-                # already (cutting out some of read_tag) ...
-                fid.seek(ent.pos + 16, 0)
-                one = _call_dict[ent.type](fid, ent, shape=None, rlims=None)
+                if mmap is not None and ent.type in _simple_dict:
+                    # zero-copy view of the buffer, only the pages holding the
+                    # requested samples are actually read
+                    one = mmap[ent.pos + 16 : ent.pos + 16 + ent.size]
+                    one = one.view(_simple_dict[ent.type])
+                else:
+                    # faster to always read full tag, taking advantage of knowing
+                    # the header already (cutting out some of read_tag) ...
+                    fid.seek(ent.pos + 16, 0)
+                    one = _call_dict[ent.type](fid, ent, shape=None, rlims=None)
                 try:
                     one = _reshape_view(one, (nsamp, nchan))
                 except AttributeError:  # one is None
@@ -496,6 +504,16 @@ def _check_entry(first, nent):
         raise OSError("Could not read data, perhaps this is a corrupt file")
 
 
+def _raw_memmap(fname):
+    """Memory-map an uncompressed FIF file to read its raw data buffers."""
+    if not isinstance(fname, Path) or fname.suffix == ".gz":
+        return None
+    try:
+        return np.memmap(fname, dtype=np.uint8, mode="r")
+    except (OSError, ValueError):  # e.g., empty or not mappable
+        return None
+
+
 @fill_doc
 def read_raw_fif(
     fname, allow_maxshield=False, preload=False, on_split_missing="raise", verbose=None
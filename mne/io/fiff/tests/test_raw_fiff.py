@@ -18,6 +18,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose, assert_array_almost_equal, assert_array_equal
 
+import mne
 from mne import (
     compute_proj_raw,
     concatenate_events,
@@ -44,6 +45,7 @@ from mne.utils import (
     assert_and_remove_boundary_annot,
     assert_object_equal,
     catch_logging,
+    logger,
     requires_mne,
     run_subprocess,
 )
@@ -702,6 +704,57 @@ def test_split_files(tmp_path, mod, monkeypatch):
     assert not fname_3.is_file()
 
 
+@pytest.mark.parametrize("split_naming", ("neuromag", "bids"))
+@pytest.mark.parametrize("fmt", ("single", "short"))
+def test_split_files_parallel(tmp_path, monkeypatch, split_naming, fmt):
+    """Test writing split files in parallel."""
+    pytest.importorskip("joblib")
+    # make sure that data are read and written in several chunks
+    monkeypatch.setattr(base, "_WRITE_CHUNK_BYTES", 2**20)
+    rng = np.random.default_rng(0)
+    info = create_info(10, 1000.0, "eeg")
+    raw = RawArray(rng.integers(-1000, 1000, (10, 200000)) * 1e-7, info)
+    raw.set_annotations(
+        Annotations([20.0, 102.0], [10.0, 3.0], ["bad_acq_skip", "bad_acq_skip"])
+    )
+    fnames = list()
+    for n_jobs in (1, 3):
+        out_dir = tmp_path / str(n_jobs)
+        out_dir.mkdir()
+        fnames.append(
+            raw.save(
+                out_dir / "test_raw.fif",
+                buffer_size_sec=1.0,
+                split_size="2MB",
+                split_naming=split_naming,
+                fmt=fmt,
+                n_jobs=n_jobs,
+            )
+        )
+    assert len(fnames[0]) == len(fnames[1]) > 3
+    assert [f.name for f in fnames[0]] == [f.name for f in fnames[1]]
+    assert sorted(f.name for f in (tmp_path / "3").iterdir()) == sorted(
+        f.name for f in fnames[1]
+    )
+    for fname_1, fname_3 in zip(*fnames):
+        assert fname_1.stat().st_size == fname_3.stat().st_size
+    raw_1, raw_3 = read_raw_fif(fnames[0][0]), read_raw_fif(fnames[1][0])
+    assert len(raw_3.filenames) == len(fnames[1])
+    for extra_1, extra_3 in zip(raw_1._raw_extras, raw_3._raw_extras):
+        assert_array_equal(extra_1["bounds"], extra_3["bounds"])
+    assert raw_3.n_times == raw.n_times
+    assert_array_equal(raw_1.get_data(), raw_3.get_data())
+    assert_allclose(raw_3.get_data(), raw.get_data() * (raw_3.get_data() != 0))
+    assert (raw_3.get_data()[:, 20000:30000] == 0).all()
+    # writing the parts concurrently must not change the log level
+    level = logger.level
+    for ii in range(5):
+        out_dir = tmp_path / f"level_{ii}"
+        out_dir.mkdir()
+        raw.save(out_dir / "test_raw.fif", split_size="2MB", n_jobs=3)
+        assert logger.level == level
+
+
 def test_bids_split_files(tmp_path):
     """Test that BIDS split files are written safely."""
     mne_bids = pytest.importorskip("mne_bids")
@@ -1229,6 +1282,138 @@ def test_filter():
         assert raw_filt.info["highpass"] == wanted_l
 
 
+@pytest.mark.parametrize(
+    "method, phase",
+    [
+        ("fir", "zero"),
+        ("fir", "zero-double"),
+        ("fir", "minimum"),
+        ("iir", "zero"),
+        ("iir", "forward"),
+    ],
+)
+def test_filter_memmap(tmp_path, monkeypatch, method, phase):
+    """Test streamed filtering of non-preloaded data into a memmap."""
+    monkeypatch.setattr(mne.filter, "_STREAM_BLOCK_SEC", 0.5)
+    rng = np.random.default_rng(0)
+    info = create_info(4, 250.0, ["eeg"] * 3 + ["stim"])
+    raw = RawArray(rng.standard_normal((4, 10000)), info)
+    raw.set_annotations(Annotations([10.0, 25.0], [1.5, 0.0], ["bad_seg", "edge"]))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    kwargs = dict(method=method, phase=phase, skip_by_annotation=("edge", "bad"))
+    if method == "fir":
+        kwargs["pad"] = "reflect_limited"
+    want = read_raw_fif(fname, preload=True).filter(1.0, 40.0, **kwargs)
+    raw = read_raw_fif(fname)
+    out_fname = tmp_path / "filt.dat"
+    with catch_logging(verbose=True) as log:
+        raw.filter(1.0, 40.0, memmap=out_fname, verbose=True, **kwargs)
+    assert "Streaming the filter" in log.getvalue()
+    assert raw.preload
+    assert isinstance(raw._data, np.memmap)
+    assert out_fname.is_file()
+    assert raw.info["highpass"] == want.info["highpass"] == 1.0
+    assert raw.info["lowpass"] == want.info["lowpass"] == 40.0
+    # IIR zero-phase filters are only effectively finite
+    atol = 1e-7 if phase == "zero" and method == "iir" else 1e-12
+    assert_allclose(raw.get_data(), want.get_data(), atol=atol)
+    assert_array_equal(raw.get_data("stim"), want.get_data("stim"))
+
+    # notch filtering
+    want = read_raw_fif(fname, preload=True).notch_filter(50.0, **kwargs)
+    raw = read_raw_fif(fname).notch_filter(
+        50.0, memmap=tmp_path / "notch.dat", **kwargs
+    )
+    assert_allclose(raw.get_data(), want.get_data(), atol=atol)
+    if method == "fir" and phase == "zero":
+        for freqs in (50.0, None):
+            kwargs = dict(method="spectrum_fit", filter_length="4s")
+            want = read_raw_fif(fname, preload=True).notch_filter(freqs, **kwargs)
+            raw = read_raw_fif(fname).notch_filter(
+                freqs, memmap=tmp_path / "notch_mt.dat", **kwargs
+            )
+            assert_allclose(raw.get_data(), want.get_data(), atol=1e-12)
+    with pytest.raises(ValueError, match="only be filtered with method='spectrum_fit"):
+        read_raw_fif(fname).set_lazy().notch_filter(50.0, method="spectrum_fit")
+    with pytest.raises(RuntimeError, match="requires raw data to be loaded"):
+        read_raw_fif(fname).filter(1.0, 40.0)
+
+
+def test_filter_memmap_long_context(tmp_path, monkeypatch):
+    """Test that streamed blocks stay bounded for slowly decaying filters."""
+    monkeypatch.setattr(mne.filter, "_STREAM_BLOCK_SEC", 0.5)
+    monkeypatch.setattr(mne.filter, "_STREAM_MAX_BLOCK_SEC", 1.0)
+    rng = np.random.default_rng(0)
+    info = create_info(2, 250.0, "eeg")
+    raw = RawArray(rng.standard_normal((2, 10000)), info)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    kwargs = dict(method="iir", iir_params=dict(order=8, ftype="butter"))
+    want = read_raw_fif(fname, preload=True).filter(0.5, None, **kwargs)
+    raw = read_raw_fif(fname)
+    with pytest.warns(RuntimeWarning, match="longer than the blocks themselves"):
+        with catch_logging(verbose=True) as log:
+            raw.filter(0.5, None, memmap=tmp_path / "filt.dat", verbose=True, **kwargs)
+    assert "over blocks of 250 samples" in log.getvalue()
+    assert_allclose(raw.get_data(), want.get_data(), atol=1e-7)
+
+
+def test_set_lazy(tmp_path, monkeypatch):
+    """Test deferring operations on non-preloaded data."""
+    monkeypatch.setattr(mne.filter, "_STREAM_BLOCK_SEC", 0.5)
+    rng = np.random.default_rng(0)
+    info = create_info(6, 250.0, ["eeg"] * 5 + ["stim"])
+    raw = RawArray(rng.standard_normal((6, 10000)), info)
+    raw.set_annotations(Annotations([10.0, 25.0], [1.5, 0.0], ["bad_seg", "edge"]))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+
+    def _process(raw):
+        raw.crop(2, 35).pick([0, 1, 2, 3, 5])
+        raw.filter(1.0, 40.0, skip_by_annotation=("edge", "bad"))
+        raw.notch_filter(50.0, method="iir")
+        raw.set_eeg_reference(["1"])
+        return raw.filter(None, 30.0, method="iir", phase="forward")
+
+    want = _process(read_raw_fif(fname, preload=True))
+    raw = _process(read_raw_fif(fname).set_lazy())
+    assert not raw.preload
+    assert len(raw._lazy_ops) == 4
+    assert raw.info["lowpass"] == want.info["lowpass"] == 30.0
+    assert raw.info["custom_ref_applied"] == want.info["custom_ref_applied"]
+    # IIR filters are only effectively finite
+    atol = 1e-9
+    assert_allclose(
+        raw.get_data(start=100, stop=3000),
+        want.get_data(start=100, stop=3000),
+        atol=atol,
+    )
+    assert_allclose(raw[1:3, 4000:6000][0], want[1:3, 4000:6000][0], atol=atol)
+    with pytest.raises(RuntimeError, match="raw.crop with deferred"):
+        raw.crop(1, 2)
+    with pytest.raises(RuntimeError, match="Adding, dropping, or reordering"):
+        raw.pick([0, 1])
+    # resampling reads (and so processes) all of the data
+    raw_res = raw.copy().resample(100.0)
+    assert raw_res._lazy_ops == []
+    assert_allclose(
+        raw_res.get_data(), want.copy().resample(100.0).get_data(), atol=atol
+    )
+    raw.load_data()
+    assert raw._lazy_ops == []
+    assert_allclose(raw.get_data(), want.get_data(), atol=atol)
+
+    # without opting in the data must be loaded
+    with pytest.raises(RuntimeError, match="requires raw data to be loaded"):
+        read_raw_fif(fname).set_lazy(False).filter(1.0, 40.0)
+    # projection-based references need no data, preloaded data are processed now
+    raw = read_raw_fif(fname).set_lazy().set_eeg_reference(projection=True)
+    assert raw._lazy_ops == []
+    raw = read_raw_fif(fname, preload=True).set_lazy().filter(1.0, 40.0)
+    assert raw._lazy_ops == []
+
+
 def test_filter_picks():
     """Test filtering default channel picks."""
     ch_types = [
@@ -1990,6 +2175,29 @@ def test_equalize_channels():
         assert ch_names == e.ch_names
 
 
+@pytest.mark.parametrize("fmt", ("single", "double", "short", "int"))
+def test_read_buffers_memmap(tmp_path, monkeypatch, fmt):
+    """Test reading raw buffers through a memory map."""
+    rng = np.random.default_rng(0)
+    info = create_info(["a", "b", "c", "d"], 1000.0, ["eeg"] * 3 + ["stim"])
+    data = rng.integers(-100, 100, (4, 3500)) * 1e-6
+    data[3] = rng.integers(0, 5, 3500)
+    raw = RawArray(data, info)
+    fnames = [tmp_path / "test_raw.fif", tmp_path / "test_raw.fif.gz"]
+    for fname in fnames:
+        raw.save(fname, fmt=fmt, buffer_size_sec=1.0)
+    want = read_raw_fif(fnames[1]).get_data()
+    if fmt in ("single", "double"):
+        assert_allclose(want, data, rtol=1e-6)
+    # without the generic tag readers only the memory map can read the data
+    monkeypatch.setattr(mne.io.fiff.raw, "_call_dict", dict())
+    raw_read = read_raw_fif(fnames[0])
+    assert_array_equal(raw_read.get_data(["a", "d"], 500, 2500), want[::3, 500:2500])
+    assert_array_equal(raw_read.get_data(), want)
+    with pytest.raises(KeyError):
+        read_raw_fif(fnames[1]).get_data()
+
+
 def test_memmap(tmp_path):
     """Test some interesting memmapping cases."""
     # concatenate_raw
@@ -1,9 +1,11 @@
 __all__ = [
     "INVERSE_METHODS",
+    "InverseKernel",
     "InverseOperator",
     "apply_inverse",
     "apply_inverse_cov",
     "apply_inverse_epochs",
+    "apply_inverse_labels",
     "apply_inverse_raw",
     "apply_inverse_tfr_epochs",
     "compute_rank_inverse",
@@ -12,9 +14,11 @@ __all__ = [
     "estimate_snr",
     "get_cross_talk",
     "get_point_spread",
+    "make_inverse_kernel",
     "make_inverse_operator",
     "make_inverse_resolution_matrix",
     "prepare_inverse_operator",
+    "read_inverse_kernel",
     "read_inverse_operator",
     "resolution_metrics",
     "source_band_induced_power",
@@ -23,16 +27,20 @@ __all__ = [
 ]
 from .inverse import (
     INVERSE_METHODS,
+    InverseKernel,
     InverseOperator,
     apply_inverse,
     apply_inverse_cov,
     apply_inverse_epochs,
+    apply_inverse_labels,
     apply_inverse_raw,
     apply_inverse_tfr_epochs,
     compute_rank_inverse,
     estimate_snr,
+    make_inverse_kernel,
     make_inverse_operator,
     prepare_inverse_operator,
+    read_inverse_kernel,
     read_inverse_operator,
     write_inverse_operator,
 )
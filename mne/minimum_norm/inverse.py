@@ -6,9 +6,10 @@ from copy import deepcopy
 from math import sqrt
 
 import numpy as np
-from scipy import linalg
+from scipy import linalg, sparse
 from scipy.stats import chi2
 
+from .._fiff.compensator import get_current_comp
 from .._fiff.constants import FIFF
 from .._fiff.matrix import (
     _read_named_matrix,
@@ -39,6 +40,7 @@ from .._fiff.write import (
 from ..cov import Covariance, _read_cov, _write_cov, compute_whitener, prepare_noise_cov
 from ..epochs import BaseEpochs, EpochsArray
 from ..evoked import Evoked, EvokedArray
+from ..filter import _stream_block_len
 from ..fixes import _reshape_view, _safe_svd
 from ..forward import (
     _read_forward_meas_info,
@@ -51,7 +53,14 @@ from ..forward import (
 from ..forward.forward import _triage_loose, write_forward_meas_info
 from ..html_templates import _get_html_template
 from ..io import BaseRaw
-from ..source_estimate import _get_src_type, _make_stc
+from ..source_estimate import (
+    _check_extraction_mode,
+    _get_src_type,
+    _label_funcs,
+    _make_stc,
+    _prepare_extraction_labels,
+    _prepare_label_extraction,
+)
 from ..source_space._source_space import (
     _get_src_nn,
     _get_vertno,
@@ -69,6 +78,8 @@ from ..utils import (
     _check_fname,
     _check_option,
     _check_src_normal,
+    _ensure_int,
+    _import_h5io_funcs,
     _validate_type,
     _verbose_safe_false,
     check_fname,
@@ -906,6 +917,441 @@ def _subject_from_inverse(inverse_operator):
     return inverse_operator["src"]._subject
 
 
+_INVERSE_KERNEL_ATTRIBUTES = (  # used in writing
+    "kernel",
+    "noise_norm",
+    "vertices",
+    "source_nn",
+    "src_type",
+    "subject",
+    "ch_names",
+    "comp_grade",
+    "method",
+    "lambda2",
+    "nave",
+    "pick_ori",
+    "source_ori",
+)
+
+
+class InverseKernel:
+    """An inverse operator assembled for a given method and regularization.
+
+    .. note::
+        This class should not be instantiated directly via
+        ``mne.minimum_norm.InverseKernel(...)``. Instead, use one of the
+        functions listed in the See Also section below.
+
+    Preparing an inverse operator and assembling its kernel only depend on
+    the inverse parameters, not on the data. The kernel can thus be made once
+    (and saved to disk) and applied to many datasets, which is then a single
+    matrix product followed by the combination of the current components for
+    free orientations.
+
+    Parameters
+    ----------
+    kernel : array, shape (n_dipoles, n_channels)
+        The imaging kernel.
+    noise_norm : array, shape (n_sources, 1) | None
+        The noise normalization of dSPM and sLORETA, applied after the current
+        components are combined.
+    vertices : list of array
+        The vertices of the source estimates.
+    source_nn : array, shape (n_dipoles, 3)
+        The orientations of the dipoles.
+    src_type : str
+        The type of the source space.
+    subject : str | None
+        The subject of the inverse operator.
+    ch_names : list of str
+        The channels the kernel is applied to, in order.
+    comp_grade : int
+        The compensation grade of the inverse operator.
+    method : "MNE" | "dSPM" | "sLORETA" | "eLORETA"
+        The inverse method.
+    lambda2 : float
+        The regularization parameter.
+    nave : int
+        The number of averages the noise covariance was scaled to.
+    pick_ori : None | "normal" | "vector"
+        The orientation that was picked.
+    source_ori : int
+        The source orientation of the inverse operator.
+
+    See Also
+    --------
+    make_inverse_kernel
+    read_inverse_kernel
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+
+    def __init__(
+        self,
+        kernel,
+        noise_norm,
+        vertices,
+        source_nn,
+        src_type,
+        subject,
+        ch_names,
+        comp_grade,
+        method,
+        lambda2,
+        nave,
+        pick_ori,
+        source_ori,
+    ):
+        self.kernel = kernel
+        self.noise_norm = noise_norm
+        self.vertices = vertices
+        self.source_nn = source_nn
+        self.src_type = src_type
+        self.subject = subject
+        self.ch_names = list(ch_names)
+        self.comp_grade = int(comp_grade)
+        self.method = method
+        self.lambda2 = float(lambda2)
+        self.nave = int(nave)
+        self.pick_ori = pick_ori
+        self.source_ori = int(source_ori)
+
+    def __repr__(self):  # noqa: D105
+        n_sources = sum(len(v) for v in self.vertices)
+        s = f"{self.method}, lambda2 : {self.lambda2:g}, nave : {self.nave}"
+        s += f", pick_ori : {self.pick_ori}"
+        s += f", {n_sources} sources x {len(self.ch_names)} channels"
+        return f"<InverseKernel | {s}>"
+
+    @property
+    def _is_free_ori(self):
+        return self.source_ori == FIFF.FIFFV_MNE_FREE_ORI and self.pick_ori != "normal"
+
+    @verbose
+    def apply(
+        self,
+        inst,
+        *,
+        start=None,
+        stop=None,
+        buffer_size=None,
+        return_generator=False,
+        verbose=None,
+    ):
+        """Apply the kernel to data.
+
+        Parameters
+        ----------
+        inst : instance of Evoked | Raw | Epochs
+            The data. The number of averages of Evoked data is not taken into
+            account, the one of the kernel is used.
+        start : int | None
+            Index of first time sample of Raw (index not time is seconds).
+        stop : int | None
+            Index of first time sample of Raw not to include (index not time is
+            seconds).
+        buffer_size : int | None
+            If not None, the kernel is applied to Raw data in segments of
+            ``buffer_size`` samples. See :func:`apply_inverse_raw`.
+        return_generator : bool
+            If True and ``inst`` is an Epochs instance, return a generator
+            instead of a list.
+        %(verbose)s
+
+        Returns
+        -------
+        stc : SourceEstimate | VectorSourceEstimate | VolSourceEstimate | list
+            The source estimate of Evoked or Raw data, or a list (or generator)
+            of the source estimates of each epoch.
+        """
+        _validate_type(
+            inst, (Evoked, BaseRaw, BaseEpochs), "inst", "Evoked, Raw, or Epochs"
+        )
+        sel = self._check_data(inst)
+        if isinstance(inst, Evoked):
+            return self._apply_evoked(inst, sel)
+        elif isinstance(inst, BaseRaw):
+            return self._apply_raw(inst, sel, start, stop, None, buffer_size)
+        stcs = self._gen_apply_epochs(inst, sel)
+        if not return_generator:
+            stcs = list(stcs)
+        return stcs
+
+    def _check_data(self, inst):
+        """Check the data and pick the channels of the kernel."""
+        _check_reference(inst, self.ch_names)
+        missing_ch_names = sorted(set(self.ch_names) - set(inst.ch_names))
+        if len(missing_ch_names):
+            raise ValueError(
+                f"{len(missing_ch_names)} channels in inverse operator "
+                f"are not present in the data ({missing_ch_names})"
+            )
+        comp_grade = get_current_comp(inst.info) or 0
+        if comp_grade != self.comp_grade:
+            raise RuntimeError(
+                f"Compensation grade of inverse ({self.comp_grade}) and data "
+                f"({comp_grade}) do not match"
+            )
+        return [inst.ch_names.index(name) for name in self.ch_names]
+
+    def _make_stc(self, sol, tmin, tstep):
+        return _make_stc(
+            sol,
+            self.vertices,
+            tmin=tmin,
+            tstep=tstep,
+            subject=self.subject,
+            vector=(self.pick_ori == "vector"),
+            source_nn=self.source_nn,
+            src_type=self.src_type,
+        )
+
+    def _apply_evoked(self, evoked, sel):
+        """Apply the kernel to evoked data."""
+        sol = np.dot(self.kernel, evoked.data[sel])  # apply imaging kernel
+        is_free_ori = self._is_free_ori
+        if is_free_ori and self.pick_ori != "vector":
+            logger.info("    Combining the current components...")
+            sol = combine_xyz(sol)
+
+        noise_norm = self.noise_norm
+        if noise_norm is not None:
+            logger.info(f"    {self.method}...")
+            if is_free_ori and self.pick_ori == "vector":
+                noise_norm = noise_norm.repeat(3, axis=0)
+            sol *= noise_norm
+
+        tstep = 1.0 / evoked.info["sfreq"]
+        tmin = float(evoked.times[0])
+        return self._make_stc(sol, tmin=tmin, tstep=tstep)
+
+    def _apply_raw(self, raw, sel, start, stop, time_func, buffer_size):
+        """Apply the kernel to raw data."""
+        data, times = raw[sel, start:stop]
+
+        if time_func is not None:
+            data = time_func(data)
+
+        K, noise_norm, pick_ori = self.kernel, self.noise_norm, self.pick_ori
+        is_free_ori = self._is_free_ori
+
+        if buffer_size is not None and is_free_ori:
+            # Process the data in segments to conserve memory
+            n_seg = int(np.ceil(data.shape[1] / float(buffer_size)))
+            logger.info(
+                "    computing inverse and combining the current "
+                "components (using %d segments)...",
+                n_seg,
+            )
+
+            # Allocate space for inverse solution
+            n_times = data.shape[1]
+
+            n_dipoles = K.shape[0] if pick_ori == "vector" else K.shape[0] // 3
+            sol = np.empty((n_dipoles, n_times), dtype=np.result_type(K, data))
+
+            for pos in range(0, n_times, buffer_size):
+                sol_chunk = np.dot(K, data[:, pos : pos + buffer_size])
+                if pick_ori != "vector":
+                    sol_chunk = combine_xyz(sol_chunk)
+                sol[:, pos : pos + buffer_size] = sol_chunk
+
+                logger.info(
+                    "        segment %d / %d done..", pos / buffer_size + 1, n_seg
+                )
+        else:
+            sol = np.dot(K, data)
+            if is_free_ori and pick_ori != "vector":
+                logger.info("    combining the current components...")
+                sol = combine_xyz(sol)
+        if noise_norm is not None:
+            if pick_ori == "vector" and is_free_ori:
+                noise_norm = noise_norm.repeat(3, axis=0)
+            sol *= noise_norm
+
+        tmin = float(times[0])
+        tstep = 1.0 / raw.info["sfreq"]
+        return self._make_stc(sol, tmin=tmin, tstep=tstep)
+
+    def _gen_apply_epochs(self, epochs, sel):
+        """Generate the source estimates of each epoch."""
+        tstep = 1.0 / epochs.info["sfreq"]
+        tmin = epochs.times[0]
+
+        K, noise_norm, pick_ori = self.kernel, self.noise_norm, self.pick_ori
+        is_free_ori = self._is_free_ori
+
+        if pick_ori == "vector" and noise_norm is not None:
+            noise_norm = noise_norm.repeat(3, axis=0)
+
+        if not is_free_ori and noise_norm is not None:
+            # premultiply kernel with noise normalization
+            K = K * noise_norm
+
+        try:
+            total = f" / {len(epochs)}"  # len not always defined
+        except RuntimeError:
+            total = f" / {len(epochs.events)} (at most)"
+        for k, e in enumerate(epochs):
+            logger.info("Processing epoch : %d%s", k + 1, total)
+            if is_free_ori:
+                # Compute solution and combine current components (non-linear)
+                sol = np.dot(K, e[sel])  # apply imaging kernel
+
+                if pick_ori != "vector":
+                    logger.info("combining the current components...")
+                    sol = combine_xyz(sol)
+
+                if noise_norm is not None:
+                    sol *= noise_norm
+            else:
+                # Linear inverse: do computation here or delayed
+                if len(sel) < K.shape[1]:
+                    sol = (K, e[sel])
+                else:
+                    sol = np.dot(K, e[sel])
+
+            yield self._make_stc(sol, tmin=tmin, tstep=tstep)
+
+        logger.info("[done]")
+
+    @verbose
+    def save(self, fname, overwrite=False, verbose=None):
+        """Save the inverse kernel to a file.
+
+        Parameters
+        ----------
+        fname : path-like
+            The path to the file. ``'-kernel.h5'`` will be added if fname does
+            not end with ``'.h5'``.
+        %(overwrite)s
+        %(verbose)s
+        """
+        _, write_hdf5 = _import_h5io_funcs()
+        fname = _check_fname(fname, overwrite=overwrite, must_exist=False)
+        if fname.suffix != ".h5":
+            fname = fname.with_name(f"{fname.name}-kernel.h5")
+        out_dict = {k: getattr(self, k) for k in _INVERSE_KERNEL_ATTRIBUTES}
+        write_hdf5(fname, out_dict, overwrite=overwrite)
+
+
+def read_inverse_kernel(fname):
+    """Load an inverse kernel from a file.
+
+    Parameters
+    ----------
+    fname : path-like
+        Path to the file containing the inverse kernel.
+
+    Returns
+    -------
+    kernel : instance of InverseKernel
+        The loaded inverse kernel.
+
+    See Also
+    --------
+    make_inverse_kernel
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    read_hdf5, _ = _import_h5io_funcs()
+    fname = _check_fname(fname, overwrite="read", must_exist=True)
+    return InverseKernel(**read_hdf5(fname))
+
+
+def _make_inverse_kernel(inv, lambda2, method, pick_ori, label, use_cps):
+    """Assemble the kernel of a prepared inverse operator."""
+    K, noise_norm, vertno, source_nn = _assemble_kernel(
+        inv, label, method, pick_ori, use_cps=use_cps
+    )
+    return InverseKernel(
+        K,
+        noise_norm,
+        vertno,
+        source_nn,
+        _get_src_type(inv["src"], vertno),
+        _subject_from_inverse(inv),
+        inv["noise_cov"].ch_names,
+        get_current_comp(inv["info"]) or 0,
+        method,
+        lambda2,
+        inv["nave"],
+        pick_ori,
+        inv["source_ori"],
+    )
+
+
+@verbose
+def make_inverse_kernel(
+    inverse_operator,
+    lambda2,
+    method="dSPM",
+    *,
+    nave=1,
+    pick_ori=None,
+    label=None,
+    prepared=False,
+    method_params=None,
+    use_cps=True,
+    verbose=None,
+):
+    """Assemble an inverse operator into a kernel that can be applied repeatedly.
+
+    Parameters
+    ----------
+    inverse_operator : instance of InverseOperator
+        Inverse operator.
+    lambda2 : float
+        The regularization parameter.
+    method : "MNE" | "dSPM" | "sLORETA" | "eLORETA"
+        Use minimum norm, dSPM (default), sLORETA, or eLORETA.
+    nave : int
+        Number of averages used to regularize the solution. Set to 1 (default)
+        for raw data and single epochs, and to ``evoked.nave`` for evoked data.
+    %(pick_ori)s
+    label : Label | None
+        Restricts the source estimates to a given label. If None,
+        source estimates will be computed for the entire source space.
+    prepared : bool
+        If True, do not call :func:`prepare_inverse_operator`.
+    method_params : dict | None
+        Additional options for eLORETA. See Notes of :func:`apply_inverse`.
+    %(use_cps_restricted)s
+    %(verbose)s
+
+    Returns
+    -------
+    kernel : instance of InverseKernel
+        The inverse kernel.
+
+    See Also
+    --------
+    InverseKernel
+    read_inverse_kernel
+    apply_inverse
+
+    Notes
+    -----
+    Applying the kernel with :meth:`InverseKernel.apply` gives the same result
+    as :func:`apply_inverse`, :func:`apply_inverse_raw` or
+    :func:`apply_inverse_epochs` with the same parameters, without preparing
+    the inverse operator and assembling its kernel again.
+
+    .. versionadded:: 1.13
+    """
+    _check_option("method", method, INVERSE_METHODS)
+    _check_ori(pick_ori, inverse_operator["source_ori"], inverse_operator["src"])
+    inv = _check_or_prepare(
+        inverse_operator, nave, lambda2, method, method_params, prepared, copy="non-src"
+    )
+    logger.info("Assembling the inverse kernel...")
+    return _make_inverse_kernel(inv, lambda2, method, pick_ori, label, use_cps)
+
+
 @verbose
 def apply_inverse(
     evoked,
@@ -1071,10 +1517,8 @@ def _apply_inverse(
     logger.info(f'Applying inverse operator to "{evoked.comment}"...')
     logger.info("    Picked %d channels from the data", len(sel))
     logger.info("    Computing inverse...")
-    K, noise_norm, vertno, source_nn = _assemble_kernel(
-        inv, label, method, pick_ori, use_cps=use_cps
-    )
-    sol = np.dot(K, evoked.data[sel])  # apply imaging kernel
+    inv_kernel = _make_inverse_kernel(inv, lambda2, method, pick_ori, label, use_cps)
+    stc = inv_kernel._apply_evoked(evoked, sel)
     logger.info("    Computing residual...")
     # x̂(t) = G ĵ(t) = C ** 1/2 U Π w(t)
     # where the diagonal matrix Π has elements πk = λk γk
@@ -1090,32 +1534,6 @@ def _apply_inverse(
     if return_residual:
         residual = evoked.copy()
         residual.data[sel] -= data_est
-    is_free_ori = inv["source_ori"] == FIFF.FIFFV_MNE_FREE_ORI and pick_ori != "normal"
-
-    if is_free_ori and pick_ori != "vector":
-        logger.info("    Combining the current components...")
-        sol = combine_xyz(sol)
-
-    if noise_norm is not None:
-        logger.info(f"    {method}...")
-        if is_free_ori and pick_ori == "vector":
-            noise_norm = noise_norm.repeat(3, axis=0)
-        sol *= noise_norm
-
-    tstep = 1.0 / evoked.info["sfreq"]
-    tmin = float(evoked.times[0])
-    subject = _subject_from_inverse(inv)
-    src_type = _get_src_type(inv["src"], vertno)
-    stc = _make_stc(
-        sol,
-        vertno,
-        tmin=tmin,
-        tstep=tstep,
-        subject=subject,
-        vector=(pick_ori == "vector"),
-        source_nn=source_nn,
-        src_type=src_type,
-    )
 
     return (stc, residual) if return_residual else stc
 
@@ -1215,85 +1633,26 @@ def apply_inverse_raw(
     logger.info("    Picked %d channels from the data", len(sel))
     logger.info("    Computing inverse...")
 
-    data, times = raw[sel, start:stop]
-
-    if time_func is not None:
-        data = time_func(data)
-
-    K, noise_norm, vertno, source_nn = _assemble_kernel(
-        inv, label, method, pick_ori, use_cps
-    )
-
-    is_free_ori = (
-        inverse_operator["source_ori"] == FIFF.FIFFV_MNE_FREE_ORI
-        and pick_ori != "normal"
-    )
-
-    if buffer_size is not None and is_free_ori:
-        # Process the data in segments to conserve memory
-        n_seg = int(np.ceil(data.shape[1] / float(buffer_size)))
-        logger.info(
-            "    computing inverse and combining the current "
-            "components (using %d segments)...",
-            n_seg,
-        )
-
-        # Allocate space for inverse solution
-        n_times = data.shape[1]
-
-        n_dipoles = K.shape[0] if pick_ori == "vector" else K.shape[0] // 3
-        sol = np.empty((n_dipoles, n_times), dtype=np.result_type(K, data))
-
-        for pos in range(0, n_times, buffer_size):
-            sol_chunk = np.dot(K, data[:, pos : pos + buffer_size])
-            if pick_ori != "vector":
-                sol_chunk = combine_xyz(sol_chunk)
-            sol[:, pos : pos + buffer_size] = sol_chunk
-
-            logger.info("        segment %d / %d done..", pos / buffer_size + 1, n_seg)
-    else:
-        sol = np.dot(K, data)
-        if is_free_ori and pick_ori != "vector":
-            logger.info("    combining the current components...")
-            sol = combine_xyz(sol)
-    if noise_norm is not None:
-        if pick_ori == "vector" and is_free_ori:
-            noise_norm = noise_norm.repeat(3, axis=0)
-        sol *= noise_norm
-
-    tmin = float(times[0])
-    tstep = 1.0 / raw.info["sfreq"]
-    subject = _subject_from_inverse(inverse_operator)
-    src_type = _get_src_type(inverse_operator["src"], vertno)
-    stc = _make_stc(
-        sol,
-        vertno,
-        tmin=tmin,
-        tstep=tstep,
-        subject=subject,
-        vector=(pick_ori == "vector"),
-        source_nn=source_nn,
-        src_type=src_type,
-    )
+    inv_kernel = _make_inverse_kernel(inv, lambda2, method, pick_ori, label, use_cps)
+    stc = inv_kernel._apply_raw(raw, sel, start, stop, time_func, buffer_size)
     logger.info("[done]")
 
     return stc
 
 
-def _apply_inverse_epochs_gen(
+def _prepare_epochs_kernel(
     epochs,
     inverse_operator,
     lambda2,
-    method="dSPM",
-    label=None,
-    nave=1,
-    pick_ori=None,
-    prepared=False,
-    method_params=None,
-    use_cps=True,
-    verbose=None,
+    method,
+    label,
+    nave,
+    pick_ori,
+    prepared,
+    method_params,
+    use_cps,
 ):
-    """Generate inverse solutions for epochs. Used in apply_inverse_epochs."""
+    """Check the epochs and assemble the kernel to apply to them."""
     _validate_type(epochs, BaseEpochs, "epochs")
     _check_reference(epochs, inverse_operator["info"]["ch_names"])
     _check_option("method", method, INVERSE_METHODS)
@@ -1313,61 +1672,36 @@ def _apply_inverse_epochs_gen(
     sel = _pick_channels_inverse_operator(epochs.ch_names, inv)
     logger.info("Picked %d channels from the data", len(sel))
     logger.info("Computing inverse...")
-    K, noise_norm, vertno, source_nn = _assemble_kernel(
-        inv, label, method, pick_ori, use_cps
-    )
-
-    tstep = 1.0 / epochs.info["sfreq"]
-    tmin = epochs.times[0]
-
-    is_free_ori = not (is_fixed_orient(inverse_operator) or pick_ori == "normal")
-
-    if pick_ori == "vector" and noise_norm is not None:
-        noise_norm = noise_norm.repeat(3, axis=0)
-
-    if not is_free_ori and noise_norm is not None:
-        # premultiply kernel with noise normalization
-        K *= noise_norm
-
-    subject = _subject_from_inverse(inverse_operator)
-    try:
-        total = f" / {len(epochs)}"  # len not always defined
-    except RuntimeError:
-        total = f" / {len(epochs.events)} (at most)"
-    for k, e in enumerate(epochs):
-        logger.info("Processing epoch : %d%s", k + 1, total)
-        if is_free_ori:
-            # Compute solution and combine current components (non-linear)
-            sol = np.dot(K, e[sel])  # apply imaging kernel
+    return _make_inverse_kernel(inv, lambda2, method, pick_ori, label, use_cps), sel
 
-            if pick_ori != "vector":
-                logger.info("combining the current components...")
-                sol = combine_xyz(sol)
-
-            if noise_norm is not None:
-                sol *= noise_norm
-        else:
-            # Linear inverse: do computation here or delayed
-            if len(sel) < K.shape[1]:
-                sol = (K, e[sel])
-            else:
-                sol = np.dot(K, e[sel])
-
-        src_type = _get_src_type(inverse_operator["src"], vertno)
-        stc = _make_stc(
-            sol,
-            vertno,
-            tmin=tmin,
-            tstep=tstep,
-            subject=subject,
-            vector=(pick_ori == "vector"),
-            source_nn=source_nn,
-            src_type=src_type,
-        )
 
-        yield stc
-
-    logger.info("[done]")
+def _apply_inverse_epochs_gen(
+    epochs,
+    inverse_operator,
+    lambda2,
+    method="dSPM",
+    label=None,
+    nave=1,
+    pick_ori=None,
+    prepared=False,
+    method_params=None,
+    use_cps=True,
+    verbose=None,
+):
+    """Generate inverse solutions for epochs. Used in apply_inverse_epochs."""
+    inv_kernel, sel = _prepare_epochs_kernel(
+        epochs,
+        inverse_operator,
+        lambda2,
+        method,
+        label,
+        nave,
+        pick_ori,
+        prepared,
+        method_params,
+        use_cps,
+    )
+    yield from inv_kernel._gen_apply_epochs(epochs, sel)
 
 
 @verbose
@@ -1451,6 +1785,306 @@ def apply_inverse_epochs(
     return stcs
 
 
+def _prepare_label_inverse(
+    inv, labels, method, mode, pick_ori, allow_empty, mri_resolution, use_cps
+):
+    """Assemble the kernel rows needed to compute label time courses.
+
+    The labels are resolved against the source space of the inverse, and for
+    linear modes the rows of each label are reduced to a single kernel row.
+    """
+    K, noise_norm, vertno, _ = _assemble_kernel(inv, None, method, pick_ori, use_cps)
+    is_free_ori = inv["source_ori"] == FIFF.FIFFV_MNE_FREE_ORI and pick_ori != "normal"
+    if not is_free_ori and noise_norm is not None:
+        K *= noise_norm
+        noise_norm = None
+    src = inv["src"]
+    nvert = np.array([len(v) for v in vertno])
+    # a single-sample estimate to check the mode and the labels against
+    stc = _make_stc(
+        np.zeros((nvert.sum(), 1)),
+        vertno,
+        src_type=_get_src_type(src, vertno),
+        tmin=0.0,
+        tstep=1.0,
+        subject=_subject_from_inverse(inv),
+    )
+    labels, use_sparse, n_mean = _prepare_extraction_labels(
+        labels, src, mode, mri_resolution
+    )
+    mode = _check_extraction_mode(stc, mode)
+    label_vertidx, label_flip = _prepare_label_extraction(
+        stc, labels, src, mode, allow_empty, use_sparse
+    )
+    modes = [mode] * len(label_vertidx)
+    # the volumes of a mixed source space are averaged
+    offset = nvert[:-n_mean].sum()  # effectively :2 or :0
+    for nv in nvert[2:]:
+        label_vertidx.append(np.arange(offset, offset + nv) if nv else None)
+        label_flip.append(None)
+        modes.append("mean")
+        offset += nv
+    del stc
+
+    entries = list()
+    for vertidx, flip, this_mode in zip(label_vertidx, label_flip, modes):
+        if vertidx is None:
+            entries.append(None)
+            continue
+        if isinstance(vertidx, sparse.csr_array):
+            used = np.unique(vertidx.indices)
+            weights = vertidx[:, used]
+        else:
+            used, weights = vertidx, None
+        entry = dict(mode=this_mode, flip=flip, weights=None, noise_norm=None)
+        if is_free_ori:
+            # the current components are combined before the label is reduced
+            entry["kernel"] = K[(3 * used[:, np.newaxis] + np.arange(3)).ravel()]
+            entry["weights"] = weights
+            if noise_norm is not None:
+                entry["noise_norm"] = noise_norm[used]
+        else:
+            entry["kernel"] = K[used] if weights is None else weights @ K[used]
+            if this_mode in ("mean", "mean_flip"):
+                entry["kernel"] = _label_funcs[this_mode](flip, entry["kernel"])[
+                    np.newaxis
+                ]
+                entry["mode"] = "reduced"
+        entries.append(entry)
+    logger.info("    Assembled the kernel of %d labels (mode: %s)", len(entries), mode)
+    return dict(entries=entries, free=is_free_ori)
+
+
+def _label_inverse_data(plan, data):
+    """Compute the source data of each label for a block of sensor data."""
+    entries = [entry for entry in plan["entries"] if entry is not None]
+    sol = np.concatenate([entry["kernel"] for entry in entries]) @ data
+    out = list()
+    start = 0
+    for entry in entries:
+        stop = start + len(entry["kernel"])
+        this_sol = sol[start:stop]
+        start = stop
+        if plan["free"]:
+            this_sol = combine_xyz(this_sol)
+            if entry["noise_norm"] is not None:
+                this_sol *= entry["noise_norm"]
+            if entry["weights"] is not None:
+                this_sol = entry["weights"] @ this_sol
+        out.append(this_sol)
+    return out
+
+
+def _label_pca_row(gram, flip):
+    """Get the weights of the first principal component of label data."""
+    # Same as _pca_flip, from the Gram matrix of the label data: the first
+    # right-singular vector is u @ data / s with u, s ** 2 from eigh(gram)
+    eigval, eigvec = np.linalg.eigh(gram)
+    if eigval[-1] <= 0:
+        return np.zeros(len(gram))
+    u = eigvec[:, -1]
+    sign = np.sign(np.dot(u, flip.ravel()))
+    scale = np.sqrt(eigval.clip(0).sum()) / np.sqrt(len(gram))
+    return sign * scale / np.sqrt(eigval[-1]) * u
+
+
+def _label_inverse_tc(plan, gen_data, n_times, dtype):
+    """Compute label time courses from blocks of sensor data.
+
+    ``gen_data`` is called for each pass over the blocks, which are read twice
+    for mode="pca_flip".
+    """
+    entries = list(plan["entries"])
+    use = [ii for ii, entry in enumerate(entries) if entry is not None]
+    pca = [ii for ii in use if entries[ii]["mode"] == "pca_flip"]
+    if len(pca):
+        # first pass: accumulate the Gram matrices of the label data
+        grams = dict()
+        if plan["free"]:
+            for _, data in gen_data():
+                for ii, this_sol in zip(use, _label_inverse_data(plan, data)):
+                    if ii in pca:
+                        grams[ii] = grams.get(ii, 0.0) + this_sol @ this_sol.T
+        else:
+            # linear: the label Gram matrices follow from the sensor one
+            gram = 0.0
+            for _, data in gen_data():
+                gram = gram + data @ data.T
+            for ii in pca:
+                kernel = entries[ii]["kernel"]
+                grams[ii] = kernel @ gram @ kernel.T
+        for ii in pca:
+            row = _label_pca_row(grams[ii], entries[ii]["flip"])
+            if plan["free"]:
+                entries[ii] = dict(entries[ii], pca_row=row)
+            else:
+                kernel = (row @ entries[ii]["kernel"])[np.newaxis]
+                entries[ii] = dict(entries[ii], kernel=kernel, mode="reduced")
+        plan = dict(plan, entries=entries)
+    label_tc = np.zeros((len(entries), n_times), dtype)
+    for start, data in gen_data():
+        sl = slice(start, start + data.shape[1])
+        for ii, this_sol in zip(use, _label_inverse_data(plan, data)):
+            entry = entries[ii]
+            if entry["mode"] == "reduced":
+                label_tc[ii, sl] = this_sol[0]
+            elif entry["mode"] == "pca_flip":
+                label_tc[ii, sl] = entry["pca_row"] @ this_sol
+            else:
+                label_tc[ii, sl] = _label_funcs[entry["mode"]](entry["flip"], this_sol)
+    return label_tc
+
+
+@verbose
+def apply_inverse_labels(
+    inst,
+    inverse_operator,
+    labels,
+    lambda2,
+    method="dSPM",
+    mode="auto",
+    *,
+    nave=1,
+    pick_ori=None,
+    start=None,
+    stop=None,
+    buffer_size=None,
+    allow_empty=False,
+    mri_resolution=True,
+    return_generator=False,
+    prepared=False,
+    method_params=None,
+    use_cps=True,
+    verbose=None,
+):
+    """Apply inverse operator to Raw or Epochs and extract label time courses.
+
+    This gives the same result as :func:`mne.extract_label_time_course` applied
+    to the output of :func:`apply_inverse_raw` or :func:`apply_inverse_epochs`,
+    but the source estimates of all vertices are never computed: the kernel is
+    assembled once for the vertices of the labels (and reduced to a single row
+    per label where the mode allows it), and the sensor data are processed in
+    blocks of time for Raw and one epoch at a time for Epochs. The data do not
+    have to be preloaded.
+
+    Parameters
+    ----------
+    inst : instance of Raw | instance of Epochs
+        The data.
+    inverse_operator : dict
+        Inverse operator.
+    %(labels_eltc)s
+    lambda2 : float
+        The regularization parameter.
+    method : "MNE" | "dSPM" | "sLORETA" | "eLORETA"
+        Use minimum norm, dSPM (default), sLORETA, or eLORETA.
+    %(mode_eltc)s
+    nave : int
+        Number of averages used to regularize the solution.
+        Set to 1 on raw data and single epochs by default.
+    pick_ori : None | "normal"
+        Options:
+
+        - ``None``
+            Pooling is performed by taking the norm of loose/free
+            orientations. In case of a fixed source space no norm is computed
+            leading to signed source activity.
+        - ``"normal"``
+            Only the normal to the cortical surface is kept. This is only
+            implemented when working with loose orientations.
+    start : int | None
+        Index of first time sample of Raw (index not time is seconds).
+        Ignored for Epochs.
+    stop : int | None
+        Index of first time sample of Raw not to include (index not time is
+        seconds). Ignored for Epochs.
+    buffer_size : int | None
+        The number of Raw samples to process at once. None (default) uses
+        blocks of 10 seconds. Ignored for Epochs.
+    %(allow_empty_eltc)s
+    %(mri_resolution_eltc)s
+    return_generator : bool
+        If True and ``inst`` is an Epochs instance, a generator instead of a
+        list is returned.
+    prepared : bool
+        If True, do not call :func:`prepare_inverse_operator`.
+    method_params : dict | None
+        Additional options for eLORETA. See Notes of :func:`apply_inverse`.
+    %(use_cps_restricted)s
+    %(verbose)s
+
+    Returns
+    -------
+    label_tc : array, shape (n_labels, n_times) | list (or generator) of array
+        The time course of each label, for Raw, or a list with the time
+        courses of each epoch, for Epochs.
+
+    See Also
+    --------
+    apply_inverse_raw : Apply inverse operator to raw object.
+    apply_inverse_epochs : Apply inverse operator to epochs object.
+    mne.extract_label_time_course : Extract label time courses from source estimates.
+
+    Notes
+    -----
+    %(eltc_mode_notes)s
+
+    With ``mode="pca_flip"``, the principal component of each label is computed
+    over all time samples of Raw (which are therefore read twice) and over each
+    epoch separately, as with :func:`mne.extract_label_time_course`.
+
+    .. versionadded:: 1.13
+    """
+    _validate_type(inst, (BaseRaw, BaseEpochs), "inst", "Raw or Epochs")
+    _check_reference(inst, inverse_operator["info"]["ch_names"])
+    _check_option("method", method, INVERSE_METHODS)
+    _check_option("mode", mode, ("mean", "mean_flip", "pca_flip", "max", "auto"))
+    _check_option("pick_ori", pick_ori, (None, "normal"))
+    _check_ori(pick_ori, inverse_operator["source_ori"], inverse_operator["src"])
+    _check_ch_names(inverse_operator, inst.info)
+
+    #
+    #   Set up the inverse according to the parameters
+    #
+    inv = _check_or_prepare(
+        inverse_operator, nave, lambda2, method, method_params, prepared
+    )
+    sel = _pick_channels_inverse_operator(inst.ch_names, inv)
+    logger.info("Applying inverse to labels...")
+    logger.info("    Picked %d channels from the data", len(sel))
+    plan = _prepare_label_inverse(
+        inv, labels, method, mode, pick_ori, allow_empty, mri_resolution, use_cps
+    )
+    if isinstance(inst, BaseRaw):
+        start, stop, _ = slice(start, stop).indices(inst.n_times)
+        if buffer_size is None:
+            buffer_size = _stream_block_len(inst.info["sfreq"], 0)
+        buffer_size = _ensure_int(buffer_size, "buffer_size")
+
+        def gen_data():
+            for pos in range(start, stop, buffer_size):
+                data = inst[sel, pos : min(pos + buffer_size, stop)][0]
+                yield pos - start, data
+
+        label_tc = _label_inverse_tc(plan, gen_data, stop - start, np.float64)
+        logger.info("[done]")
+        return label_tc
+
+    label_tc = _gen_apply_inverse_labels_epochs(inst, sel, plan)
+    if not return_generator:
+        label_tc = list(label_tc)
+    return label_tc
+
+
+def _gen_apply_inverse_labels_epochs(epochs, sel, plan):
+    """Generate the label time courses of each epoch."""
+    for k, e in enumerate(epochs):
+        logger.info("Processing epoch : %d", k + 1)
+        data = e[sel]
+        yield _label_inverse_tc(plan, lambda: [(0, data)], data.shape[1], data.dtype)
+    logger.info("[done]")
+
+
 def _apply_inverse_tfr_epochs_gen(
     epochs_tfr,
     inverse_operator,
@@ -1463,6 +2097,8 @@ def _apply_inverse_tfr_epochs_gen(
     method_params,
     use_cps,
 ):
+    # the kernel of each inverse operator is only assembled once
+    kernels = dict()
     for freq_idx in range(epochs_tfr.freqs.size):
         epochs = EpochsArray(
             epochs_tfr.data[:, :, freq_idx, :],
@@ -1475,19 +2111,22 @@ def _apply_inverse_tfr_epochs_gen(
             if isinstance(inverse_operator, list | tuple)
             else inverse_operator
         )
-        stcs = _apply_inverse_epochs_gen(
-            epochs,
-            this_inverse_operator,
-            lambda2,
-            method=method,
-            label=label,
-            nave=nave,
-            pick_ori=pick_ori,
-            prepared=prepared,
-            method_params=method_params,
-            use_cps=use_cps,
-        )
-        yield stcs
+        key = id(this_inverse_operator)
+        if key not in kernels:
+            kernels[key] = _prepare_epochs_kernel(
+                epochs,
+                this_inverse_operator,
+                lambda2,
+                method,
+                label,
+                nave,
+                pick_ori,
+                prepared,
+                method_params,
+                use_cps,
+            )
+        inv_kernel, sel = kernels[key]
+        yield inv_kernel._gen_apply_epochs(epochs, sel)
 
 
 @verbose
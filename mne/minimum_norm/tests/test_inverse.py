@@ -27,6 +27,7 @@ from mne import (
     compute_raw_covariance,
     convert_forward_solution,
     create_info,
+    extract_label_time_course,
     make_ad_hoc_cov,
     make_forward_solution,
     make_sphere_model,
@@ -48,14 +49,18 @@ from mne.io import read_info, read_raw_fif
 from mne.label import label_sign_flip, read_label
 from mne.minimum_norm import (
     INVERSE_METHODS,
+    InverseKernel,
     apply_inverse,
     apply_inverse_cov,
     apply_inverse_epochs,
+    apply_inverse_labels,
     apply_inverse_raw,
     apply_inverse_tfr_epochs,
     compute_rank_inverse,
+    make_inverse_kernel,
     make_inverse_operator,
     prepare_inverse_operator,
+    read_inverse_kernel,
     read_inverse_operator,
     write_inverse_operator,
 )
@@ -1229,6 +1234,54 @@ def test_apply_mne_inverse_raw():
         )
 
 
+@testing.requires_testing_data
+@pytest.mark.parametrize("method", ("dSPM", "eLORETA"))
+@pytest.mark.parametrize("pick_ori", (None, "normal", "vector"))
+def test_inverse_kernel(method, pick_ori, tmp_path):
+    """Test applying an assembled inverse kernel."""
+    pytest.importorskip("h5io")
+    inverse_operator = read_inverse_operator(fname_inv)
+    label_lh = read_label(str(fname_label) % "Aud-lh")
+    evoked = read_evokeds(fname_data, condition=0, baseline=(None, 0))
+    raw = read_raw_fif(fname_raw)
+    events = read_events(fname_event)[:3]
+    epochs = Epochs(raw, events, 1, -0.2, 0.3, baseline=(None, 0))
+    kwargs = dict(method=method, pick_ori=pick_ori)
+
+    inv_kernel = make_inverse_kernel(
+        inverse_operator, lambda2, nave=evoked.nave, label=label_lh, **kwargs
+    )
+    assert isinstance(inv_kernel, InverseKernel)
+    assert method in repr(inv_kernel)
+    stc = inv_kernel.apply(evoked)
+    stc_want = apply_inverse(
+        evoked, inverse_operator, lambda2, label=label_lh, **kwargs
+    )
+    assert_array_equal(stc.vertices[0], stc_want.vertices[0])
+    assert_allclose(stc.data, stc_want.data)
+
+    # round trip, and Raw and Epochs
+    inv_kernel = make_inverse_kernel(inverse_operator, lambda2, **kwargs)
+    inv_kernel.save(tmp_path / "sample")
+    inv_kernel = read_inverse_kernel(tmp_path / "sample-kernel.h5")
+    stc = inv_kernel.apply(raw, start=10, stop=100, buffer_size=30)
+    stc_want = apply_inverse_raw(
+        raw, inverse_operator, lambda2, start=10, stop=100, **kwargs
+    )
+    assert stc.subject == stc_want.subject == "sample"
+    assert_allclose(stc.times, stc_want.times)
+    assert_allclose(stc.data, stc_want.data)
+    stcs = inv_kernel.apply(epochs, return_generator=True)
+    stcs_want = apply_inverse_epochs(epochs, inverse_operator, lambda2, **kwargs)
+    for stc, stc_want in zip(stcs, stcs_want):
+        assert_allclose(stc.data, stc_want.data)
+
+    with pytest.raises(ValueError, match="not present in the data"):
+        inv_kernel.apply(evoked.copy().drop_channels(evoked.ch_names[:1]))
+    with pytest.raises(TypeError, match="Evoked, Raw, or Epochs"):
+        inv_kernel.apply(stc)
+
+
 @testing.requires_testing_data
 def test_apply_mne_inverse_fixed_raw():
     """Test MNE with fixed-orientation inverse operator on Raw."""
@@ -1418,6 +1471,59 @@ def test_apply_mne_inverse_epochs():
         )
 
 
+@testing.requires_testing_data
+@pytest.mark.parametrize("pick_ori", (None, "normal"))
+@pytest.mark.parametrize("mode", ("mean_flip", "pca_flip", "max"))
+def test_apply_inverse_labels(pick_ori, mode):
+    """Test extracting label time courses while applying the inverse."""
+    inverse_operator = read_inverse_operator(fname_inv)
+    src = inverse_operator["src"]
+    label_lh = read_label(str(fname_label) % "Aud-lh")
+    label_rh = read_label(str(fname_label) % "Aud-rh")
+    labels = [label_lh, label_rh, label_lh + label_rh]
+    raw = read_raw_fif(fname_raw)
+    kwargs = dict(method="dSPM", pick_ori=pick_ori)
+
+    # Raw, in blocks that do not divide the number of samples
+    start, stop = 100, 1100
+    stc = apply_inverse_raw(
+        raw, inverse_operator, lambda2, start=start, stop=stop, **kwargs
+    )
+    want = extract_label_time_course(stc, labels, src, mode=mode)
+    label_tc = apply_inverse_labels(
+        raw,
+        inverse_operator,
+        labels,
+        lambda2,
+        mode=mode,
+        start=start,
+        stop=stop,
+        buffer_size=300,
+        **kwargs,
+    )
+    assert label_tc.shape == (3, stop - start)
+    assert_allclose(label_tc, want, rtol=1e-6, atol=1e-6 * np.abs(want).max())
+
+    # Epochs
+    events = read_events(fname_event)[:5]
+    epochs = Epochs(raw, events, 1, -0.2, 0.3, baseline=(None, 0))
+    stcs = apply_inverse_epochs(epochs, inverse_operator, lambda2, **kwargs)
+    want = extract_label_time_course(stcs, labels, src, mode=mode)
+    label_tc = apply_inverse_labels(
+        epochs, inverse_operator, labels, lambda2, mode=mode, **kwargs
+    )
+    assert len(label_tc) == len(want) == len(epochs)
+    for this_tc, this_want in zip(label_tc, want):
+        assert_allclose(
+            this_tc, this_want, rtol=1e-6, atol=1e-6 * np.abs(this_want).max()
+        )
+
+    with pytest.raises(ValueError, match="Invalid value for the 'pick_ori'"):
+        apply_inverse_labels(raw, inverse_operator, labels, lambda2, pick_ori="vector")
+    with pytest.raises(ValueError, match="Invalid value for the 'mode'"):
+        apply_inverse_labels(raw, inverse_operator, labels, lambda2, mode=None)
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 @pytest.mark.parametrize("return_generator", (True, False))
@@ -2,9 +2,11 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
-import copy
+import hashlib
+import os
 import os.path as op
 import warnings
+from types import GeneratorType
 
 import numpy as np
 from scipy import sparse
@@ -32,6 +34,7 @@ from .utils import (
     _validate_type,
     check_version,
     fill_doc,
+    get_config,
     get_subjects_dir,
     logger,
     use_log_level,
@@ -275,18 +278,17 @@ def compute_source_morph(
                 assert src_to.kind in ("surface", "mixed")
                 vertices_to_surf = [s["vertno"].copy() for s in src_to[:2]]
             else:
-                vertices_to_surf = grade_to_vertices(
-                    subject_to, spacing, subjects_dir, 1
-                )
-            morph_mat = _compute_morph_matrix(
-                subject_from=subject_from,
-                subject_to=subject_to,
-                vertices_from=vertices_from,
-                vertices_to=vertices_to_surf,
-                subjects_dir=subjects_dir,
-                smooth=smooth,
-                warn=warn,
-                xhemi=xhemi,
+                vertices_to_surf = None  # from spacing, unless cached
+            vertices_to_surf, morph_mat = _compute_surface_morph(
+                subject_from,
+                subject_to,
+                vertices_from,
+                vertices_to_surf,
+                spacing,
+                smooth,
+                xhemi,
+                subjects_dir,
+                warn,
             )
             n_verts = sum(len(v) for v in vertices_to_surf)
             assert morph_mat.shape[0] == n_verts
@@ -515,8 +517,13 @@ class SourceMorph:
 
         Parameters
         ----------
-        stc_from : VolSourceEstimate | VolVectorSourceEstimate | SourceEstimate | VectorSourceEstimate
-            The source estimate to morph.
+        stc_from : VolSourceEstimate | VolVectorSourceEstimate | SourceEstimate | VectorSourceEstimate | list | generator
+            The source estimate to morph. Can also be a list or generator of
+            source estimates, which are morphed in batches with a single
+            sparse product each.
+
+            .. versionchanged:: 1.13
+               Support for lists and generators of source estimates.
         output : str
             Can be ``'stc'`` (default) or possibly ``'nifti1'``, or
             ``'nifti2'`` when working with a volume source space defined on a
@@ -533,10 +540,57 @@ class SourceMorph:
 
         Returns
         -------
-        stc_to : VolSourceEstimate | SourceEstimate | VectorSourceEstimate | Nifti1Image | Nifti2Image
-            The morphed source estimates.
+        stc_to : VolSourceEstimate | SourceEstimate | VectorSourceEstimate | Nifti1Image | Nifti2Image | list | generator
+            The morphed source estimates. A list if ``stc_from`` is a list or
+            tuple, and a generator if it is a generator.
         """  # noqa: E501
         _validate_type(output, str, "output")
+        if isinstance(stc_from, list | tuple):
+            return list(self._gen_apply(stc_from, output, mri_resolution, mri_space))
+        elif isinstance(stc_from, GeneratorType):
+            return self._gen_apply(stc_from, output, mri_resolution, mri_space)
+        _validate_type(
+            stc_from,
+            _BaseSourceEstimate,
+            "stc_from",
+            "source estimate, list or generator",
+        )
+        return next(self._gen_apply([stc_from], output, mri_resolution, mri_space))
+
+    def _gen_apply(self, stcs_from, output, mri_resolution, mri_space):
+        """Morph source estimates in batches of the same class."""
+        mri_space = mri_resolution if mri_space is None else mri_space
+        batch, batch_key, n_bytes, kernels = list(), None, 0, set()
+        for stc_from in stcs_from:
+            self._check_apply(stc_from, output)
+            data = stc_from._kernel if stc_from._factored else stc_from._data
+            key = (stc_from.__class__, data.dtype)
+            if len(batch) and (key != batch_key or n_bytes >= _MORPH_BATCH_BYTES):
+                yield from self._apply_batch(batch, output, mri_resolution, mri_space)
+                batch, n_bytes, kernels = list(), 0, set()
+            batch.append(stc_from)
+            batch_key = key
+            if not stc_from._factored:
+                n_bytes += data.nbytes
+            elif id(data) not in kernels:
+                kernels.add(id(data))
+                n_bytes += data.nbytes
+        if len(batch):
+            yield from self._apply_batch(batch, output, mri_resolution, mri_space)
+
+    def _apply_batch(self, stcs_from, output, mri_resolution, mri_space):
+        for out in _apply_morph_data_batch(self, stcs_from):
+            if output != "stc":  # convert to volume
+                out = _morphed_stc_as_volume(
+                    self,
+                    out,
+                    mri_resolution=mri_resolution,
+                    mri_space=mri_space,
+                    output=output,
+                )
+            yield out
+
+    def _check_apply(self, stc_from, output):
         _validate_type(stc_from, _BaseSourceEstimate, "stc_from", "source estimate")
         if isinstance(stc_from, _BaseSurfaceSourceEstimate):
             allowed_kinds = ("stc",)
@@ -545,29 +599,15 @@ class SourceMorph:
             allowed_kinds = ("stc", "nifti1", "nifti2")
             extra = ""
         _check_option("output", output, allowed_kinds, extra)
-        stc = copy.deepcopy(stc_from)
-
-        mri_space = mri_resolution if mri_space is None else mri_space
-        if stc.subject is None:
-            stc.subject = self.subject_from
+        subject = self.subject_from if stc_from.subject is None else stc_from.subject
         if self.subject_from is None:
-            self.subject_from = stc.subject
-        if stc.subject != self.subject_from:
+            self.subject_from = subject
+        if subject != self.subject_from:
             raise ValueError(
                 "stc_from.subject and "
                 "morph.subject_from "
-                f"must match. ({stc.subject} != {self.subject_from})"
-            )
-        out = _apply_morph_data(self, stc)
-        if output != "stc":  # convert to volume
-            out = _morphed_stc_as_volume(
-                self,
-                out,
-                mri_resolution=mri_resolution,
-                mri_space=mri_space,
-                output=output,
+                f"must match. ({subject} != {self.subject_from})"
             )
-        return out
 
     @verbose
     def compute_vol_morph_mat(self, *, verbose=None):
@@ -1172,6 +1212,123 @@ def _compute_morph_sdr(mri_from, mri_to, niter_affine, niter_sdr, zooms):
     return to_shape, zooms, to_affine, pre_affine, sdr_morph
 
 
+def _morph_mat_cache_fname(subjects_dir, subject_from, subject_to, xhemi, *key):
+    """Get the file caching a surface morph matrix, None if not possible."""
+    if get_config("MNE_MORPH_MAT_CACHE", "true").lower() != "true":
+        return None
+    digest = hashlib.sha1()
+    # the morph depends on the spherical registrations of both subjects
+    surfs = ("sphere.reg", "sphere.left_right") if xhemi else ("sphere.reg",)
+    for subject in (subject_from, subject_to):
+        for fname in (f"{hemi}.{surf}" for surf in surfs for hemi in ("lh", "rh")):
+            try:
+                stat = os.stat(op.join(subjects_dir, subject, "surf", fname))
+            except OSError:
+                return None
+            digest.update(f"{stat.st_size}-{stat.st_mtime_ns}|".encode())
+    _update_morph_digest(digest, (xhemi,) + key)
+    return op.join(
+        subjects_dir,
+        "morph-maps",
+        f"{subject_from}-{subject_to}-{digest.hexdigest()[:16]}-morph-mat.npz",
+    )
+
+
+def _update_morph_digest(digest, item):
+    if isinstance(item, list | tuple):
+        for this_item in item:
+            _update_morph_digest(digest, this_item)
+    elif isinstance(item, np.ndarray):
+        item = np.ascontiguousarray(item, np.int64)  # vertex numbers
+        digest.update(f"{item.shape}".encode())
+        digest.update(item.tobytes())
+    else:
+        digest.update(repr(item).encode())
+    digest.update(b"|")
+
+
+def _compute_surface_morph(
+    subject_from,
+    subject_to,
+    vertices_from,
+    vertices_to,
+    spacing,
+    smooth,
+    xhemi,
+    subjects_dir,
+    warn,
+):
+    """Compute a surface morph matrix, or read it from the cache on disk.
+
+    Morph matrices are cached in the morph-maps directory of subjects_dir,
+    like the morph maps they are computed from.
+    """
+    fname = _morph_mat_cache_fname(
+        subjects_dir,
+        subject_from,
+        subject_to,
+        xhemi,
+        vertices_from,
+        spacing if vertices_to is None else vertices_to,
+        smooth,
+    )
+    if fname is not None and op.isfile(fname):
+        try:
+            with np.load(fname) as npz:
+                morph_mat = sparse.csr_array(
+                    (npz["data"], npz["indices"], npz["indptr"]),
+                    shape=tuple(npz["shape"]),
+                )
+                vertices_to = [npz["vertices_to_lh"], npz["vertices_to_rh"]]
+        except Exception as exp:
+            logger.info(f"Could not read cached morph matrix {fname}: {exp}")
+        else:
+            logger.info(f"Read cached morph matrix {fname}")
+            return vertices_to, morph_mat
+    if vertices_to is None:
+        vertices_to = grade_to_vertices(subject_to, spacing, subjects_dir, 1)
+    # morphs that warned are not cached, so that they warn again next time
+    with warnings.catch_warnings(record=True) as ws:
+        warnings.simplefilter("always")
+        morph_mat = _compute_morph_matrix(
+            subject_from=subject_from,
+            subject_to=subject_to,
+            vertices_from=vertices_from,
+            vertices_to=vertices_to,
+            subjects_dir=subjects_dir,
+            smooth=smooth,
+            warn=warn,
+            xhemi=xhemi,
+        )
+    for w in ws:
+        warnings.warn_explicit(w.message, w.category, w.filename, w.lineno)
+    if fname is not None and not len(ws):
+        _write_morph_mat_cache(fname, vertices_to, morph_mat)
+    return vertices_to, morph_mat
+
+
+def _write_morph_mat_cache(fname, vertices_to, morph_mat):
+    """Write a morph matrix to the cache, ignoring errors."""
+    tmp_fname = f"{fname}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(op.dirname(fname), exist_ok=True)
+        with open(tmp_fname, "wb") as fid:
+            np.savez(
+                fid,
+                data=morph_mat.data,
+                indices=morph_mat.indices,
+                indptr=morph_mat.indptr,
+                shape=np.array(morph_mat.shape),
+                vertices_to_lh=vertices_to[0],
+                vertices_to_rh=vertices_to[1],
+            )
+        os.replace(tmp_fname, fname)
+    except OSError as exp:
+        logger.info(f"Could not cache morph matrix to {fname}: {exp}")
+        if op.isfile(tmp_fname):
+            os.remove(tmp_fname)
+
+
 def _compute_morph_matrix(
     subject_from,
     subject_to,
@@ -1465,10 +1622,17 @@ def _check_vertices_match(v1, v2, name):
 
 
 _VOL_MAT_CHECK_RATIO = 1.0
+# Approximate size of the source estimate data morphed with one product
+_MORPH_BATCH_BYTES = 2**26
 
 
 def _apply_morph_data(morph, stc_from):
     """Morph a source estimate from one subject to another."""
+    return _apply_morph_data_batch(morph, [stc_from])[0]
+
+
+def _check_morph_stc(morph, stc_from):
+    """Check that a source estimate can be morphed."""
     if stc_from.subject is not None and stc_from.subject != morph.subject_from:
         raise ValueError(
             f"stc.subject ({stc_from.subject}) != morph.subject_from "
@@ -1497,6 +1661,32 @@ def _apply_morph_data(morph, stc_from):
             "stc_from",
             "source estimate when using a mixed source morph",
         )
+    do_vol = not isinstance(stc_from, _BaseSurfaceSourceEstimate)
+    do_surf = not isinstance(stc_from, _BaseVolSourceEstimate)
+    vol_src_offset = 2 if do_surf else 0
+    if do_vol:
+        stc_from_vertices = stc_from.vertices[vol_src_offset:]
+        vertices_from = morph._vol_vertices_from
+        for ii, (v1, v2) in enumerate(zip(vertices_from, stc_from_vertices)):
+            _check_vertices_match(v1, v2, f"volume[{ii}]")
+    if do_surf:
+        for hemi, v1, v2 in zip(
+            ("left", "right"), morph.src_data["vertices_from"], stc_from.vertices[:2]
+        ):
+            _check_vertices_match(v1, v2, f"{hemi} hemisphere")
+
+
+def _apply_morph_data_batch(morph, stcs_from):
+    """Morph source estimates of the same class with a single product.
+
+    The data of the source estimates are stacked along the time axis. The
+    kernels of factored source estimates are morphed instead, once for each
+    kernel that is shared between source estimates.
+    """
+    for stc_from in stcs_from:
+        _check_morph_stc(morph, stc_from)
+    stc_from = stcs_from[0]
+    assert all(stc.__class__ is stc_from.__class__ for stc in stcs_from)
 
     # figure out what to actually morph
     do_vol = not isinstance(stc_from, _BaseSurfaceSourceEstimate)
@@ -1505,23 +1695,29 @@ def _apply_morph_data(morph, stc_from):
     vol_src_offset = 2 if do_surf else 0
     from_surf_stop = sum(len(v) for v in stc_from.vertices[:vol_src_offset])
     to_surf_stop = sum(len(v) for v in morph.vertices_to[:vol_src_offset])
-    from_vol_stop = stc_from.data.shape[0]
+    from_vol_stop = stc_from.shape[0]
     vertices_to = morph.vertices_to
     if morph.kind == "mixed":
         vertices_to = vertices_to[0 if do_surf else 2 : None if do_vol else 2]
     to_vol_stop = sum(len(v) for v in vertices_to)
 
-    mesg = "Ori × Time" if stc_from.data.ndim == 3 else "Time"
-    data_from = np.reshape(stc_from.data, (stc_from.data.shape[0], -1))
-    n_times = data_from.shape[1]  # oris treated as times
-    data = np.empty((to_vol_stop, n_times), stc_from.data.dtype)
+    # stack the columns to morph: data, or kernels shared by factored ones
+    columns, kernels = dict(), dict()
+    mesg = "Channel"
+    for stc in stcs_from:
+        if stc._factored:
+            key = kernels.setdefault(id(stc._kernel), ("kernel", id(stc._kernel)))
+            columns.setdefault(key, stc._kernel)
+        else:
+            mesg = "Ori × Time" if stc.data.ndim == 3 else "Time"
+            columns[("data", id(stc))] = np.reshape(stc.data, (stc.data.shape[0], -1))
+    data_from = list(columns.values())
+    data_from = data_from[0] if len(data_from) == 1 else np.concatenate(data_from, 1)
+    n_times = data_from.shape[1]  # oris and channels treated as times
+    data = np.empty((to_vol_stop, n_times), data_from.dtype)
     to_used = np.zeros(data.shape[0], bool)
     from_used = np.zeros(data_from.shape[0], bool)
     if do_vol:
-        stc_from_vertices = stc_from.vertices[vol_src_offset:]
-        vertices_from = morph._vol_vertices_from
-        for ii, (v1, v2) in enumerate(zip(vertices_from, stc_from_vertices)):
-            _check_vertices_match(v1, v2, f"volume[{ii}]")
         from_sl = slice(from_surf_stop, from_vol_stop)
         assert not from_used[from_sl].any()
         from_used[from_sl] = True
@@ -1546,10 +1742,6 @@ def _apply_morph_data(morph, stc_from):
             logger.debug("Using sparse volume morph matrix")
             data[to_sl, :] = morph.vol_morph_mat @ data_from[from_sl]
     if do_surf:
-        for hemi, v1, v2 in zip(
-            ("left", "right"), morph.src_data["vertices_from"], stc_from.vertices[:2]
-        ):
-            _check_vertices_match(v1, v2, f"{hemi} hemisphere")
         from_sl = slice(0, from_surf_stop)
         assert not from_used[from_sl].any()
         from_used[from_sl] = True
@@ -1559,7 +1751,28 @@ def _apply_morph_data(morph, stc_from):
         data[to_sl] = morph.morph_mat @ data_from[from_sl]
     assert to_used.all()
     assert from_used.all()
-    data = _reshape_view(data, (data.shape[0],) + stc_from.data.shape[1:])
-    klass = stc_from.__class__
-    stc_to = klass(data, vertices_to, stc_from.tmin, stc_from.tstep, morph.subject_to)
-    return stc_to
+
+    # split the morphed columns again
+    start = 0
+    for key, this_data in columns.items():
+        stop = start + this_data.shape[1]
+        columns[key] = data[:, start:stop]
+        start = stop
+    stcs_to = list()
+    for stc in stcs_from:
+        if stc._factored:
+            kernel = columns[kernels[id(stc._kernel)]]
+            if len(columns) > 1:
+                kernel = np.ascontiguousarray(kernel)
+            this_data = (kernel, stc._sens_data)
+        else:
+            this_data = columns[("data", id(stc))]
+            this_data = _reshape_view(
+                this_data if len(columns) == 1 else this_data.copy(),
+                (this_data.shape[0],) + stc.data.shape[1:],
+            )
+        klass = stc.__class__
+        stcs_to.append(
+            klass(this_data, vertices_to, stc.tmin, stc.tstep, morph.subject_to)
+        )
+    return stcs_to
@@ -3,7 +3,7 @@
 # Copyright the MNE-Python contributors.
 
 from collections import Counter
-from copy import deepcopy
+from copy import copy, deepcopy
 from functools import partial
 from math import factorial
 from os import path as op
@@ -22,13 +22,14 @@ from .._fiff.proc_history import _read_ctc
 from .._fiff.proj import Projection
 from .._fiff.tag import _coil_trans_to_loc, _loc_to_coil_trans
 from .._fiff.write import DATE_NONE, _generate_meas_id
-from .._ola import _COLA, _Interp2, _Storer
+from .._ola import _COLA, _cola_process, _Interp2, _Storer
 from ..annotations import _annotations_starts_stops
 from ..bem import _check_origin
 from ..channels.channels import _get_T1T2_mag_inds, fix_mag_coil_types
 from ..fixes import _reshape_view, _safe_svd, bincount, sph_harm_y
 from ..forward import _concatenate_coils, _create_meg_coils, _prep_meg_channels
 from ..io import BaseRaw, RawArray
+from ..parallel import parallel_func
 from ..surface import _normalize_vectors
 from ..transforms import (
     Transform,
@@ -239,6 +240,7 @@ def maxwell_filter(
     extended_proj=(),
     st_overlap=True,
     mc_interp="hann",
+    n_jobs=None,
     verbose=None,
 ):
     """Maxwell filter data using multipole moments.
@@ -292,6 +294,12 @@ def maxwell_filter(
 
         .. versionadded:: 1.10
     %(maxwell_mc_interp)s
+    %(n_jobs)s
+        Each contiguous segment of data is split into chunks of tSSS windows
+        (or of buffers when tSSS is not used) that are processed in parallel.
+        The results are identical to those of ``n_jobs=1``.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -427,7 +435,7 @@ def maxwell_filter(
         st_overlap=st_overlap,
         mc_interp=mc_interp,
     )
-    raw_sss = _run_maxwell_filter(raw, **params)
+    raw_sss = _run_maxwell_filter(raw, **params, n_jobs=n_jobs)
     # Update info
     _update_sss_info(raw_sss, **params["update_kwargs"])
     logger.info("[done]")
@@ -739,6 +747,7 @@ def _run_maxwell_filter(
     st_fixed,
     st_overlap,
     mc,
+    n_jobs=None,
 ):
     # Eventually find_bad_channels_maxwell could be sped up by moving this
     # outside the loop (e.g., in the prep function) but regularization depends
@@ -776,6 +785,9 @@ def _run_maxwell_filter(
     # find_bad_channels_maxwell modifies good_mask
     mc.initialize(_get_this_decomp_trans, info["dev_head_t"], S_recon)
     update_kwargs.update(reg_moments=mc.reg_moments_0)
+    parallel, p_move_comp, n_jobs = parallel_func(_move_comp_chunk, n_jobs)
+    p_cola = parallel_func(_cola_process, n_jobs)[1]
+    n_fed = 0  # the number of samples passed to movement compensation
 
     # Process each valid block of data separately
     for onset, end in zip(onsets, ends):
@@ -813,6 +825,28 @@ def _run_maxwell_filter(
         read_lims = list(range(onset, end, use_n)) + [end]
         assert len(read_lims) >= 2
         assert read_lims[0] == onset and read_lims[-1] == end
+        if n_jobs > 1:
+            _run_maxwell_segment_parallel(
+                raw_sss,
+                tsss,
+                read_lims,
+                parallel=parallel,
+                p_cola=p_cola,
+                p_move_comp=p_move_comp,
+                n_jobs=n_jobs,
+                mc=mc,
+                offset=n_fed,
+                ctc=ctc,
+                meg_picks=meg_picks,
+                good_mask=good_mask,
+                pos_picks=pos_picks,
+                st_correlation=st_correlation,
+                st_fixed=st_fixed,
+                st_only=st_only,
+                sfreq=sfreq,
+            )
+            n_fed += n
+            continue
 
         # First pass: cross_talk, st_fixed=True
         for start, stop in zip(read_lims[:-1], read_lims[1:]):
@@ -859,6 +893,130 @@ def _run_maxwell_filter(
     return raw_sss
 
 
+def _run_maxwell_segment_parallel(
+    raw_sss,
+    tsss,
+    read_lims,
+    *,
+    parallel,
+    p_cola,
+    p_move_comp,
+    n_jobs,
+    mc,
+    offset,
+    ctc,
+    meg_picks,
+    good_mask,
+    pos_picks,
+    st_correlation,
+    st_fixed,
+    st_only,
+    sfreq,
+):
+    """Maxwell filter a contiguous segment of data in parallel chunks.
+
+    This matches the two passes of :func:`_run_maxwell_filter`, but instead of
+    feeding buffers one at a time, the tSSS windows (and the buffers used for
+    movement compensation) are split into contiguous chunks that are processed
+    by separate jobs and then overlap-added.
+    """
+    onset, end = read_lims[0], read_lims[-1]
+    lims = np.array(read_lims) - onset
+    do_tsss = st_correlation is not None
+
+    # First pass: cross_talk, st_fixed=True
+    ctc_data = np.empty((good_mask.sum(), end - onset), raw_sss._data.dtype)
+    for start, stop in zip(lims[:-1], lims[1:]):
+        this_data = raw_sss._data[meg_picks[good_mask], onset + start : onset + stop]
+        if ctc is not None:
+            this_data = ctc.dot(this_data)
+        ctc_data[:, start:stop] = this_data
+    if do_tsss and st_fixed:
+        if st_only:
+            proc = raw_sss._data[meg_picks, onset:end]
+        else:
+            proc = ctc_data
+        splits = tsss._split(n_jobs)
+        outs = parallel(
+            p_cola(
+                partial(tsss._process, mc=this_mc),
+                [proc[:, starts[0] : stops[-1]], ctc_data[:, starts[0] : stops[-1]]],
+                starts,
+                stops,
+                windows,
+                sfreq=sfreq,
+            )
+            for (starts, stops, windows), this_mc in zip(splits, mc._split_avg(splits))
+        )
+        tsss._store_split(splits, outs)
+    else:
+        raw_sss._data[meg_picks[good_mask], onset:end] = ctc_data
+    del ctc_data
+
+    # Second pass: movement compensation, st_fixed=False
+    if do_tsss and not st_fixed:
+        # movement compensate whole buffers covering each chunk of windows
+        splits = tsss._split(n_jobs)
+        chunk_lims = list()
+        for starts, stops, _ in splits:
+            first = np.searchsorted(lims, starts[0], "right") - 1
+            last = np.searchsorted(lims, stops[-1], "left")
+            chunk_lims.append(lims[first : last + 1])
+    else:
+        splits = None
+        idx = np.array_split(np.arange(len(lims) - 1), n_jobs)
+        chunk_lims = [lims[ii[0] : ii[-1] + 2] for ii in idx if len(ii)]
+    outs = parallel(
+        p_move_comp(
+            mc,
+            raw_sss._data[meg_picks, onset + these_lims[0] : onset + these_lims[-1]],
+            these_lims,
+            offset=offset,
+            good_mask=good_mask,
+            st_only=st_only,
+            tsss=None if splits is None else (tsss._process,) + split,
+        )
+        for these_lims, split in zip(chunk_lims, splits or [None] * len(chunk_lims))
+    )
+    for these_lims, (data, pos_data) in zip(chunk_lims, outs):
+        sl = slice(onset + these_lims[0], onset + these_lims[-1])
+        if splits is None:
+            raw_sss._data[meg_picks, sl] = data
+        if len(pos_picks) > 0:
+            raw_sss._data[pos_picks, sl] = pos_data
+    if splits is not None:
+        tsss._store_split(splits, [data for data, _ in outs])
+
+
+def _move_comp_chunk(mc, data, lims, *, offset, good_mask, st_only, tsss):
+    """Movement compensate buffers of data, optionally followed by tSSS."""
+    mc._seek(offset + lims[0])
+    outs = list()
+    for start, stop in zip(lims[:-1], lims[1:]):
+        this_data = data[:, start - lims[0] : stop - lims[0]]
+        outs.append(mc.feed(this_data, good_mask, st_only)[:4])
+    data, in_data, resid, pos_data = (
+        np.concatenate([out[ii] for out in outs], axis=-1) for ii in range(4)
+    )
+    if tsss is not None:
+        process, starts, stops, windows = tsss
+        sl = slice(starts[0] - lims[0], stops[-1] - lims[0])
+        data = _cola_process(
+            partial(_tsss_n_positions, process=process, pos=mc.pos, offset=offset),
+            [data[:, sl], in_data[:, sl], resid[:, sl]],
+            starts,
+            stops,
+            windows,
+        )
+    return data, pos_data
+
+
+def _tsss_n_positions(*datas, process, pos, offset, start, stop):
+    """Apply tSSS to a window, counting the head positions within it."""
+    n_positions = _trans_lims(pos, offset + start, offset + stop)[1]
+    return process(*datas, n_positions=n_positions, start=start, stop=stop)
+
+
 class _MoveComp:
     """Perform movement compensation."""
 
@@ -903,12 +1061,20 @@ class _MoveComp:
         self.get_decomp = get_decomp
         # For the average passes
         self.last_avg_quat = np.nan * np.ones(6)
+        self.last_avg_start = 0
+        self.op_in_avg = self.op_resid_avg = None
+
+    def _seek(self, offset):
+        """Move to an offset without feeding the data before it."""
+        self.offset = offset
+        self.smooth._seek(offset)
 
     def get_avg_op(self, *, start, stop):
         """Apply an average transformation over the next interval."""
         n_positions, avg_quat = _trans_lims(self.pos, start, stop)[1:]
-        if not np.allclose(avg_quat, self.last_avg_quat, atol=1e-7):
-            self.last_avg_quat = avg_quat
+        self._update_avg_quat(avg_quat, start)
+        if self.op_in_avg is None:
+            avg_quat = self.last_avg_quat
             avg_trans = np.vstack(
                 [
                     np.hstack([quat_to_rot(avg_quat[:3]), avg_quat[3:][:, np.newaxis]]),
@@ -916,7 +1082,7 @@ class _MoveComp:
                 ]
             )
             S_decomp_st, _, pS_decomp_st, _, n_use_in_st = self.get_decomp(
-                avg_trans, t=start / self.sfreq
+                avg_trans, t=self.last_avg_start / self.sfreq
             )
             self.op_in_avg = np.dot(
                 S_decomp_st[:, :n_use_in_st], pS_decomp_st[:n_use_in_st]
@@ -928,6 +1094,29 @@ class _MoveComp:
             )
         return self.op_in_avg, self.op_resid_avg, n_positions
 
+    def _update_avg_quat(self, avg_quat, start):
+        """Only recompute the average operators when the position changes."""
+        if not np.allclose(avg_quat, self.last_avg_quat, atol=1e-7):
+            self.last_avg_quat = avg_quat
+            self.last_avg_start = start
+            self.op_in_avg = self.op_resid_avg = None
+
+    def _split_avg(self, splits):
+        """Get copies for chunks of tSSS windows from :meth:`_COLA._split`.
+
+        The copies compute the same average operators as :meth:`get_avg_op`
+        would when called on all windows in order.
+        """
+        mcs = list()
+        for starts, stops, _ in splits:
+            mc = copy(self)
+            mc.op_in_avg = mc.op_resid_avg = None
+            mcs.append(mc)
+            for start, stop in zip(starts, stops):
+                avg_quat = _trans_lims(self.pos, start, stop)[2]
+                self._update_avg_quat(avg_quat, start)
+        return mcs
+
     def feed(self, data, good_mask, st_only):
         n_samp = data.shape[1]
         pos_data, n_pos = _trans_lims(
@@ -780,6 +780,32 @@ def test_st_overlap():
     _assert_shielding(raw_tsss, power, 35.6, max_factor=35.7)
 
 
+@pytest.mark.slowtest
+@testing.requires_testing_data
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(st_duration=1.0),
+        dict(st_duration=1.0, st_only=True),
+        pytest.param(
+            dict(st_duration=1.0, st_fixed=False),
+            marks=pytest.mark.filterwarnings("ignore:st_fixed=False is untested"),
+        ),
+    ],
+)
+def test_maxwell_filter_n_jobs(kwargs):
+    """Test that parallel Maxwell filtering gives the same result."""
+    pytest.importorskip("joblib")
+    raw = read_crop(raw_fname, (0.0, 4.0))
+    raw.set_annotations(mne.Annotations([1.7], [0.3], "bad_acq_skip"))
+    head_pos = read_head_pos(pos_fname)
+    kwargs.update(origin=mf_head_origin, head_pos=head_pos, cross_talk=ctc_fname)
+    want = _maxwell_filter_ola(raw, **kwargs).get_data()
+    got = _maxwell_filter_ola(raw, n_jobs=2, **kwargs).get_data()
+    assert_array_equal(got, want)
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 def test_spatiotemporal_only():
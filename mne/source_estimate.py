@@ -710,7 +710,11 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         -----
         Baseline correction can be done multiple times.
         """
-        self.data = rescale(self.data, self.times, baseline, copy=False)
+        if self._factored:
+            # the sensor data can be shared with other source estimates
+            self._sens_data = rescale(self._sens_data, self.times, baseline)
+        else:
+            self.data = rescale(self.data, self.times, baseline, copy=False)
         return self
 
     @verbose
@@ -831,6 +835,11 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
     def _n_vertices(self):
         return sum(len(v) for v in self.vertices)
 
+    @property
+    def _factored(self):
+        """Whether the data are stored as a kernel and sensor data."""
+        return self._kernel is not None and self._sens_data is not None
+
     def _remove_kernel_sens_data_(self):
         """Remove kernel and sensor space data and compute self._data."""
         if self._kernel is not None or self._sens_data is not None:
@@ -860,8 +869,9 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
             self.times, tmin, tmax, sfreq=self.sfreq, include_tmax=include_tmax
         )
         self.tmin = self.times[np.where(mask)[0][0]]
-        if self._kernel is not None and self._sens_data is not None:
+        if self._factored:
             self._sens_data = self._sens_data[..., mask]
+            self._update_times()
         else:
             self.data = self.data[..., mask]
 
@@ -922,16 +932,17 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         if _check_resamp_noop(sfreq, o_sfreq):
             return self
 
-        # resampling in sensor instead of source space gives a somewhat
-        # different result, so we don't allow it
-        self._remove_kernel_sens_data_()
-
-        data = self.data
+        # resampling is linear in time, so it can be done in sensor space
+        data = self._sens_data if self._factored else self.data
         if data.dtype == np.float32:
             data = data.astype(np.float64)
-        self.data = resample(
+        data = resample(
             data, sfreq, o_sfreq, npad=npad, window=window, n_jobs=n_jobs, method=method
         )
+        if self._factored:
+            self._sens_data = data
+        else:
+            self.data = data
 
         # adjust indirectly affected variables
         self.tstep = 1.0 / sfreq
@@ -1014,6 +1025,8 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         return stc
 
     def __iadd__(self, a):  # noqa: D105
+        if self._add_factored(a, 1):
+            return self
         self._remove_kernel_sens_data_()
         if isinstance(a, _BaseSourceEstimate):
             _verify_source_estimate_compat(self, a)
@@ -1022,6 +1035,25 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
             self.data += a
         return self
 
+    def _add_factored(self, a, sign):
+        """Add another factored source estimate, keeping the data factored."""
+        if not (self._factored and isinstance(a, _BaseSourceEstimate) and a._factored):
+            return False
+        _verify_source_estimate_compat(self, a)
+        if self._kernel.shape == a._kernel.shape and np.array_equal(
+            self._kernel, a._kernel
+        ):
+            # e.g., source estimates from the same inverse operator
+            self._sens_data = self._sens_data + sign * a._sens_data
+        elif self._kernel.shape[1] + a._kernel.shape[1] < self.shape[-1]:
+            # K1 @ S1 + K2 @ S2 == [K1, K2] @ [S1; S2], which is only smaller
+            # than the dense data while there are fewer channels than times
+            self._kernel = np.concatenate([self._kernel, sign * a._kernel], axis=1)
+            self._sens_data = np.concatenate([self._sens_data, a._sens_data])
+        else:
+            return False
+        return True
+
     def mean(self):
         """Make a summary stc file with mean over time points.
 
@@ -1042,12 +1074,15 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         stc : SourceEstimate | VectorSourceEstimate
             The modified stc.
         """
-        data = self.data
-        tmax = self.tmin + self.tstep * data.shape[-1]
+        if self._factored:
+            data = (self._kernel, self._sens_data.sum(axis=-1, keepdims=True))
+        else:
+            data = self.data.sum(axis=-1, keepdims=True)
+        tmax = self.tmin + self.tstep * self.shape[-1]
         tmin = (self.tmin + tmax) / 2.0
         tstep = tmax - self.tmin
         sum_stc = self.__class__(
-            self.data.sum(axis=-1, keepdims=True),
+            data,
             vertices=self.vertices,
             tmin=tmin,
             tstep=tstep,
@@ -1062,6 +1097,8 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         return stc
 
     def __isub__(self, a):  # noqa: D105
+        if self._add_factored(a, -1):
+            return self
         self._remove_kernel_sens_data_()
         if isinstance(a, _BaseSourceEstimate):
             _verify_source_estimate_compat(self, a)
@@ -1083,6 +1120,9 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         return self.__idiv__(a)
 
     def __idiv__(self, a):  # noqa: D105
+        if self._factored and np.ndim(a) == 0:
+            self._kernel = self._kernel / a
+            return self
         self._remove_kernel_sens_data_()
         if isinstance(a, _BaseSourceEstimate):
             _verify_source_estimate_compat(self, a)
@@ -1098,6 +1138,9 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         return stc
 
     def __imul__(self, a):  # noqa: D105
+        if self._factored and np.ndim(a) == 0:
+            self._kernel = self._kernel * a
+            return self
         self._remove_kernel_sens_data_()
         if isinstance(a, _BaseSourceEstimate):
             _verify_source_estimate_compat(self, a)
@@ -1131,8 +1174,7 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
     def __neg__(self):  # noqa: D105
         """Negate the source estimate."""
         stc = self.copy()
-        stc._remove_kernel_sens_data_()
-        stc.data *= -1
+        stc *= -1
         return stc
 
     def __pos__(self):  # noqa: D105
@@ -1567,11 +1609,12 @@ class _BaseSurfaceSourceEstimate(_BaseSourceEstimate):
         # find output vertices
         vertices = stc_vertices[idx]
 
-        # find data
+        # find data, or the rows of the kernel
+        data = self._kernel if self._factored else self.data
         if label.hemi == "rh":
-            values = self.data[idx + len(self.vertices[0])]
+            values = data[idx + len(self.vertices[0])]
         else:
-            values = self.data[idx]
+            values = data[idx]
 
         return vertices, values
 
@@ -1622,6 +1665,8 @@ class _BaseSurfaceSourceEstimate(_BaseSourceEstimate):
 
         if sum([len(v) for v in vertices]) == 0:
             raise ValueError("No vertices match the label in the stc file")
+        if self._factored:
+            values = (values, self._sens_data)
 
         label_stc = self.__class__(
             values,
@@ -3653,17 +3698,8 @@ def _get_allowed_label_modes(stc):
         return _get_default_label_modes()
 
 
-def _gen_extract_label_time_course(
-    stcs,
-    labels,
-    src,
-    *,
-    mode="mean",
-    allow_empty=False,
-    mri_resolution=True,
-    verbose=None,
-):
-    # loop through source estimates and extract time series
+def _prepare_extraction_labels(labels, src, mode, mri_resolution):
+    """Get the labels to extract and the number of mixed volumes to average."""
     if src is None and mode in ["mean", "max"]:
         kind = "surface"
     else:
@@ -3678,22 +3714,45 @@ def _gen_extract_label_time_course(
     else:
         labels = _volume_labels(src, labels, mri_resolution)
         use_sparse = bool(mri_resolution)
-    n_mode = len(labels)  # how many processed with the given mode
     n_mean = len(src[2:]) if kind == "mixed" else 0
+    return labels, use_sparse, n_mean
+
+
+def _check_extraction_mode(stc, mode):
+    """Check the extraction mode for a source estimate and resolve "auto"."""
+    _check_option(
+        "mode",
+        mode,
+        _get_allowed_label_modes(stc),
+        "when using a vector and/or volume source estimate",
+    )
+    if isinstance(stc, _BaseVolSourceEstimate | _BaseVectorSourceEstimate):
+        mode = "mean" if mode == "auto" else mode
+    else:
+        mode = "mean_flip" if mode == "auto" else mode
+    return mode
+
+
+def _gen_extract_label_time_course(
+    stcs,
+    labels,
+    src,
+    *,
+    mode="mean",
+    allow_empty=False,
+    mri_resolution=True,
+    verbose=None,
+):
+    # loop through source estimates and extract time series
+    labels, use_sparse, n_mean = _prepare_extraction_labels(
+        labels, src, mode, mri_resolution
+    )
+    n_mode = len(labels)  # how many processed with the given mode
     n_labels = n_mode + n_mean
     vertno = func = None
     for si, stc in enumerate(stcs):
         _validate_type(stc, _BaseSourceEstimate, f"stcs[{si}]", "source estimate")
-        _check_option(
-            "mode",
-            mode,
-            _get_allowed_label_modes(stc),
-            "when using a vector and/or volume source estimate",
-        )
-        if isinstance(stc, _BaseVolSourceEstimate | _BaseVectorSourceEstimate):
-            mode = "mean" if mode == "auto" else mode
-        else:
-            mode = "mean_flip" if mode == "auto" else mode
+        mode = _check_extraction_mode(stc, mode)
         if vertno is None:
             vertno = copy.deepcopy(stc.vertices)  # avoid keeping a ref
             nvert = np.array([len(v) for v in vertno])
@@ -3718,33 +3777,50 @@ def _gen_extract_label_time_course(
 
         logger.info("Extracting time courses for %d labels (mode: %s)", n_labels, mode)
 
+        # With a kernel, the rows of the labels are taken (and for linear modes
+        # reduced) before they are applied to the sensor data
+        if stc._factored:
+            data, sens_data = stc._kernel, stc._sens_data
+            dtype = np.result_type(data, sens_data)
+        else:
+            data, sens_data = stc.data, None
+            dtype = data.dtype
+
         # do the extraction
         if mode is None:
             # prepopulate an empty list for easy array-like index-based assignment
             label_tc = [None] * max(len(label_vertidx), len(src_flip))
         else:
             # For other modes, initialize the label_tc array
-            label_tc = np.zeros((n_labels,) + stc.data.shape[1:], dtype=stc.data.dtype)
+            label_tc = np.zeros((n_labels,) + stc.shape[1:], dtype=dtype)
         for i, (vertidx, flip) in enumerate(zip(label_vertidx, src_flip)):
             if vertidx is not None:
                 if isinstance(vertidx, sparse.csr_array):
                     assert mri_resolution
-                    assert vertidx.shape[1] == stc.data.shape[0]
-                    this_data = np.reshape(stc.data, (stc.data.shape[0], -1))
+                    assert vertidx.shape[1] == data.shape[0]
+                    this_data = np.reshape(data, (data.shape[0], -1))
                     this_data = vertidx @ this_data
                     this_data = _reshape_view(
-                        this_data, (this_data.shape[0],) + stc.data.shape[1:]
+                        this_data, (this_data.shape[0],) + data.shape[1:]
                     )
                 else:
-                    this_data = stc.data[vertidx]
-                label_tc[i] = func(flip, this_data)
+                    this_data = data[vertidx]
+                if sens_data is None:
+                    label_tc[i] = func(flip, this_data)
+                elif mode in ("mean", "mean_flip"):
+                    label_tc[i] = func(flip, this_data) @ sens_data
+                else:
+                    label_tc[i] = func(flip, this_data @ sens_data)
 
         if mode is not None:
             offset = nvert[:-n_mean].sum()  # effectively :2 or :0
             for i, nv in enumerate(nvert[2:]):
                 if nv != 0:
                     v2 = offset + nv
-                    label_tc[n_mode + i] = np.mean(stc.data[offset:v2], axis=0)
+                    this_tc = np.mean(data[offset:v2], axis=0)
+                    if sens_data is not None:
+                        this_tc = this_tc @ sens_data
+                    label_tc[n_mode + i] = this_tc
                     offset = v2
         yield label_tc
 
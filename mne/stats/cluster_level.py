@@ -27,6 +27,12 @@ from ..utils import (
 )
 from .parametric import f_oneway, ttest_1samp_no_p
 
+# approximate size of the stat maps of permutations computed at once
+_PERM_BATCH_BYTES = 2**24
+# relative size of the sum of squared deviations below which the one-pass
+# variance of sign-flipped data is not accurate enough
+_1SAMP_SS_RTOL = 1e-8
+
 
 def _get_buddies_fallback(r, s, neighbors, indices=None):
     if indices is None:
@@ -102,11 +108,144 @@ if has_numba:  # pragma: no cover
                 return ii
         return -1
 
+    @jit()
+    def _find_root(parent, ii):
+        root = ii
+        while parent[root] != root:
+            root = parent[root]
+        # compress the path we just walked
+        while parent[ii] != root:
+            parent[ii], ii = root, parent[ii]
+        return root
+
+    @jit()
+    def _union(parent, ii, jj):
+        ii = _find_root(parent, ii)
+        jj = _find_root(parent, jj)
+        # keep the smallest index as root so labels follow first appearance
+        if ii < jj:
+            parent[jj] = ii
+        elif jj < ii:
+            parent[ii] = jj
+
+    @jit()
+    def _get_labels_st(x_in, indptr, indices, max_step):
+        # union-find over the (time x space) lattice, x_in is raveled
+        n_src = len(indptr) - 1
+        n_times = len(x_in) // n_src
+        parent = np.arange(len(x_in))
+        for ii in range(len(x_in)):
+            if not x_in[ii]:
+                continue
+            t, v = divmod(ii, n_src)
+            base = t * n_src
+            for ni in range(indptr[v], indptr[v + 1]):
+                jj = base + indices[ni]
+                if x_in[jj]:
+                    _union(parent, ii, jj)
+            for step in range(1, min(max_step, n_times - 1 - t) + 1):
+                jj = ii + step * n_src
+                if x_in[jj]:
+                    _union(parent, ii, jj)
+        # number the clusters in order of their first (smallest) index
+        labels = np.full(len(x_in), -1, np.int64)
+        n_labels = 0
+        for ii in range(len(x_in)):
+            if x_in[ii]:
+                root = _find_root(parent, ii)
+                if root == ii:
+                    labels[ii] = n_labels
+                    n_labels += 1
+                else:
+                    labels[ii] = labels[root]
+        return labels, n_labels
+
+    @jit()
+    def _tfce_root(parent, delta, ii):
+        root = ii
+        offset = 0.0
+        while parent[root] != root:
+            offset += delta[root]
+            root = parent[root]
+        # compress the path, keeping the offsets relative to the root
+        while ii != root and parent[ii] != root:
+            next_ii = parent[ii]
+            next_offset = offset - delta[ii]
+            parent[ii] = root
+            delta[ii] = offset
+            ii, offset = next_ii, next_offset
+        return root
+
+    @jit()
+    def _tfce_flush(root, level, delta, size, acc, cum, e_power):
+        # add the scores of the levels since the last update of this cluster
+        delta[root] += size[root] ** e_power * (cum[level] - cum[acc[root]])
+        acc[root] = level
+
+    @jit()
+    def _tfce_add(
+        scores, v, thresholds, h, e_power, indptr, indices, max_step, partitions
+    ):
+        # sweep the thresholds from the most extreme one, adding points in
+        # order of decreasing value and merging clusters with a union-find
+        # that stores score offsets relative to the parent (cluster scores
+        # are added to the roots lazily, when clusters grow)
+        n_src = len(indptr) - 1
+        n_levels = len(thresholds)
+        cum = np.zeros(n_levels + 1)
+        for level in range(n_levels - 1, -1, -1):
+            cum[level] = cum[level + 1] + h[level]
+        parent = np.full(len(v), -1, np.int64)
+        size = np.zeros(len(v))
+        acc = np.zeros(len(v), np.int64)
+        delta = np.zeros(len(v))
+        order = np.argsort(-v)
+        pos = 0
+        for level in range(n_levels - 1, -1, -1):
+            while pos < len(v) and v[order[pos]] > thresholds[level]:
+                ii = order[pos]
+                pos += 1
+                parent[ii] = ii
+                size[ii] = 1
+                acc[ii] = level + 1
+                t, vert = divmod(ii, n_src)
+                n_nb = indptr[vert + 1] - indptr[vert]
+                for ni in range(n_nb + 2 * max_step):
+                    if ni < n_nb:
+                        jj = t * n_src + indices[indptr[vert] + ni]
+                    else:
+                        step = (ni - n_nb) // 2 + 1
+                        jj = ii + step * n_src if (ni - n_nb) % 2 else ii - step * n_src
+                        if jj < 0 or jj >= len(v):
+                            continue
+                    if parent[jj] < 0 or partitions[jj] != partitions[ii]:
+                        continue
+                    ri = _tfce_root(parent, delta, ii)
+                    rj = _tfce_root(parent, delta, jj)
+                    if ri == rj:
+                        continue
+                    _tfce_flush(ri, level + 1, delta, size, acc, cum, e_power)
+                    _tfce_flush(rj, level + 1, delta, size, acc, cum, e_power)
+                    if size[ri] < size[rj]:
+                        ri, rj = rj, ri
+                    parent[rj] = ri
+                    delta[rj] -= delta[ri]
+                    size[ri] += size[rj]
+        for ii in range(len(v)):
+            if parent[ii] == ii:
+                _tfce_flush(ii, 0, delta, size, acc, cum, e_power)
+        for ii in range(len(v)):
+            if parent[ii] >= 0:
+                root = _tfce_root(parent, delta, ii)
+                scores[ii] += delta[ii] + (delta[root] if root != ii else 0.0)
+
 else:  # pragma: no cover
     # fastest ways we've found with NumPy
     _get_buddies = _get_buddies_fallback
     _get_selves = _get_selves_fallback
     _where_first = _where_first_fallback
+    _get_labels_st = None
+    _tfce_add = None
 
 
 @jit()
@@ -259,6 +398,8 @@ def _get_clusters_st_multistep(keepers, neighbors, max_step=1):
 
 def _get_clusters_st(x_in, neighbors, max_step=1):
     """Choose the most efficient version."""
+    if _get_labels_st is not None:
+        return _get_clusters_st_labels(x_in, neighbors, max_step)
     n_src = len(neighbors)
     n_times = x_in.size // n_src
     cl_goods = np.where(x_in)[0]
@@ -286,6 +427,40 @@ def _get_clusters_st(x_in, neighbors, max_step=1):
         return []
 
 
+def _get_clusters_st_labels(x_in, neighbors, max_step=1):
+    """Calculate clusters by labeling the lattice of time x space at once."""
+    indptr, indices = _neighbors_csr(neighbors)
+    labels, n_labels = _get_labels_st(x_in, indptr, indices, max_step)
+    if n_labels == 0:
+        return []
+    idx = np.where(x_in)[0]
+    labels = labels[idx]
+    order = np.argsort(labels, kind="stable")
+    bounds = np.cumsum(np.bincount(labels, minlength=n_labels))[:-1]
+    return np.split(idx[order], bounds)
+
+
+def _neighbors_csr(neighbors):
+    """Get the CSR index arrays of spatial neighbor lists."""
+    if isinstance(neighbors, _Neighbors):
+        return neighbors.indptr, neighbors.indices
+    indptr = np.cumsum([0] + [len(n) for n in neighbors])
+    indices = np.concatenate([np.asarray(n, int) for n in neighbors])
+    return indptr, indices
+
+
+class _Neighbors(list):
+    """Spatial neighbor lists of a CSR adjacency, keeping its index arrays."""
+
+    def __init__(self, adjacency):
+        super().__init__(
+            adjacency.indices[adjacency.indptr[i] : adjacency.indptr[i + 1]]
+            for i in range(len(adjacency.indptr) - 1)
+        )
+        self.indptr = adjacency.indptr
+        self.indices = adjacency.indices
+
+
 def _get_components(x_in, adjacency, return_list=True):
     """Get connected components from a mask and a adjacency matrix."""
     if adjacency is False:
@@ -438,6 +613,22 @@ def _find_clusters(
     if tail == -1 and not np.all(np.diff(thresholds) < 0):
         raise ValueError("Thresholds must be monotonically decreasing")
 
+    if tfce and _tfce_add is not None and x.ndim == 1:
+        if sparse.issparse(adjacency) or isinstance(adjacency, list):
+            # all thresholds in a single sweep
+            scores = _tfce_scores(
+                x,
+                thresholds,
+                tail,
+                adjacency,
+                max_step,
+                include,
+                partitions,
+                h_power,
+                e_power,
+            )
+            return None, scores
+
     # set these here just in case thresholds == []
     clusters = list()
     sums = list()
@@ -489,6 +680,41 @@ def _find_clusters(
     return clusters, sums
 
 
+def _tfce_scores(
+    x, thresholds, tail, adjacency, max_step, include, partitions, h_power, e_power
+):
+    """Compute TFCE scores for all thresholds at once."""
+    thresholds = np.asarray(thresholds, float)
+    h = np.abs(np.diff(thresholds, prepend=0.0)) ** h_power
+    if isinstance(adjacency, list):
+        indptr, indices = _neighbors_csr(adjacency)
+    else:
+        adjacency = sparse.csr_array(adjacency)
+        adjacency = (adjacency + adjacency.T).tocsr()
+        indptr, indices = adjacency.indptr, adjacency.indices
+        max_step = 0
+    if partitions is None:
+        partitions = np.zeros(x.size, np.int64)
+    scores = np.zeros(x.size)
+    # tail == 0 clusters positive and negative values separately
+    signs = dict(zip((-1, 0, 1), ([-1], [1, -1], [1])))[tail]
+    for sign in signs:
+        v = sign * x.astype(float)
+        v[~include | np.isnan(v)] = -np.inf
+        _tfce_add(
+            scores,
+            v,
+            thresholds * (-1 if tail == -1 else 1),
+            h,
+            float(e_power),
+            indptr,
+            indices,
+            max_step,
+            partitions,
+        )
+    return scores
+
+
 def _find_clusters_1dir_parts(
     x, x_in, adjacency, max_step, partitions, t_power, ndimage
 ):
@@ -631,10 +857,7 @@ def _setup_adjacency(adjacency, n_tests, n_times):
             )
         # we claim to only use upper triangular part... not true here
         adjacency = (adjacency + adjacency.transpose()).tocsr()
-        adjacency = [
-            adjacency.indices[adjacency.indptr[i] : adjacency.indptr[i + 1]]
-            for i in range(len(adjacency.indptr) - 1)
-        ]
+        adjacency = _Neighbors(adjacency)
     return adjacency
 
 
@@ -654,45 +877,11 @@ def _do_permutations(
     buffer_size,
     progress_bar,
 ):
-    n_samp, n_vars = X_full.shape
-
-    if buffer_size is not None and n_vars <= buffer_size:
-        buffer_size = None  # don't use buffer for few variables
-
     # allocate space for output
     max_cluster_sums = np.empty(len(orders), dtype=np.double)
 
-    if buffer_size is not None:
-        # allocate buffer, so we don't need to allocate memory during loop
-        X_buffer = [
-            np.empty((len(X_full[s]), buffer_size), dtype=X_full.dtype) for s in slices
-        ]
-
-    for seed_idx, order in enumerate(orders):
-        # shuffle sample indices
-        assert order is not None
-        idx_shuffle_list = [order[s] for s in slices]
-
-        if buffer_size is None:
-            # shuffle all data at once
-            X_shuffle_list = [X_full[idx, :] for idx in idx_shuffle_list]
-            t_obs_surr = stat_fun(*X_shuffle_list)
-        else:
-            # only shuffle a small data buffer, so we need less memory
-            t_obs_surr = np.empty(n_vars, dtype=X_full.dtype)
-
-            for pos in range(0, n_vars, buffer_size):
-                # number of variables for this loop
-                n_var_loop = min(pos + buffer_size, n_vars) - pos
-
-                # fill buffer
-                for i, idx in enumerate(idx_shuffle_list):
-                    X_buffer[i][:, :n_var_loop] = X_full[idx, pos : pos + n_var_loop]
-
-                # apply stat_fun and store result
-                tmp = stat_fun(*X_buffer)
-                t_obs_surr[pos : pos + n_var_loop] = tmp[:n_var_loop]
-
+    stats = _permutation_stats(X_full, slices, stat_fun, orders, buffer_size)
+    for seed_idx, t_obs_surr in enumerate(stats):
         # The stat should have the same shape as the samples for no adj.
         if adjacency is None:
             t_obs_surr = _reshape_view(t_obs_surr, sample_shape)
@@ -736,26 +925,147 @@ def _do_1samp_permutations(
     buffer_size,
     progress_bar,
 ):
-    n_samp, n_vars = X.shape
     assert slices is None  # should be None for the 1 sample case
 
+    # allocate space for output
+    max_cluster_sums = np.empty(len(orders), dtype=np.double)
+
+    for seed_idx, t_obs_surr in enumerate(
+        _1samp_permutation_stats(X, stat_fun, orders, buffer_size)
+    ):
+        # The stat should have the same shape as the samples for no adj.
+        if adjacency is None:
+            t_obs_surr = _reshape_view(t_obs_surr, sample_shape)
+
+        # Find cluster on randomized stats
+        out = _find_clusters(
+            t_obs_surr,
+            threshold=threshold,
+            tail=tail,
+            max_step=max_step,
+            adjacency=adjacency,
+            partitions=partitions,
+            include=include,
+            t_power=t_power,
+        )
+        perm_clusters_sums = out[1]
+        if len(perm_clusters_sums) > 0:
+            # get max with sign info
+            idx_max = np.argmax(np.abs(perm_clusters_sums))
+            max_cluster_sums[seed_idx] = perm_clusters_sums[idx_max]
+        else:
+            max_cluster_sums[seed_idx] = 0
+
+        progress_bar.update(seed_idx + 1)
+
+    return max_cluster_sums
+
+
+def _permutation_stats(X_full, slices, stat_fun, orders, buffer_size):
+    """Compute the statistic for each permutation of the samples."""
+    n_samp, n_vars = X_full.shape
+
+    if stat_fun is f_oneway:
+        # compute the F-values of many permutations at once from the sums of
+        # each group, which are products of label matrices with the data
+        n_batch = max(_PERM_BATCH_BYTES // (8 * max(n_vars, 1)), 1)
+        for b_start in range(0, len(orders), n_batch):
+            yield from _f_oneway_permutations(
+                X_full, slices, orders[b_start : b_start + n_batch]
+            )
+        return
+
     if buffer_size is not None and n_vars <= buffer_size:
         buffer_size = None  # don't use buffer for few variables
 
-    # allocate space for output
-    max_cluster_sums = np.empty(len(orders), dtype=np.double)
+    if buffer_size is not None:
+        # allocate buffer, so we don't need to allocate memory during loop
+        X_buffer = [
+            np.empty((len(X_full[s]), buffer_size), dtype=X_full.dtype) for s in slices
+        ]
+
+    for order in orders:
+        # shuffle sample indices
+        assert order is not None
+        idx_shuffle_list = [order[s] for s in slices]
+
+        if buffer_size is None:
+            # shuffle all data at once
+            X_shuffle_list = [X_full[idx, :] for idx in idx_shuffle_list]
+            t_obs_surr = stat_fun(*X_shuffle_list)
+        else:
+            # only shuffle a small data buffer, so we need less memory
+            t_obs_surr = np.empty(n_vars, dtype=X_full.dtype)
+
+            for pos in range(0, n_vars, buffer_size):
+                # number of variables for this loop
+                n_var_loop = min(pos + buffer_size, n_vars) - pos
+
+                # fill buffer
+                for i, idx in enumerate(idx_shuffle_list):
+                    X_buffer[i][:, :n_var_loop] = X_full[idx, pos : pos + n_var_loop]
+
+                # apply stat_fun and store result
+                tmp = stat_fun(*X_buffer)
+                t_obs_surr[pos : pos + n_var_loop] = tmp[:n_var_loop]
+        yield t_obs_surr
+
+
+def _f_oneway_permutations(X_full, slices, orders):
+    """Compute f_oneway for several permutations of the samples at once."""
+    n_samples, n_classes = len(X_full), len(slices)
+    labels = np.zeros((len(orders), n_samples), dtype=np.intp)
+    for k, sl in enumerate(slices):
+        for ii, order in enumerate(orders):
+            labels[ii, order[sl]] = k
+    ss_alldata = np.sum(X_full**2, axis=0)
+    square_of_sums_alldata = np.sum(X_full, axis=0) ** 2
+    sstot = ss_alldata - square_of_sums_alldata / float(n_samples)
+    ssbn = 0
+    for k, sl in enumerate(slices):
+        sums = (labels == k).astype(X_full.dtype) @ X_full
+        ssbn += sums**2 / (sl.stop - sl.start)
+    ssbn -= square_of_sums_alldata / float(n_samples)
+    sswn = sstot - ssbn
+    msb = ssbn / float(n_classes - 1)
+    msw = sswn / float(n_samples - n_classes)
+    return msb / msw
+
+
+def _1samp_permutation_stats(X, stat_fun, orders, buffer_size):
+    """Compute the statistic for each sign flip of the samples."""
+    n_samp, n_vars = X.shape
+
+    if stat_fun is ttest_1samp_no_p:
+        # compute the t-values of many sign flips at once: the sum of squares
+        # does not change and the means are a product of the signs with the data
+        n_batch = max(_PERM_BATCH_BYTES // (8 * max(n_vars, 1)), 1)
+        sum_sq = np.sum(X**2, axis=0)
+        for b_start in range(0, len(orders), n_batch):
+            signs = _1samp_signs(orders[b_start : b_start + n_batch], n_samp)
+            mean = (signs @ X) / n_samp
+            ss = sum_sq - n_samp * mean**2
+            t_obs_surr = mean / np.sqrt(np.maximum(ss, 0) / (n_samp * (n_samp - 1)))
+            # the difference cancels when the spread of the data is small
+            # relative to their mean, use the exact two-pass variance there
+            bad_rows, bad_cols = np.nonzero(ss < _1SAMP_SS_RTOL * sum_sq)
+            for ii in np.unique(bad_rows):
+                cols = bad_cols[bad_rows == ii]
+                t_obs_surr[ii, cols] = ttest_1samp_no_p(
+                    signs[ii][:, np.newaxis] * X[:, cols]
+                )
+            yield from t_obs_surr
+        return
+
+    if buffer_size is not None and n_vars <= buffer_size:
+        buffer_size = None  # don't use buffer for few variables
 
     if buffer_size is not None:
         # allocate a buffer so we don't need to allocate memory in loop
         X_flip_buffer = np.empty((n_samp, buffer_size), dtype=X.dtype)
 
-    for seed_idx, order in enumerate(orders):
-        assert isinstance(order, np.ndarray)
-        # new surrogate data with specified sign flip
-        assert order.size == n_samp  # should be guaranteed by parent
-        signs = 2 * order[:, None].astype(int) - 1
-        if not np.all(np.equal(np.abs(signs), 1)):
-            raise ValueError("signs from rng must be +/- 1")
+    for order in orders:
+        signs = _1samp_signs([order], n_samp).T
 
         if buffer_size is None:
             # be careful about non-writable memmap (GH#1507)
@@ -780,33 +1090,19 @@ def _do_1samp_permutations(
                 # apply stat_fun and store result
                 tmp = stat_fun(X_flip_buffer)
                 t_obs_surr[pos : pos + n_var_loop] = tmp[:n_var_loop]
+        yield t_obs_surr
 
-        # The stat should have the same shape as the samples for no adj.
-        if adjacency is None:
-            t_obs_surr = _reshape_view(t_obs_surr, sample_shape)
-
-        # Find cluster on randomized stats
-        out = _find_clusters(
-            t_obs_surr,
-            threshold=threshold,
-            tail=tail,
-            max_step=max_step,
-            adjacency=adjacency,
-            partitions=partitions,
-            include=include,
-            t_power=t_power,
-        )
-        perm_clusters_sums = out[1]
-        if len(perm_clusters_sums) > 0:
-            # get max with sign info
-            idx_max = np.argmax(np.abs(perm_clusters_sums))
-            max_cluster_sums[seed_idx] = perm_clusters_sums[idx_max]
-        else:
-            max_cluster_sums[seed_idx] = 0
-
-        progress_bar.update(seed_idx + 1)
 
-    return max_cluster_sums
+def _1samp_signs(orders, n_samp):
+    """Convert sign-flip orders to an array of +/- 1, shape (n_orders, n_samp)."""
+    for order in orders:
+        assert isinstance(order, np.ndarray)
+        # new surrogate data with specified sign flip
+        assert order.size == n_samp  # should be guaranteed by parent
+    signs = 2 * np.array(orders, int).reshape(len(orders), n_samp) - 1
+    if not np.all(np.equal(np.abs(signs), 1)):
+        raise ValueError("signs from rng must be +/- 1")
+    return signs
 
 
 def bin_perm_rep(ndim, a=0, b=1):
@@ -176,6 +176,83 @@ def test_permutation_large_n_samples(numba_conditional):
             assert len(np.unique(H0)) >= 1024 - (H0 == 0).sum()
 
 
+@pytest.mark.parametrize("kind", ("1samp", "f"))
+def test_permutation_batched_stats(kind, monkeypatch):
+    """Test that stats of batched permutations match per-permutation ones."""
+    import mne.stats.cluster_level as cl
+
+    condition1_1d, condition2_1d, _, _ = _get_conditions()
+    if kind == "1samp":
+        func, stat_fun = permutation_cluster_1samp_test, ttest_1samp_no_p
+        X = condition1_1d - condition2_1d.mean(0)
+    else:
+        func, stat_fun = permutation_cluster_test, f_oneway
+        X = [condition1_1d, condition2_1d]
+    kwargs = dict(threshold=1.67, n_permutations=100, seed=0, out_type="mask")
+    # small batches so that several are needed
+    monkeypatch.setattr(cl, "_PERM_BATCH_BYTES", 8 * n_space * 7)
+    out = func(X, stat_fun=stat_fun, **kwargs)
+    # stat_fun that is not special-cased uses the per-permutation loop
+    out_loop = func(X, stat_fun=lambda *x: stat_fun(*x), **kwargs)
+    out_jobs = func(X, stat_fun=stat_fun, n_jobs=2, **kwargs)
+    for o in (out_loop, out_jobs):
+        assert_allclose(out[0], o[0])
+        assert_array_equal(out[1], o[1])
+        assert_allclose(out[2], o[2])
+        assert_allclose(out[3], o[3], rtol=1e-10)
+
+
+def test_permutation_batched_1samp_offset():
+    """Test batched sign-flip t-values on data with a large offset."""
+    rng = np.random.RandomState(0)
+    # few samples and tail=1 so that all sign flips are used, including the
+    # one that leaves the offset in place
+    X = 1e4 + 1e-3 * rng.randn(6, 50)
+    kwargs = dict(threshold=1.0, tail=1, n_permutations=64, out_type="mask")
+    t_obs, _, _, H0 = permutation_cluster_1samp_test(
+        X, stat_fun=ttest_1samp_no_p, **kwargs
+    )
+    # stat_fun that is not special-cased uses the per-permutation loop
+    out_loop = permutation_cluster_1samp_test(
+        X, stat_fun=lambda x: ttest_1samp_no_p(x), **kwargs
+    )
+    assert_allclose(t_obs, out_loop[0])
+    assert_allclose(H0, out_loop[3], rtol=1e-10)
+
+
+def test_clusters_st_labels():
+    """Test that labeling the spatio-temporal lattice matches the full graph."""
+    import mne.stats.cluster_level as cl
+
+    pytest.importorskip("numba")
+    rng = np.random.RandomState(0)
+    n_src, n_times = 200, 10
+    adjacency = sparse.random(n_src, n_src, density=0.01, random_state=rng)
+    adjacency = ((adjacency + adjacency.T) > 0).astype(float)
+    neighbors = cl._setup_adjacency(adjacency, n_src * n_times, n_times)
+    assert isinstance(neighbors, cl._Neighbors)
+    x_in = rng.rand(n_times * n_src) > 0.8
+    full = combine_adjacency(n_times, adjacency).tocoo()
+    want = sorted(cl._get_components(x_in, full), key=np.min)
+    assert len(want) > 10
+    clusters = cl._get_clusters_st(x_in, neighbors)
+    # plain lists of neighbors work too
+    clusters_list = cl._get_clusters_st(x_in, list(neighbors))
+    for got in (clusters, clusters_list):
+        assert len(got) == len(want)
+        for c, w in zip(got, want):
+            assert_array_equal(c, w)
+    assert cl._get_clusters_st(np.zeros_like(x_in), neighbors) == []
+    # max_step > 1 links the same vertex across time gaps
+    x_in = np.zeros((n_times, n_src), bool)
+    x_in[[0, 2, 5], 0] = True
+    x_in = x_in.ravel()
+    assert len(cl._get_clusters_st(x_in, neighbors, max_step=1)) == 3
+    clusters = cl._get_clusters_st(x_in, neighbors, max_step=2)
+    assert_array_equal(clusters[0], [0, 2 * n_src])
+    assert_array_equal(clusters[1], [5 * n_src])
+
+
 def test_permutation_step_down_p(numba_conditional):
     """Test cluster level permutations with step_down_p."""
     rng = np.random.RandomState(0)
@@ -816,6 +893,36 @@ def test_tfce_thresholds(numba_conditional):
     permutation_cluster_1samp_test(X=data[..., 0], threshold=dict(start=0, step=0.2))
 
 
+@pytest.mark.parametrize("tail", (-1, 0, 1))
+@pytest.mark.parametrize("kind", ("list", "sparse"))
+def test_tfce_sweep(tail, kind, monkeypatch):
+    """Test that the TFCE sweep matches clustering at each threshold."""
+    import mne.stats.cluster_level as cl
+
+    pytest.importorskip("numba")
+    rng = np.random.RandomState(0)
+    n_src, n_times = 100, 6
+    adjacency = sparse.random(n_src, n_src, density=0.03, random_state=rng)
+    adjacency = ((adjacency + adjacency.T) > 0).astype(float)
+    if kind == "list":
+        adjacency = cl._setup_adjacency(adjacency, n_src * n_times, n_times)
+    else:
+        adjacency = combine_adjacency(n_times, adjacency).tocoo()
+    x = rng.randn(n_src * n_times) * 2
+    x[:3] = [np.inf, np.nan, -np.inf]
+    include = rng.rand(x.size) > 0.1
+    partitions = (np.arange(x.size) % n_src < 40).astype(int)
+    threshold = dict(start=0, step=0.2 * (tail or 1), h_power=1.5, e_power=0.7)
+    for kwargs in (dict(), dict(max_step=2, include=include, partitions=partitions)):
+        clusters, scores = cl._find_clusters(x, threshold, tail, adjacency, **kwargs)
+        assert clusters is None
+        with monkeypatch.context() as m:
+            m.setattr(cl, "_tfce_add", None)
+            want = cl._find_clusters(x, threshold, tail, adjacency, **kwargs)[1]
+        assert np.count_nonzero(want) > x.size // 4
+        assert_allclose(scores, want, rtol=1e-10, atol=1e-10)
+
+
 # 1D gives slices, 2D+ gives boolean masks
 @pytest.mark.parametrize("shape", ((11,), (11, 3), (11, 1, 2)))
 @pytest.mark.parametrize("out_type", ("mask", "indices"))
@@ -807,6 +807,95 @@ def test_reject_by_annotations_reject_tmin_reject_tmax():
     assert len(epochs) == 1
 
 
+@pytest.mark.parametrize("preload_raw", (False, True))
+def test_epochs_batched_from_raw(tmp_path, monkeypatch, preload_raw):
+    """Test loading batches of epochs from Raw against one epoch at a time."""
+    rng = np.random.default_rng(0)
+    info = mne.create_info(["a", "b", "c", "d"], 1000.0, ["eeg"] * 3 + ["eog"])
+    data = rng.standard_normal((4, 20000)) * 1e-6
+    data[1, 5000:5100] += 1e-4  # rejected by ptp
+    data[:3, 11800:12700] = 0  # flat
+    raw = RawArray(data, info, first_samp=100)
+    with raw.info._unlock():
+        raw.info["lowpass"] = 100.0
+    raw.set_eeg_reference(projection=True)
+    raw.set_annotations(mne.Annotations([8.1, 15.0], [0.2, 0.1], ["bad", "good"]))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    raw = read_raw_fif(fname, preload=preload_raw)
+    # out-of-bounds, overlapping and sparse events
+    samps = [50, 400, 1000, 1100, 1150, 3000, 5050, 8200, 9000, 12100, 15050, 19900]
+    events = np.array([[s + 100, 0, 1] for s in samps])
+    kwargs = dict(
+        tmin=-0.2,
+        tmax=0.5,
+        baseline=(None, 0),
+        reject=dict(eeg=5e-5),
+        flat=dict(eeg=1e-9),
+        detrend=1,
+        decim=3,
+        proj="delayed",
+        reject_tmax=0.4,
+    )
+    want = list()
+    with monkeypatch.context() as m:
+        m.setattr(Epochs, "_get_epochs_from_raw", BaseEpochs._get_epochs_from_raw)
+        for preload in (False, True):
+            epochs = Epochs(raw, events, preload=preload, **kwargs)
+            want.append((epochs.get_data(), epochs.drop_log))
+        want_ave = epochs.average().data
+    assert want[0][1] == want[1][1]
+    drop_log = want[0][1]
+    assert drop_log[0] == ("NO_DATA",)
+    assert drop_log[-1] == ("TOO_SHORT",)
+    assert drop_log[6] == ("b",)
+    assert drop_log[7] == ("bad",)
+    assert drop_log[9] == ("a", "b", "c")
+    assert drop_log.count(()) == 7
+    monkeypatch.setattr(mne.utils.mixin, "_EPOCH_BATCH_BYTES", 4 * 8 * 700 * 5)
+    for preload, (want_data, want_drop_log) in zip((False, True), want):
+        epochs = Epochs(raw, events, preload=preload, **kwargs)
+        assert_allclose(epochs.get_data(), want_data, rtol=1e-7, atol=1e-20)
+        assert epochs.drop_log == want_drop_log
+        epochs = Epochs(raw, events, preload=False, **kwargs).drop_bad()
+        assert_allclose(epochs.get_data(), want_data, rtol=1e-7, atol=1e-20)
+        assert_allclose(epochs.average().data, want_ave, rtol=1e-7, atol=1e-20)
+
+
+@pytest.mark.parametrize("proj", (True, "delayed"))
+def test_drop_bad_batched(monkeypatch, proj):
+    """Test preloaded rejection in batches against one epoch at a time."""
+    rng = np.random.default_rng(0)
+    info = create_info(["a", "b", "c", "d", "e"], 100.0, ["eeg"] * 3 + ["eog"] * 2)
+    data = rng.standard_normal((200, 5, 50)) * 1e-6
+    data[::7, 1] *= 100  # rejected by ptp
+    data[::11, 2:4] = 0  # flat
+    data[::13, 4] *= 100  # ignored as bad
+    info["bads"] = ["e"]
+    epochs = EpochsArray(data, info, proj=proj, reject_tmin=0.1)
+    epochs.set_eeg_reference(projection=True)
+    reject = dict(eeg=2e-5, eog=2e-5)
+    flat = dict(eeg=1e-9, eog=1e-9)
+    want = epochs.copy()
+    with monkeypatch.context() as m:
+        m.setattr(mne.utils.mixin, "_EPOCH_BATCH_BYTES", 0)  # one at a time
+        want.drop_bad(reject=reject, flat=flat)
+    assert len(want) < len(epochs)
+    assert want.drop_log[7] == ("b",)
+    assert want.drop_log[11] == ("c", "d")
+    assert want.drop_log[77] == ("b", "c", "d")
+    monkeypatch.setattr(mne.utils.mixin, "_EPOCH_BATCH_BYTES", 5 * 50 * 8 * 30)
+    got = epochs.copy().drop_bad(reject=reject, flat=flat)
+    assert got.drop_log == want.drop_log
+    assert_array_equal(got.selection, want.selection)
+    assert_array_equal(got._data, want._data)
+    # callable criteria are evaluated one epoch at a time
+    reject["eeg"] = lambda x: ((np.ptp(x, axis=1) > 2e-5).any(), "too big")
+    got = epochs.copy().drop_bad(reject=reject, flat=flat)
+    assert got.drop_log[7] == ("too big",)
+    assert_array_equal(got.selection, want.selection)
+
+
 def test_own_data():
     """Test for epochs data ownership (gh-5346)."""
     raw, events = _get_data()[:2]
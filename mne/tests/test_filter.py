@@ -2,6 +2,8 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 from numpy.fft import fft, fftfreq
@@ -18,6 +20,7 @@ from scipy.signal import resample as sp_resample
 from mne import Epochs, create_info
 from mne._fiff.pick import _DATA_CH_TYPES_SPLIT
 from mne.filter import (
+    _filter_cache,
     _length_factors,
     _overlap_add_filter,
     _resample_stim_channels,
@@ -31,8 +34,15 @@ from mne.filter import (
     notch_filter,
     resample,
 )
-from mne.io import RawArray, read_raw_fif
-from mne.utils import catch_logging, requires_mne, run_subprocess, sum_squared
+from mne.io import BaseRaw, RawArray, read_raw_fif
+from mne.utils import (
+    catch_logging,
+    clear_cache,
+    get_cache_info,
+    requires_mne,
+    run_subprocess,
+    sum_squared,
+)
 
 resample_method_parametrize = pytest.mark.parametrize("method", ("fft", "polyphase"))
 
@@ -370,6 +380,27 @@ def test_notch_filters(method, filter_length, line_freq, tol):
     assert_almost_equal(new_power, orig_power, tol)
 
 
+@pytest.mark.parametrize("line_freq", (None, line_freqs))
+def test_notch_spectrum_fit_blocks(line_freq, monkeypatch):
+    """Test fitting long sinusoids in blocks of time rather than at once."""
+    import mne.filter as filt
+
+    rng = np.random.RandomState(0)
+    sfreq = 487.0
+    t = np.arange(21 * int(sfreq)) / sfreq
+    x = rng.randn(2, len(t))
+    x += np.sum([np.sin(2 * np.pi * f * t) for f in line_freqs], axis=0)
+    kwargs = dict(filter_length=None, method="spectrum_fit")
+    clear_cache("filter")
+    want = notch_filter(x, sfreq, line_freq, **kwargs)
+    assert get_cache_info()["filter"]["size"] == 1  # the basis
+    monkeypatch.setattr(filt, "_LINE_BASIS_BLOCK_BYTES", 2**14)
+    clear_cache("filter")
+    got = notch_filter(x, sfreq, line_freq, **kwargs)
+    assert get_cache_info()["filter"]["size"] == 0  # too large to cache
+    assert_allclose(got, want, rtol=0, atol=1e-10)
+
+
 @resample_method_parametrize
 def test_resample(method):
     """Test resampling."""
@@ -434,6 +465,83 @@ def test_n_jobs(n_jobs, capsys):
     assert_allclose(y1, y2)
 
 
+@pytest.mark.parametrize("backend", ("threading", "loky"))
+def test_n_jobs_overlap_add_blocks(backend):
+    """Test FIR filtering of channel blocks in parallel."""
+    joblib = pytest.importorskip("joblib")
+    x = np.random.RandomState(0).randn(7, 1000)
+    picks = [0, 2, 3, 4, 6]
+    y1 = filter_data(x, 100.0, 1, 40, picks=picks, n_jobs=None)
+    assert_array_equal(y1[[1, 5]], x[[1, 5]])
+    with joblib.parallel_config(backend=backend):
+        y2 = filter_data(x, 100.0, 1, 40, picks=picks, n_jobs=3)
+    assert_allclose(y1, y2)
+    with joblib.parallel_config(backend=backend):
+        y2 = filter_data(x, 100.0, 1, 40, picks=picks, n_jobs=10)
+    assert_allclose(y1, y2)
+
+
+def test_filter_cache(monkeypatch):
+    """Test reusing designed filters and their FFTs."""
+    x = np.random.RandomState(0).randn(2, 1000)
+    clear_cache("filter")
+    y1 = filter_data(x, 100.0, 1, 40)
+    h1 = create_filter(x, 100.0, 1, 40)
+    info = get_cache_info()["filter"]
+    assert info["nbytes"] > h1.nbytes
+    assert info == dict(hits=1, misses=2, size=2, nbytes=info["nbytes"])
+    h1[:] = 0  # must not modify the cached filter
+    y2 = filter_data(x, 100.0, 1, 40)
+    assert_array_equal(y1, y2)
+    assert get_cache_info()["filter"]["hits"] == 3
+    filter_data(x, 100.0, 1, 30)  # new design
+    assert get_cache_info()["filter"]["misses"] == 4
+    iir_params = dict(order=4, ftype="butter", output="sos")
+    want = construct_iir_filter(iir_params, 40, None, 100.0, "low")
+    got = construct_iir_filter(iir_params, 40, None, 100.0, "low")
+    assert_array_equal(want["sos"], got["sos"])
+    assert want["padlen"] == got["padlen"]
+    assert want["sos"] is not got["sos"]
+    assert want["sos"].flags.writeable
+    info = get_cache_info()["filter"]
+    assert info["hits"] == 5  # design and ringing samples
+    assert info["size"] == 6
+    # the cached values are shared, so read-only
+    arrays = [
+        v
+        for value, _ in _filter_cache._entries.values()
+        for v in (value if isinstance(value, tuple) else (value,))
+        if isinstance(v, np.ndarray)
+    ]
+    assert len(arrays) == 5  # two FIR filters and their FFTs, one IIR filter
+    assert not any(a.flags.writeable for a in arrays)
+    # concurrent use
+    clear_cache("filter")
+    with ThreadPoolExecutor(4) as executor:
+        ys = list(executor.map(lambda h: filter_data(x, 100.0, 1, h), [30, 40] * 4))
+    assert_array_equal(ys[1], y1)
+    info = get_cache_info()["filter"]
+    assert info["hits"] + info["misses"] == 16
+    assert info["size"] == 4
+    # the cache is bounded by the size of its entries, or disabled
+    max_nbytes = info["nbytes"] // 2
+    monkeypatch.setenv("MNE_FILTER_CACHE_SIZE", str(max_nbytes))
+    filter_data(x, 100.0, 2, 40)
+    info = get_cache_info()["filter"]
+    assert 0 < info["nbytes"] <= max_nbytes
+    assert info["size"] < 4
+    monkeypatch.setenv("MNE_FILTER_CACHE_SIZE", "0")
+    clear_cache()
+    y2 = filter_data(x, 100.0, 1, 40)
+    assert_array_equal(y1, y2)
+    assert get_cache_info()["filter"] == dict(hits=0, misses=2, size=0, nbytes=0)
+    monkeypatch.setenv("MNE_FILTER_CACHE_SIZE", "1T")
+    with pytest.raises(ValueError, match="must be a size in bytes"):
+        filter_data(x, 100.0, 1, 40)
+    with pytest.raises(ValueError, match="Invalid value for the 'name'"):
+        clear_cache("foo")
+
+
 def test_resamp_stim_channel():
     """Test resampling of stim channels."""
     # Downsampling
@@ -800,6 +908,43 @@ def test_filter_auto():
         notch_filter(raw, 1000.0, [60.0])
 
 
+def test_filter_float32(monkeypatch):
+    """Test filtering and resampling in float32 precision mode."""
+    rng = np.random.default_rng(0)
+    sfreq = 1000.0
+    x = rng.standard_normal((4, 10000))
+    x_filt = filter_data(x, sfreq, 1.0, 40.0)
+    x_resamp = resample(x, 1, 4)
+    with pytest.raises(ValueError, match="Data to be filtered must be real"):
+        filter_data(x.astype(np.float32), sfreq, 1.0, 40.0)
+    info = create_info(4, sfreq, "eeg")
+    with pytest.raises(RuntimeError, match="needs MNE_DATA_DTYPE"):
+        BaseRaw(info, preload=x.astype(np.float32))
+    monkeypatch.setenv("MNE_DATA_DTYPE", "float32")
+    x_32 = x.astype(np.float32)
+    with pytest.raises(RuntimeError, match=r"'float32', 'complex64'\), not int"):
+        BaseRaw(info, preload=x_32.astype(int))
+    x_filt_32 = filter_data(x_32, sfreq, 1.0, 40.0)
+    assert x_filt_32.dtype == np.float32
+    assert_allclose(x_filt_32, x_filt, rtol=0, atol=1e-5 * np.abs(x_filt).max())
+    x_resamp_32 = resample(x_32, 1, 4)
+    assert x_resamp_32.dtype == np.float32
+    assert_allclose(x_resamp_32, x_resamp, rtol=0, atol=1e-5 * np.abs(x_resamp).max())
+    # end-to-end: reading, filtering, epoching and averaging stay in float32
+    raw = RawArray(x, info)
+    assert raw._data.dtype == np.float32
+    raw.filter(1.0, 40.0)
+    assert raw._data.dtype == np.float32
+    assert_allclose(raw._data, x_filt, rtol=0, atol=1e-5 * np.abs(x_filt).max())
+    events = np.array([[1000, 0, 1], [5000, 0, 1]])
+    epochs = Epochs(raw, events, tmin=-0.1, tmax=0.5, preload=True)
+    assert epochs.get_data().dtype == np.float32
+    assert epochs.average().data.dtype == np.float32
+    monkeypatch.setenv("MNE_DATA_DTYPE", "float16")
+    with pytest.raises(ValueError, match="Invalid value"):
+        filter_data(x_32, sfreq, 1.0, 40.0)
+
+
 def test_cuda_fir():
     """Test CUDA-based filtering."""
     # Using `n_jobs='cuda'` on a non-CUDA system should be fine,
@@ -36,6 +36,7 @@ from mne.datasets import testing
 from mne.fixes import _get_img_fdata
 from mne.minimum_norm import apply_inverse, make_inverse_operator, read_inverse_operator
 from mne.source_space._source_space import _add_interpolator, _grid_interp
+from mne.surface import _get_ico_surface, write_surface
 from mne.transforms import quat_to_rot
 from mne.utils import _record_warnings, catch_logging
 
@@ -281,6 +282,67 @@ def test_surface_source_morph_shortcut():
     assert abs_sum < 1e-4
 
 
+def test_surface_source_morph_batch(tmp_path, monkeypatch):
+    """Test morphing lists of stcs and caching surface morph matrices."""
+    ico = _get_ico_surface(4)
+    for subject, angle in (("from", 0.0), ("to", 0.1)):
+        (tmp_path / subject / "surf").mkdir(parents=True)
+        rr = 100 * ico["rr"] @ quat_to_rot(np.array([angle, 0.0, 0.0])).T
+        for hemi in ("lh", "rh"):
+            fname = tmp_path / subject / "surf" / f"{hemi}.sphere.reg"
+            write_surface(fname, rr, ico["tris"])
+    vertices = [np.arange(0, len(ico["rr"]), 5), np.arange(0, len(ico["rr"]), 7)]
+    n_vertices = sum(len(v) for v in vertices)
+    rng = np.random.default_rng(0)
+    stcs = [
+        SourceEstimate(rng.standard_normal((n_vertices, 3)), vertices, 0, 1, "from"),
+        SourceEstimate(rng.standard_normal((n_vertices, 1)), vertices, 0, 1, "from"),
+        VectorSourceEstimate(
+            rng.standard_normal((n_vertices, 3, 2)), vertices, 0, 1, "from"
+        ),
+        SourceEstimate(
+            rng.standard_normal((n_vertices, 2)) + 1j, vertices, 0, 1, "from"
+        ),
+    ]
+    kernel = rng.standard_normal((n_vertices, 4))
+    for n_times in (3, 2):  # factored, sharing a kernel
+        sens_data = rng.standard_normal((4, n_times))
+        stcs.append(SourceEstimate((kernel, sens_data), vertices, 0, 1, "from"))
+    kwargs = dict(spacing=2, smooth=3, subjects_dir=tmp_path)
+    morph = compute_source_morph(stcs[0], "from", "to", **kwargs)
+    fnames = list((tmp_path / "morph-maps").glob("*-morph-mat.npz"))
+    assert len(fnames) == 1
+    with catch_logging() as log:
+        morph_cached = compute_source_morph(stcs[0], "from", "to", **kwargs, verbose=1)
+    assert "Read cached morph matrix" in log.getvalue()
+    assert_array_equal(morph_cached.morph_mat.toarray(), morph.morph_mat.toarray())
+    for v1, v2 in zip(morph_cached.vertices_to, morph.vertices_to):
+        assert_array_equal(v1, v2)
+    monkeypatch.setenv("MNE_MORPH_MAT_CACHE", "false")
+    compute_source_morph(
+        stcs[0], "from", "to", spacing=2, smooth=4, subjects_dir=tmp_path
+    )
+    assert len(list((tmp_path / "morph-maps").glob("*-morph-mat.npz"))) == 1
+    # lists and generators give the same as morphing one by one
+    stcs_want = [morph.apply(stc) for stc in stcs]
+    stcs_list = morph.apply(stcs)
+    assert isinstance(stcs_list, list)
+    stcs_gen = morph.apply(stc for stc in stcs)
+    assert not isinstance(stcs_gen, list)
+    dtypes = [stc.data.dtype for stc in stcs[:-2]] + [kernel.dtype] * 2
+    for stcs_got in (stcs_list, list(stcs_gen)):
+        assert len(stcs_got) == len(stcs_want)
+        assert [stc._factored for stc in stcs_got] == [False] * 4 + [True] * 2
+        assert stcs_got[-1]._kernel is stcs_got[-2]._kernel
+        for stc_got, stc_want, dtype in zip(stcs_got, stcs_want, dtypes):
+            assert type(stc_got) is type(stc_want)
+            assert stc_got.data.dtype == dtype
+            assert stc_got.subject == "to"
+            assert_allclose(stc_got.data, stc_want.data, rtol=1e-12)
+    with pytest.raises(ValueError, match="must match"):
+        morph.apply([stcs[0], SourceEstimate(stcs[1].data, vertices, 0, 1, "foo")])
+
+
 def assert_power_preserved(orig, new, limits=(1.0, 1.05)):
     """Assert that the power is preserved during a round-trip morph."""
     __tracebackhide__ = True
@@ -4,9 +4,9 @@
 
 import numpy as np
 import pytest
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 
-from mne._ola import _COLA, _Interp2, _Storer
+from mne._ola import _COLA, _cola_process, _Interp2, _Storer
 
 
 def test_interp_2pt():
@@ -83,6 +83,18 @@ def test_interp_2pt():
         expected = np.full(n_pts, 10.0)
         assert_allclose(out, expected)
 
+    # seeking is equivalent to feeding
+    values = np.array([10.0, -10.0, 5.0])
+    for control_points in ([4, 50, n_pts - 5], [4]):
+        n_use = len(control_points)
+        interp = _Interp2(control_points, values[:n_use], "hann")
+        expected = interp.feed(n_pts + 10)[0]
+        for start in (0, 3, 4, 30, 50, n_pts - 5, n_pts + 3):
+            interp = _Interp2(control_points, values[:n_use], "hann")
+            interp._seek(start)
+            out = interp.feed(n_pts + 10 - start)[0]
+            assert_array_equal(out, expected[start:])
+
 
 @pytest.mark.parametrize("ndim", (1, 2, 3))
 def test_cola(ndim):
@@ -126,3 +138,27 @@ def test_cola(ndim):
                             cola.feed(signal[..., n_input : n_input + next_len])
                             n_input += next_len
                         assert_allclose(out, signal / 2.0, atol=1e-7)
+                    # processing groups of chunks separately is equivalent
+                    out_split = np.zeros_like(out)
+                    cola = _COLA(
+                        processor,
+                        out_split,
+                        n_total,
+                        n_samples,
+                        n_overlap,
+                        sfreq,
+                        window,
+                    )
+                    splits = cola._split(3)
+                    outs = [
+                        _cola_process(
+                            processor,
+                            [signal[..., starts[0] : stops[-1]]],
+                            starts,
+                            stops,
+                            windows,
+                        )
+                        for starts, stops, windows in splits
+                    ]
+                    cola._store_split(splits, outs)
+                    assert_array_equal(out_split, out)
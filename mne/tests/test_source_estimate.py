@@ -32,6 +32,7 @@ from mne import (
     MixedSourceEstimate,
     MixedVectorSourceEstimate,
     SourceEstimate,
+    SourceMorph,
     SourceSpaces,
     VectorSourceEstimate,
     VolSourceEstimate,
@@ -585,6 +586,108 @@ def test_stc_arithmetic():
     assert_array_equal(vec_stc_mean.data, vec_stc.data.mean(2, keepdims=True))
 
 
+def test_stc_factored():
+    """Test that kernel-factored STCs stay factored when possible."""
+    rng = np.random.RandomState(0)
+    vertices = [np.arange(10), np.arange(10)]
+    kernel = rng.randn(20, 5)
+    sens_data = rng.randn(5, 30)
+    sens_orig = sens_data.copy()
+
+    def _make(kernel, sens_data):
+        stc = SourceEstimate((kernel, sens_data), vertices, -0.1, 0.01, "foo")
+        stc_data = SourceEstimate(kernel @ sens_data, vertices, -0.1, 0.01, "foo")
+        return stc, stc_data
+
+    def _assert_factored(stc, stc_data):
+        assert stc._data is None
+        assert_allclose(stc.data, stc_data.data, atol=1e-12)
+        assert_allclose(stc.times, stc_data.times)
+
+    stc, stc_data = _make(kernel, sens_data)
+    _assert_factored(stc.copy().crop(0, 0.1), stc_data.copy().crop(0, 0.1))
+    _assert_factored(stc.copy().resample(50), stc_data.copy().resample(50))
+    _assert_factored(stc.mean(), stc_data.mean())
+    _assert_factored(stc.sum(), stc_data.sum())
+    _assert_factored(-stc, -stc_data)
+    _assert_factored(stc * 3, stc_data * 3)
+    _assert_factored(stc / 4, stc_data / 4)
+    _assert_factored(stc + stc, stc_data + stc_data)
+    stc_2, stc_data_2 = _make(rng.randn(20, 5), rng.randn(5, 30))
+    _assert_factored(stc + stc_2, stc_data + stc_data_2)
+    _assert_factored(stc - stc_2, stc_data - stc_data_2)
+    # different kernels are stacked only while that is smaller than the data
+    stc_sum, stc_data_sum = stc.copy(), stc_data.copy()
+    for ii in range(6):
+        stc_2, stc_data_2 = _make(rng.randn(20, 5), rng.randn(5, 30))
+        stc_sum += stc_2
+        stc_data_sum += stc_data_2
+        assert stc_sum._factored == (ii < 4)
+    assert_allclose(stc_sum.data, stc_data_sum.data, atol=1e-12)
+    assert stc._kernel is kernel  # untouched by the operations above
+    _assert_factored(
+        stc.copy().apply_baseline((None, 0)),
+        stc_data.copy().apply_baseline((None, 0)),
+    )
+    assert_array_equal(sens_data, sens_orig)
+
+    # non-linear operations materialize the data
+    stc_abs = abs(stc)
+    assert stc_abs._data is not None
+    assert_allclose(stc_abs.data, abs(stc_data.data))
+
+    # labels
+    label = Label(np.arange(2, 8), hemi="rh", subject="foo")
+    _assert_factored(stc.in_label(label), stc_data.in_label(label))
+    labels = [label, Label(np.arange(5), hemi="lh", subject="foo")]
+    for mode in ("mean", "max"):
+        tc = extract_label_time_course(stc, labels, None, mode=mode)
+        want = extract_label_time_course(stc_data, labels, None, mode=mode)
+        assert_allclose(tc, want, atol=1e-12)
+    # mixed source spaces average the volume sources
+    vertices_mixed = vertices + [np.arange(6)]
+    src = SourceSpaces(
+        [dict(type="surf", vertno=v, subject_his_id="foo") for v in vertices]
+        + [dict(type="vol", vertno=vertices_mixed[2], subject_his_id="foo")]
+    )
+    kernel_mixed = rng.randn(26, 5)
+    stc_mixed = MixedSourceEstimate((kernel_mixed, sens_data), vertices_mixed, 0, 0.01)
+    stc_mixed_data = MixedSourceEstimate(
+        kernel_mixed @ sens_data, vertices_mixed, 0, 0.01
+    )
+    for mode in ("mean", "max"):
+        tc = extract_label_time_course(stc_mixed, labels, src, mode=mode)
+        want = extract_label_time_course(stc_mixed_data, labels, src, mode=mode)
+        assert tc.shape == (3, 30)
+        assert_allclose(tc, want, atol=1e-12)
+
+    # surface morph
+    vertices_to = [np.arange(6), np.arange(8)]
+    morph_mat = sparse.csr_array(abs(rng.randn(14, 20)))
+    morph = SourceMorph(
+        "foo",
+        "bar",
+        "surface",
+        None,
+        None,
+        None,
+        None,
+        None,
+        False,
+        morph_mat,
+        vertices_to,
+        None,
+        None,
+        None,
+        None,
+        dict(vertices_from=vertices),
+        None,
+    )
+    stc_to = morph.apply(stc)
+    assert stc_to.subject == "bar"
+    _assert_factored(stc_to, morph.apply(stc_data))
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 @pytest.mark.parametrize("kind", ("scalar", "vector"))
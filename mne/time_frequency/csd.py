@@ -4,6 +4,7 @@
 
 import copy as cp
 import numbers
+from itertools import islice
 
 import numpy as np
 from scipy.fft import rfftfreq
@@ -12,9 +13,9 @@ from .._fiff.pick import _picks_to_idx, pick_channels
 from ..parallel import parallel_func
 from ..time_frequency.multitaper import (
     _compute_mt_params,
-    _csd_from_mt,
     _mt_spectra,
     _psd_from_mt_adaptive,
+    _window_cache,
 )
 from ..utils import (
     ProgressBar,
@@ -29,6 +30,9 @@ from ..utils import (
 from ..viz.misc import plot_csd
 from .tfr import EpochsTFR, _cwt_array, _get_nfft, morlet
 
+# approximate size of the spectra of each block of epochs processed at once
+_CSD_BLOCK_BYTES = 2**26
+
 
 @verbose
 def pick_channels_csd(
@@ -712,16 +716,17 @@ def csd_fourier(
     csd_morlet
     csd_multitaper
     """
-    epochs, projs = _prepare_csd(epochs, tmin, tmax, picks, projs)
+    epochs, projs, picks = _prepare_csd(epochs, tmin, tmax, picks, projs)
+    X, ch_names = _get_csd_data(epochs, picks)
     return csd_array_fourier(
-        epochs.get_data(copy=False),
+        X,
         sfreq=epochs.info["sfreq"],
         t0=epochs.tmin,
         fmin=fmin,
         fmax=fmax,
         tmin=tmin,
         tmax=tmax,
-        ch_names=epochs.ch_names,
+        ch_names=ch_names,
         n_fft=n_fft,
         projs=projs,
         n_jobs=n_jobs,
@@ -825,6 +830,7 @@ def csd_array_fourier(
         frequencies,
         _csd_fourier,
         params=[sfreq, n_times, freq_mask, n_fft],
+        epoch_nbytes=16 * X.shape[1] * len(frequencies),
         n_fft=n_fft,
         ch_names=ch_names,
         projs=projs,
@@ -896,16 +902,17 @@ def csd_multitaper(
     csd_fourier
     csd_morlet
     """
-    epochs, projs = _prepare_csd(epochs, tmin, tmax, picks, projs)
+    epochs, projs, picks = _prepare_csd(epochs, tmin, tmax, picks, projs)
+    X, ch_names = _get_csd_data(epochs, picks)
     return csd_array_multitaper(
-        epochs.get_data(copy=False),
+        X,
         sfreq=epochs.info["sfreq"],
         t0=epochs.tmin,
         fmin=fmin,
         fmax=fmax,
         tmin=tmin,
         tmax=tmax,
-        ch_names=epochs.ch_names,
+        ch_names=ch_names,
         n_fft=n_fft,
         bandwidth=bandwidth,
         adaptive=adaptive,
@@ -1037,6 +1044,7 @@ def csd_array_multitaper(
             adaptive,
             max_iter,
         ],
+        epoch_nbytes=16 * X.shape[1] * len(eigvals) * len(orig_frequencies),
         n_fft=n_fft,
         ch_names=ch_names,
         projs=projs,
@@ -1107,15 +1115,16 @@ def csd_morlet(
     csd_fourier
     csd_multitaper
     """
-    epochs, projs = _prepare_csd(epochs, tmin, tmax, picks, projs)
+    epochs, projs, picks = _prepare_csd(epochs, tmin, tmax, picks, projs)
+    X, ch_names = _get_csd_data(epochs, picks)
     return csd_array_morlet(
-        epochs.get_data(copy=False),
+        X,
         sfreq=epochs.info["sfreq"],
         frequencies=frequencies,
         t0=epochs.tmin,
         tmin=tmin,
         tmax=tmax,
-        ch_names=epochs.ch_names,
+        ch_names=ch_names,
         n_cycles=n_cycles,
         use_fft=use_fft,
         decim=decim,
@@ -1201,7 +1210,13 @@ def csd_array_morlet(
     n_times = len(times)
 
     # Construct the appropriate Morlet wavelets
-    wavelets = morlet(sfreq, frequencies, n_cycles)
+    wavelets = _window_cache.get(
+        ("morlet", sfreq, frequencies, n_cycles, False),
+        morlet,
+        sfreq,
+        frequencies,
+        n_cycles,
+    )
 
     # Slice X to the requested time window + half the length of the longest
     # wavelet.
@@ -1230,6 +1245,7 @@ def csd_array_morlet(
         frequencies,
         _csd_morlet,
         params=[sfreq, wavelets, nfft, csd_tslice, use_fft, decim],
+        epoch_nbytes=16 * X.shape[1] * len(wavelets) * X.shape[2],
         n_fft=1,
         ch_names=ch_names,
         projs=projs,
@@ -1258,12 +1274,58 @@ def _prepare_csd(epochs, tmin=None, tmax=None, picks=None, projs=None):
         )
 
     picks = _picks_to_idx(epochs.info, picks, "data", with_ref_meg=False)
-    epochs = epochs.copy().pick(picks)
+    epochs = epochs.copy()
+    if epochs.preload:
+        epochs.pick(picks)
+        picks = None
 
     if projs is None:
         projs = epochs.info["projs"]
 
-    return epochs, projs
+    return epochs, projs, picks
+
+
+def _get_csd_data(epochs, picks):
+    """Get the data and channel names of epochs.
+
+    Non-preloaded epochs, which cannot be picked, are read with the given picks
+    one block at a time while the CSD is computed.
+    """
+    if picks is None:
+        return epochs.get_data(copy=False), epochs.ch_names
+    return _EpochsData(epochs, picks), [epochs.ch_names[pick] for pick in picks]
+
+
+class _EpochsData:
+    """Array-like view of the data of non-preloaded epochs.
+
+    The data are only read, one block of epochs at a time, when the CSD is
+    accumulated.
+    """
+
+    ndim = 3
+
+    def __init__(self, epochs, picks, tslice=slice(None)):
+        epochs.drop_bad()
+        self._epochs = epochs
+        self._picks = picks
+        self._tslice = tslice
+        self.shape = (len(epochs), len(picks), len(epochs.times[tslice]))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, item):
+        # only slicing of the time axis is supported, i.e., X[:, :, start:stop]
+        times = range(len(self._epochs.times))[self._tslice][item[2]]
+        tslice = slice(times.start, times.stop, times.step)
+        return _EpochsData(self._epochs, self._picks, tslice)
+
+    def _iter_blocks(self, n_block):
+        for start in range(0, len(self), n_block):
+            item = slice(start, start + n_block)
+            data = self._epochs.get_data(picks=self._picks, item=item)
+            yield np.asarray(data[:, :, self._tslice], dtype=float)
 
 
 def _prepare_csd_array(X, sfreq, t0, tmin, tmax, fmin=None, fmax=None):
@@ -1271,7 +1333,8 @@ def _prepare_csd_array(X, sfreq, t0, tmin, tmax, fmin=None, fmax=None):
 
     See the csd_array_* functions for documentation of the parameters.
     """
-    X = np.asarray(X, dtype=float)
+    if not isinstance(X, _EpochsData):
+        X = np.asarray(X, dtype=float)
     if X.ndim != 3:
         raise ValueError("X must be n_epochs x n_channels x n_times.")
 
@@ -1310,11 +1373,13 @@ def _execute_csd_function(
     projs=None,
     n_jobs=None,
     *,
+    epoch_nbytes=0,
     verbose=None,
 ):
     """Estimate cross-spectral density with a given function.
 
-    This function will apply the given CSD function in parallel across epochs.
+    This function will apply the given CSD function in parallel across blocks
+    of epochs, and sum the results.
 
     Parameters
     ----------
@@ -1326,7 +1391,8 @@ def _execute_csd_function(
     frequencies : list of float
         The frequencies of interest for which the CSD is going to be computed.
     csd_function : function
-        Function that performs the actual CSD computation
+        Function that performs the actual CSD computation, summed over a block
+        of epochs.
     params : list
         List of parameters to pass the CSD function.
     n_fft : int
@@ -1338,6 +1404,9 @@ def _execute_csd_function(
         List of projectors to store in the CSD object. Defaults to ``None``,
         which means the projectors defined in the Epochs object will be copied.
     %(n_jobs)s
+    epoch_nbytes : int
+        Approximate size of the spectra of one epoch, used to choose how many
+        epochs to process at once.
     %(verbose)s
 
     Returns
@@ -1358,14 +1427,20 @@ def _execute_csd_function(
     # execution.
     parallel, my_csd, n_jobs = parallel_func(csd_function, n_jobs, verbose=verbose)
 
-    # Compute CSD for each trial
-    n_blocks = int(np.ceil(n_epochs / float(n_jobs)))
-    for i in ProgressBar(range(n_blocks), mesg="CSD epoch blocks"):
-        epoch_block = X[i * n_jobs : (i + 1) * n_jobs]
-        csds = parallel(my_csd(this_epoch, *params) for this_epoch in epoch_block)
+    # Compute the CSD of blocks of epochs, using all jobs when possible
+    n_block = max(_CSD_BLOCK_BYTES // max(epoch_nbytes, 1), 1)
+    n_block = min(n_block, max(int(np.ceil(n_epochs / n_jobs)), 1))
+    if isinstance(X, _EpochsData):
+        blocks = X._iter_blocks(n_block)
+    else:
+        blocks = (X[start : start + n_block] for start in range(0, n_epochs, n_block))
+    n_rounds = int(np.ceil(n_epochs / (n_block * n_jobs)))
+    for _ in ProgressBar(range(n_rounds), mesg="CSD epoch blocks"):
+        csds = parallel(my_csd(block, *params) for block in islice(blocks, n_jobs))
 
-        # Add CSD matrices in-place
-        csds_mean += np.sum(csds, axis=0)
+        # Add the partial sums in-place
+        for csd in csds:
+            csds_mean += csd
 
     csds_mean /= n_epochs
     logger.info("[done]")
@@ -1384,14 +1459,39 @@ def _execute_csd_function(
     )
 
 
+def _sum_csd_triu(x):
+    """Sum the upper-triangle cross-products of spectra over a block of epochs.
+
+    Parameters
+    ----------
+    x : ndarray, shape (n_epochs, n_channels, n_obs, n_freqs)
+        The (weighted) spectra. The products are summed across epochs and
+        observations (tapers or time points).
+
+    Returns
+    -------
+    csds : ndarray, shape (n_channels * (n_channels + 1) // 2, n_freqs)
+        For each frequency, the upper triangle of the summed products.
+    """
+    n_epochs, n_channels, n_obs, n_freqs = x.shape
+    x = x.transpose(3, 1, 0, 2).reshape(n_freqs, n_channels, n_epochs * n_obs)
+    ii, jj = np.triu_indices(n_channels)
+    csds = np.empty((len(ii), n_freqs), dtype=np.complex128)
+    for fi, this_x in enumerate(x):
+        # one matrix product per frequency is much faster than the products of
+        # each channel pair, even though the lower triangle is discarded
+        csds[:, fi] = (this_x @ this_x.conj().T)[ii, jj]
+    return csds
+
+
 def _csd_fourier(X, sfreq, n_times, freq_mask, n_fft):
     """Compute cross spectral density (CSD) using short-time fourier transform.
 
-    Computes the CSD for a single epoch of data.
+    Computes the CSD summed over a block of epochs.
 
     Parameters
     ----------
-    X : ndarray, shape (n_channels, n_times)
+    X : ndarray, shape (n_epochs, n_channels, n_times)
         The time series data consisting of n_channels time-series of length
         n_times.
     sfreq : float
@@ -1403,17 +1503,8 @@ def _csd_fourier(X, sfreq, n_times, freq_mask, n_fft):
     n_fft : int
         Length of the FFT.
     """
-    x_mt, _ = _mt_spectra(X, np.hanning(n_times), sfreq, n_fft)
-
-    # Hack so we can sum over axis=-2
-    weights = np.array([1.0])[np.newaxis, :, np.newaxis]
-
-    x_mt = x_mt[:, :, freq_mask]
-
-    # Calculate CSD for upper-triangle channel pairs directly.
-    # This avoids computing/storing the full channel x channel matrix.
-    ii, jj = np.triu_indices(x_mt.shape[0])
-    csds = _csd_from_mt(x_mt[ii], x_mt[jj], weights, weights)
+    x_mt, _ = _mt_spectra(X, np.hanning(n_times), sfreq, n_fft, freq_mask=freq_mask)
+    csds = 2 * _sum_csd_triu(x_mt)
 
     # Scaling by number of samples and compensating for loss of power
     # due to windowing (see section 11.5.2 in Bendat & Piersol).
@@ -1429,31 +1520,32 @@ def _csd_fourier(X, sfreq, n_times, freq_mask, n_fft):
 def _csd_multitaper(
     X, sfreq, n_times, window_fun, eigvals, freq_mask, n_fft, adaptive, max_iter=250
 ):
-    """Compute cross spectral density (CSD) using multitaper module."""
-    x_mt, _ = _mt_spectra(X, window_fun, sfreq, n_fft)
+    """Compute cross spectral density (CSD) using multitaper module.
 
+    Computes the CSD summed over a block of epochs.
+    """
     if adaptive:
-        # Compute adaptive weights
+        # The adaptive weights need the tapered spectra of all frequencies
+        x_mt, _ = _mt_spectra(X, window_fun, sfreq, n_fft)
         _, weights = _psd_from_mt_adaptive(
-            x_mt, eigvals, freq_mask, max_iter, return_weights=True
+            x_mt.reshape((-1,) + x_mt.shape[2:]),
+            eigvals,
+            freq_mask,
+            max_iter,
+            return_weights=True,
         )
+        weights = weights.reshape(x_mt.shape[:3] + (-1,))
+        x_mt = x_mt[..., freq_mask]
     else:
         # Do not use adaptive weights
-        weights = np.sqrt(eigvals)[np.newaxis, :, np.newaxis]
-
-    x_mt = x_mt[:, :, freq_mask]
+        x_mt, _ = _mt_spectra(X, window_fun, sfreq, n_fft, freq_mask=freq_mask)
+        weights = np.sqrt(eigvals)[:, np.newaxis]
 
-    # Calculate CSD for upper-triangle channel pairs directly.
-    # This avoids computing/storing the full channel x channel matrix.
-    ii, jj = np.triu_indices(x_mt.shape[0])
-    x_mt_i = x_mt[ii]
-    x_mt_j = x_mt[jj]
-    if adaptive:
-        weights_i = weights[ii]
-        weights_j = weights[jj]
-    else:
-        weights_i = weights_j = weights
-    csds = _csd_from_mt(x_mt_i, x_mt_j, weights_i, weights_j)
+    # Weighting and normalizing the spectra of each channel is equivalent to
+    # what _csd_from_mt does for each channel pair
+    weights = weights / np.sqrt((np.abs(weights) ** 2).sum(axis=-2, keepdims=True))
+    x_mt *= weights
+    csds = 2 * _sum_csd_triu(x_mt)
 
     # Scaling by sampling frequency for compatibility with Matlab
     csds /= sfreq
@@ -1464,11 +1556,11 @@ def _csd_multitaper(
 def _csd_morlet(data, sfreq, wavelets, nfft, tslice=None, use_fft=True, decim=1):
     """Compute cross spectral density (CSD) using the given Morlet wavelets.
 
-    Computes the CSD for a single epoch of data.
+    Computes the CSD summed over a block of epochs.
 
     Parameters
     ----------
-    data : ndarray, shape (n_channels, n_times)
+    data : ndarray, shape (n_epochs, n_channels, n_times)
         The time series data consisting of n_channels time-series of length
         n_times.
     sfreq : float
@@ -1503,22 +1595,28 @@ def _csd_morlet(data, sfreq, wavelets, nfft, tslice=None, use_fft=True, decim=1)
     _vector_to_sym_mat : For converting the CSD to a full matrix.
     """
     # Compute PSD
-    psds = _cwt_array(data, wavelets, nfft, mode="same", use_fft=use_fft, decim=decim)
+    n_epochs, n_channels, n_times = data.shape
+    psds = _cwt_array(
+        data.reshape(-1, n_times),
+        wavelets,
+        nfft,
+        mode="same",
+        use_fft=use_fft,
+        decim=decim,
+    )
+    psds = psds.reshape((n_epochs, n_channels) + psds.shape[1:])
 
     if tslice is not None:
         tstart = None if tslice.start is None else tslice.start // decim
         tstop = None if tslice.stop is None else tslice.stop // decim
         tstep = None if tslice.step is None else tslice.step // decim
         tslice = slice(tstart, tstop, tstep)
-        psds = psds[:, :, tslice]
-
-    psds_conj = np.conj(psds)
+        psds = psds[..., tslice]
 
-    # Compute the spectral density between all pairs of series
-    n_channels = data.shape[0]
-    csds = np.vstack(
-        [np.mean(psds[[i]] * psds_conj[i:], axis=2) for i in range(n_channels)]
-    )
+    # Compute the spectral density between all pairs of series, averaged over
+    # time
+    csds = _sum_csd_triu(psds.swapaxes(-1, -2))
+    csds /= psds.shape[-1]
 
     # Scaling by sampling frequency for compatibility with Matlab
     csds /= sfreq
@@ -1553,7 +1651,7 @@ def csd_tfr(epochs_tfr, tmin=None, tmax=None, picks=None, projs=None, verbose=No
         Cross-spectral density restricted to selected channels.
     """
     _validate_type(epochs_tfr, EpochsTFR)
-    epochs_tfr, projs = _prepare_csd(epochs_tfr, tmin, tmax, picks, projs)
+    epochs_tfr, projs, _ = _prepare_csd(epochs_tfr, tmin, tmax, picks, projs)
     X = epochs_tfr.data
     times = epochs_tfr.times
     n_channels, n_freqs = len(epochs_tfr.ch_names), epochs_tfr.freqs.size
@@ -1564,16 +1662,13 @@ def csd_tfr(epochs_tfr, tmin=None, tmax=None, picks=None, projs=None, verbose=No
     tstop = None if tmax is None else np.searchsorted(times, tmax + 1e-10)
     X = X[:, :, :, tstart:tstop]
 
-    for idx, epochs_data in enumerate(X):
-        # This is equivalent to:
+    n_block = max(_CSD_BLOCK_BYTES // max(X[0].nbytes, 1), 1)
+    for start in range(0, len(X), n_block):
+        # This is equivalent to summing over epochs:
         # csds = np.vstack([np.mean(epochs_data[[i]] * epochs_data_conj[i:],
         #                           axis=2) for i in range(n_channels)])
-        # There is a redundancy in the calculation here because we don't really
-        # need the lower triangle of the matrix, but it should still be faster
-        # than a loop (hopefully!).
-        csds = np.einsum("xft,yft->xyf", epochs_data, np.conj(epochs_data))
-        csds = csds[np.triu_indices(n_channels) + (slice(None),)]
-        csds /= epochs_data.shape[-1]
+        csds = _sum_csd_triu(X[start : start + n_block].swapaxes(-1, -2))
+        csds /= X.shape[-1]
 
         # Scaling by sampling frequency for compatibility with Matlab
         csds /= epochs_tfr.info["sfreq"]
@@ -12,7 +12,10 @@ from scipy.signal.windows import dpss as sp_dpss
 
 from ..fixes import _reshape_view
 from ..parallel import parallel_func
-from ..utils import _check_option, logger, verbose, warn
+from ..utils import _ArrayCache, _check_option, _get_float_dtype, logger, verbose, warn
+
+# DPSS tapers and wavelets, keyed by their parameters
+_window_cache = _ArrayCache("window", "MNE_WINDOW_CACHE_SIZE", "64M")
 
 
 def dpss_windows(N, half_nbw, Kmax, *, sym=True, norm=None, low_bias=True):
@@ -83,6 +86,20 @@ def dpss_windows(N, half_nbw, Kmax, *, sym=True, norm=None, low_bias=True):
     return dpss, eigvals
 
 
+def _dpss_windows(N, half_nbw, Kmax, *, sym=True, norm=None, low_bias=True):
+    """Get (read-only) DPSS windows from the window cache."""
+    return _window_cache.get(
+        ("dpss", N, float(half_nbw), Kmax, sym, norm, low_bias),
+        dpss_windows,
+        N,
+        half_nbw,
+        Kmax,
+        sym=sym,
+        norm=norm,
+        low_bias=low_bias,
+    )
+
+
 def _psd_from_mt_adaptive(x_mt, eigvals, freq_mask, max_iter=250, return_weights=False):
     r"""Use iterative procedure to compute the PSD from tapered spectra.
 
@@ -128,63 +145,68 @@ def _psd_from_mt_adaptive(x_mt, eigvals, freq_mask, max_iter=250, return_weights
     x_var = trapezoid(psd_est, dx=np.pi / n_freqs) / (2 * np.pi)
     del psd_est
 
-    # allocate space for output
-    psd = np.empty((n_signals, np.sum(freq_mask)))
-
     # only keep the frequencies of interest
     x_mt = x_mt[:, :, freq_mask]
 
-    if return_weights:
-        weights = np.empty((n_signals, n_tapers, psd.shape[1]))
-
-    for i, (xk, var) in enumerate(zip(x_mt, x_var)):
-        # combine the SDFs in the traditional way in order to estimate
-        # the variance of the timeseries
-
-        # The process is to iteratively switch solving for the following
-        # two expressions:
-        # (1) Adaptive Multitaper SDF:
-        # S^{mt}(f) = [ sum |d_k(f)|^2 S_k(f) ]/ sum |d_k(f)|^2
-        #
-        # (2) Weights
-        # d_k(f) = [sqrt(lam_k) S^{mt}(f)] / [lam_k S^{mt}(f) + E{B_k(f)}]
-        #
-        # Where lam_k are the eigenvalues corresponding to the DPSS tapers,
-        # and the expected value of the broadband bias function
-        # E{B_k(f)} is replaced by its full-band integration
-        # (1/2pi) int_{-pi}^{pi} E{B_k(f)} = sig^2(1-lam_k)
-
-        # start with an estimate from incomplete data--the first 2 tapers
-        psd_iter = _psd_from_mt(xk[:2, :], rt_eig[:2, np.newaxis])
-
-        err = np.zeros_like(xk)
-        for n in range(max_iter):
-            d_k = psd_iter / (
-                eigvals[:, np.newaxis] * psd_iter + (1 - eigvals[:, np.newaxis]) * var
-            )
-            d_k *= rt_eig[:, np.newaxis]
-            # Test for convergence -- this is overly conservative, since
-            # iteration only stops when all frequencies have converged.
-            # A better approach is to iterate separately for each freq, but
-            # that is a nonvectorized algorithm.
-            # Take the RMS difference in weights from the previous iterate
-            # across frequencies. If the maximum RMS error across freqs is
-            # less than 1e-10, then we're converged
-            err -= d_k
-            if np.max(np.mean(err**2, axis=0)) < 1e-10:
-                break
-
-            # update the iterative estimate with this d_k
-            psd_iter = _psd_from_mt(xk, d_k)
-            err = d_k
-
-        if n == max_iter - 1:
-            warn("Iterative multi-taper PSD computation did not converge.")
-
-        psd[i, :] = psd_iter
-
-        if return_weights:
-            weights[i, :, :] = d_k
+    # allocate space for output
+    psd = np.empty((n_signals, x_mt.shape[2]))
+    weights = np.empty((n_signals, n_tapers, psd.shape[1]))
+
+    # combine the SDFs in the traditional way in order to estimate
+    # the variance of the timeseries
+
+    # The process is to iteratively switch solving for the following
+    # two expressions:
+    # (1) Adaptive Multitaper SDF:
+    # S^{mt}(f) = [ sum |d_k(f)|^2 S_k(f) ]/ sum |d_k(f)|^2
+    #
+    # (2) Weights
+    # d_k(f) = [sqrt(lam_k) S^{mt}(f)] / [lam_k S^{mt}(f) + E{B_k(f)}]
+    #
+    # Where lam_k are the eigenvalues corresponding to the DPSS tapers,
+    # and the expected value of the broadband bias function
+    # E{B_k(f)} is replaced by its full-band integration
+    # (1/2pi) int_{-pi}^{pi} E{B_k(f)} = sig^2(1-lam_k)
+    #
+    # All signals are iterated at once, and each signal is dropped from the
+    # iteration as soon as it has converged.
+
+    # start with an estimate from incomplete data--the first 2 tapers
+    psd_iter = _psd_from_mt(x_mt[:, :2], rt_eig[:2, np.newaxis])
+
+    eigvals = eigvals[:, np.newaxis]
+    var = x_var[:, np.newaxis, np.newaxis]
+    active = np.arange(n_signals)
+    err = np.zeros(x_mt.shape)
+    for _ in range(max_iter):
+        d_k = psd_iter[:, np.newaxis] / (
+            eigvals * psd_iter[:, np.newaxis] + (1 - eigvals) * var
+        )
+        d_k *= rt_eig[:, np.newaxis]
+        # Test for convergence -- this is overly conservative, since
+        # iteration only stops when all frequencies have converged.
+        # A better approach is to iterate separately for each freq, but
+        # that is a nonvectorized algorithm.
+        # Take the RMS difference in weights from the previous iterate
+        # across frequencies. If the maximum RMS error across freqs is
+        # less than 1e-10, then we're converged
+        err -= d_k
+        done = np.max(np.mean(err**2, axis=1), axis=-1) < 1e-10
+        if done.any():
+            psd[active[done]] = psd_iter[done]
+            weights[active[done]] = d_k[done]
+            keep = ~done
+            active, x_mt, d_k, var = active[keep], x_mt[keep], d_k[keep], var[keep]
+        if not len(active):
+            break
+
+        # update the iterative estimate with this d_k
+        psd_iter = _psd_from_mt(x_mt, d_k)
+        err = d_k
+    else:
+        warn("Iterative multi-taper PSD computation did not converge.")
+        psd[active] = psd_iter
+        weights[active] = d_k
 
     if return_weights:
         return psd, weights
@@ -241,7 +263,7 @@ def _csd_from_mt(x_mt, y_mt, weights_x, weights_y):
     return csd
 
 
-def _mt_spectra(x, dpss, sfreq, n_fft=None, remove_dc=True):
+def _mt_spectra(x, dpss, sfreq, n_fft=None, remove_dc=True, *, freq_mask=None):
     """Compute tapered spectra.
 
     Parameters
@@ -256,6 +278,8 @@ def _mt_spectra(x, dpss, sfreq, n_fft=None, remove_dc=True):
         Length of the FFT. If None, the number of samples in the input signal
         will be used.
     %(remove_dc)s
+    freq_mask : array of bool | None
+        The frequencies to keep. If None, all positive frequencies are kept.
 
     Returns
     -------
@@ -273,17 +297,26 @@ def _mt_spectra(x, dpss, sfreq, n_fft=None, remove_dc=True):
 
     # only keep positive frequencies
     freqs = rfftfreq(n_fft, 1.0 / sfreq)
+    # Adjust DC and maybe Nyquist, depending on one-sided transform
+    scaling = np.ones(len(freqs))
+    scaling[0] = np.sqrt(2.0)
+    if n_fft % 2 == 0:
+        scaling[-1] = np.sqrt(2.0)
+    if freq_mask is not None:
+        freqs, scaling = freqs[freq_mask], scaling[freq_mask]
+    dtype = _get_float_dtype(np.complex128)
+    dpss = dpss.astype(_get_float_dtype(), copy=False)
 
     # The following is equivalent to this, but uses less memory:
     # x_mt = fftpack.fft(x[:, np.newaxis, :] * dpss, n=n_fft)
     n_tapers = dpss.shape[0] if dpss.ndim > 1 else 1
-    x_mt = np.zeros(x.shape[:-1] + (n_tapers, len(freqs)), dtype=np.complex128)
+    x_mt = np.zeros(x.shape[:-1] + (n_tapers, len(freqs)), dtype=dtype)
     for idx, sig in enumerate(x):
-        x_mt[idx] = rfft(sig[..., np.newaxis, :] * dpss, n=n_fft)
-    # Adjust DC and maybe Nyquist, depending on one-sided transform
-    x_mt[..., 0] /= np.sqrt(2.0)
-    if n_fft % 2 == 0:
-        x_mt[..., -1] /= np.sqrt(2.0)
+        sig_mt = rfft(
+            sig[..., np.newaxis, :].astype(dpss.dtype, copy=False) * dpss, n=n_fft
+        )
+        x_mt[idx] = sig_mt if freq_mask is None else sig_mt[..., freq_mask]
+    x_mt /= scaling
     return x_mt, freqs
 
 
@@ -308,7 +341,7 @@ def _compute_mt_params(n_times, sfreq, bandwidth, low_bias, adaptive, verbose=No
 
     # Compute DPSS windows
     n_tapers_max = int(2 * half_nbw)
-    window_fun, eigvals = dpss_windows(
+    window_fun, eigvals = _dpss_windows(
         n_times, half_nbw, n_tapers_max, sym=False, low_bias=low_bias
     )
     logger.info(
@@ -426,18 +459,30 @@ def psd_array_multitaper(
     n_freqs = len(freqs)
 
     if output == "complex":
-        psd = np.zeros((x.shape[0], n_tapers, n_freqs), dtype="complex")
+        psd = np.zeros(
+            (x.shape[0], n_tapers, n_freqs), dtype=_get_float_dtype(np.complex128)
+        )
     else:
-        psd = np.zeros((x.shape[0], n_freqs))
-
-    # Let's go in up to 50 MB chunks of signals to save memory
-    n_chunk = max(50000000 // (len(freq_mask) * len(eigvals) * 16), 1)
+        psd = np.zeros((x.shape[0], n_freqs), dtype=_get_float_dtype())
+
+    # Let's go in up to 50 MB chunks of signals to save memory, only the
+    # adaptive weights need the tapered spectra of all frequencies
+    use_adaptive = adaptive and output == "power"
+    n_mt_freqs = len(freq_mask) if use_adaptive else n_freqs
+    itemsize = _get_float_dtype(np.complex128).itemsize
+    n_chunk = max(50000000 // (max(n_mt_freqs, 1) * len(eigvals) * itemsize), 1)
     offsets = np.concatenate((np.arange(0, x.shape[0], n_chunk), [x.shape[0]]))
     for start, stop in zip(offsets[:-1], offsets[1:]):
-        x_mt = _mt_spectra(x[start:stop], dpss, sfreq, remove_dc=remove_dc)[0]
+        x_mt = _mt_spectra(
+            x[start:stop],
+            dpss,
+            sfreq,
+            remove_dc=remove_dc,
+            freq_mask=None if use_adaptive else freq_mask,
+        )[0]
         if output == "power":
             if not adaptive:
-                psd[start:stop] = _psd_from_mt(x_mt[:, :, freq_mask], weights)
+                psd[start:stop] = _psd_from_mt(x_mt, weights)
             else:
                 parallel, my_psd_from_mt_adaptive, n_jobs = parallel_func(
                     _psd_from_mt_adaptive, n_jobs
@@ -449,7 +494,7 @@ def psd_array_multitaper(
                 )
                 psd[start:stop] = np.concatenate(out)
         else:
-            psd[start:stop] = x_mt[:, :, freq_mask]
+            psd[start:stop] = x_mt
 
     if normalization == "full":
         psd /= sfreq
@@ -13,6 +13,9 @@ from ..parallel import parallel_func
 from ..utils import _check_option, _ensure_int, logger, verbose, warn
 from ..utils.numerics import _mask_to_onsets_offsets
 
+# approximate size of the blocks of Raw data read at once by _psd_welch_raw
+_WELCH_BLOCK_BYTES = 2**26
+
 
 # adapted from SciPy
 # https://github.com/scipy/scipy/blob/f71e7fad717801c4476312fe1e23f2dfbb4c9d7f/scipy/signal/_spectral_py.py#L2019  # noqa: E501
@@ -94,6 +97,18 @@ def _check_nfft(n, n_fft, n_per_seg, n_overlap):
     return n_fft, n_per_seg, n_overlap
 
 
+def _welch_freqs(sfreq, n_fft, fmin, fmax):
+    """Get the frequencies of Welch's method and the slice of those to keep."""
+    win_size = n_fft / float(sfreq)
+    logger.info(f"Effective window size : {win_size:0.3f} (s)")
+    freqs = np.arange(n_fft // 2 + 1, dtype=float) * (sfreq / n_fft)
+    freq_mask = (freqs >= fmin) & (freqs <= fmax)
+    if not freq_mask.any():
+        raise ValueError(f"No frequencies found between fmin={fmin} and fmax={fmax}")
+    freq_sl = slice(*(np.where(freq_mask)[0][[0, -1]] + [0, 1]))
+    return freqs[freq_sl], freq_sl
+
+
 @verbose
 def psd_array_welch(
     x,
@@ -191,15 +206,7 @@ def psd_array_welch(
 
     # Prep the PSD
     n_fft, n_per_seg, n_overlap = _check_nfft(n_times, n_fft, n_per_seg, n_overlap)
-    win_size = n_fft / float(sfreq)
-    logger.info(f"Effective window size : {win_size:0.3f} (s)")
-    freqs = np.arange(n_fft // 2 + 1, dtype=float) * (sfreq / n_fft)
-    freq_mask = (freqs >= fmin) & (freqs <= fmax)
-    if not freq_mask.any():
-        raise ValueError(f"No frequencies found between fmin={fmin} and fmax={fmax}")
-    freq_sl = slice(*(np.where(freq_mask)[0][[0, -1]] + [0, 1]))
-    del freq_mask
-    freqs = freqs[freq_sl]
+    freqs, freq_sl = _welch_freqs(sfreq, n_fft, fmin, fmax)
 
     step = max(int(n_per_seg) - int(n_overlap), 1)
     if n_times >= n_per_seg:
@@ -315,3 +322,129 @@ def psd_array_welch(
 
     psds = _reshape_view(psds, shape)
     return psds, freqs
+
+
+@verbose
+def _psd_welch_raw(
+    raw,
+    sfreq,
+    fmin=0,
+    fmax=np.inf,
+    n_fft=256,
+    n_overlap=0,
+    n_per_seg=None,
+    n_jobs=None,
+    average="mean",
+    window="hamming",
+    remove_dc=True,
+    *,
+    picks,
+    start,
+    stop,
+    reject_by_annotation,
+    verbose=None,
+):
+    """Compute the Welch PSD of Raw data, reading it in blocks of segments.
+
+    This gives the same result as :func:`psd_array_welch` on the data from
+    ``raw.get_data(picks, start, stop, reject_by_annotation="NaN")``, but only
+    blocks of whole Welch segments are kept in memory.
+    """
+    from ..annotations import _annotations_starts_stops
+
+    _check_option("average", average, ("mean", "median"))
+    n_fft = _ensure_int(n_fft, "n_fft")
+    n_overlap = _ensure_int(n_overlap, "n_overlap")
+    if n_per_seg is not None:
+        n_per_seg = _ensure_int(n_per_seg, "n_per_seg")
+    n_fft, n_per_seg, n_overlap = _check_nfft(stop - start, n_fft, n_per_seg, n_overlap)
+    freqs, freq_sl = _welch_freqs(sfreq, n_fft, fmin, fmax)
+    step = n_per_seg - n_overlap
+
+    # the spans of good data, as NaN-filled spans split the data in
+    # psd_array_welch
+    used = np.ones(stop - start, bool)
+    if reject_by_annotation and len(raw.annotations):
+        for onset, end in zip(*_annotations_starts_stops(raw, ["BAD"])):
+            used[max(onset - start, 0) : max(end - start, 0)] = False
+    onsets, offsets = _mask_to_onsets_offsets(used)
+    onsets, offsets = onsets + start, offsets + start
+
+    parallel, my_spect_func, n_jobs = parallel_func(_spect_func, n_jobs=n_jobs)
+    _func = partial(
+        spectrogram,
+        detrend="constant" if remove_dc else False,
+        noverlap=n_overlap,
+        nperseg=n_per_seg,
+        nfft=n_fft,
+        fs=sfreq,
+        window=window,
+        mode="psd",
+    )
+
+    def func(*args, **kwargs):
+        # swallow SciPy warnings caused by short good data spans
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                action="ignore",
+                module="scipy",
+                category=UserWarning,
+                message=r"nperseg = \d+ is greater than input length",
+            )
+            return _func(*args, **kwargs)
+
+    bad_ch = np.zeros(len(picks), bool)
+    n_seg_block = max(
+        (_WELCH_BLOCK_BYTES // (8 * len(picks)) - n_per_seg) // step + 1, 1
+    )
+    span_psds, weights = list(), list()
+    for onset, offset in zip(onsets, offsets):
+        n_span = offset - onset
+        if n_span < n_per_seg:
+            blocks = [(onset, offset)]
+            weights.append(n_span)
+        else:
+            n_segments = 1 + (n_span - n_per_seg) // step
+            blocks = [
+                (
+                    onset + ii * step,
+                    onset + (min(ii + n_seg_block, n_segments) - 1) * step + n_per_seg,
+                )
+                for ii in range(0, n_segments, n_seg_block)
+            ]
+            weights.append(n_span - ((n_span - n_overlap) % step))
+        span_spect = list()
+        for block_start, block_stop in blocks:
+            data = raw.get_data(picks, block_start, block_stop)
+            bad = ~np.isfinite(data).all(axis=-1)
+            if bad.any():
+                bad_ch |= bad
+                data[bad] = 0.0
+            spect = parallel(
+                my_spect_func(d, func=func, freq_sl=freq_sl, average=None)
+                for d in np.array_split(data, n_jobs)
+                if d.size != 0
+            )
+            spect = np.concatenate(spect)
+            if average == "mean":
+                # only keep the sums of the segments
+                spect = (spect.sum(axis=-1), spect.shape[-1])
+            span_spect.append(spect)
+        if average == "mean":
+            psd = sum(s[0] for s in span_spect) / sum(s[1] for s in span_spect)
+        else:
+            spect = np.concatenate(span_spect, axis=-1)
+            psd = np.median(spect, axis=-1) / _median_biases(spect.shape[-1])[-1]
+        span_psds.append(psd)
+    if len(span_psds) == 1:
+        psds = span_psds[0]
+    else:
+        psds = np.average(span_psds, axis=0, weights=weights)
+
+    if bad_ch.any():
+        warn(
+            "Non-finite values (NaN/Inf) detected in some channels; PSD for "
+            "those channels will be NaN.",
+        )
+        psds[bad_ch] = np.nan
+    return psds, freqs
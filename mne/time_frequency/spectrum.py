@@ -62,7 +62,7 @@ from ..viz.utils import (
     plt_show,
 )
 from .multitaper import _psd_from_mt, psd_array_multitaper
-from .psd import _check_nfft, psd_array_welch
+from .psd import _check_nfft, _psd_welch_raw, psd_array_welch
 
 
 class SpectrumMixin:
@@ -1166,7 +1166,23 @@ class Spectrum(BaseSpectrum):
             **method_kw,
         )
         # get just the data we want
-        if isinstance(self.inst, BaseRaw):
+        if isinstance(self.inst, BaseRaw) and _stream_welch(
+            self.inst, method, method_kw
+        ):
+            # Welch averages can be accumulated while reading the data
+            start, stop = np.where(self._time_mask)[0][[0, -1]]
+            data = self.inst
+            welch_kw = {key: val for key, val in method_kw.items() if key != "output"}
+            self._psd_func = partial(
+                _psd_welch_raw,
+                remove_dc=remove_dc,
+                picks=self._picks,
+                start=start,
+                stop=stop + 1,
+                reject_by_annotation=reject_by_annotation,
+                **welch_kw,
+            )
+        elif isinstance(self.inst, BaseRaw):
             start, stop = np.where(self._time_mask)[0][[0, -1]]
             rba = "NaN" if reject_by_annotation else None
             data = self.inst.get_data(
@@ -1771,6 +1787,16 @@ def _check_ci(ci):
     return ci
 
 
+def _stream_welch(raw, method, method_kw):
+    """Check if the Welch PSD of a Raw instance can be computed block-wise."""
+    return (
+        not raw.preload
+        and method == "welch"
+        and method_kw.get("average", "mean") in ("mean", "median")
+        and method_kw.get("output", "power") == "power"
+    )
+
+
 def _compute_n_welch_segments(n_times, method_kw):
     # get default values from psd_array_welch
     _defaults = dict()
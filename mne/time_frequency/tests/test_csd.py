@@ -648,3 +648,29 @@ def test_csd_tfr():
     csd = csd_tfr(epochs_tfr, tmin=0.25, tmax=0.75)
     assert_allclose(csd._data, csd_test._data)
     assert_array_equal(csd.frequencies, freqs)
+
+
+@pytest.mark.parametrize(
+    "csd_func, kwargs",
+    [
+        (csd_fourier, dict(fmin=5, fmax=30)),
+        (csd_multitaper, dict(fmin=5, fmax=30, adaptive=True)),
+        (csd_morlet, dict(frequencies=[20.0, 30.0], tmin=0.2, tmax=0.8)),
+    ],
+)
+def test_csd_blocks_not_preloaded(csd_func, kwargs, tmp_path, monkeypatch):
+    """Test CSD accumulated in blocks of epochs, read from disk."""
+    rng = np.random.default_rng(0)
+    info = mne.create_info(4, 100.0, "eeg")
+    raw = mne.io.RawArray(rng.standard_normal((4, 2000)) * 1e-6, info)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    raw = mne.io.read_raw_fif(fname)
+    events = mne.make_fixed_length_events(raw, duration=1.0)
+    epochs = mne.Epochs(raw, events, tmin=0, tmax=1.0, baseline=(0, None))
+    want = csd_func(epochs.copy().load_data(), **kwargs)
+    monkeypatch.setattr(mne.time_frequency.csd, "_CSD_BLOCK_BYTES", 1)
+    csd = csd_func(epochs, **kwargs)
+    assert not epochs.preload
+    assert_allclose(csd._data, want._data, rtol=1e-10)
+    assert_allclose(csd_func(epochs, n_jobs=2, **kwargs)._data, want._data, rtol=1e-10)
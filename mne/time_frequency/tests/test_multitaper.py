@@ -4,11 +4,17 @@
 
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_allclose, assert_array_almost_equal, assert_array_equal
 
 from mne.time_frequency import psd_array_multitaper
-from mne.time_frequency.multitaper import dpss_windows
-from mne.utils import _record_warnings
+from mne.time_frequency.multitaper import (
+    _compute_mt_params,
+    _mt_spectra,
+    _psd_from_mt_adaptive,
+    dpss_windows,
+)
+from mne.time_frequency.tfr import tfr_array_morlet, tfr_array_multitaper
+from mne.utils import _record_warnings, clear_cache, get_cache_info
 
 
 def test_dpss_windows():
@@ -78,3 +84,67 @@ def test_adaptive_weights_convergence():
     ):
         psd_array_multitaper(data, sfreq, adaptive=True, max_iter=2)
     psd_array_multitaper(data, sfreq, adaptive=True, max_iter=200)
+
+
+def test_multitaper_psd_batched(monkeypatch):
+    """Test band-limited spectra, batched adaptive weights and float32."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((6, 500))
+    sfreq = 100.0
+    dpss, eigvals, _ = _compute_mt_params(500, sfreq, None, True, True)
+    x_mt, freqs = _mt_spectra(data, dpss, sfreq)
+    freq_mask = (freqs >= 5) & (freqs <= 30)
+    x_mt_band, freqs_band = _mt_spectra(data, dpss, sfreq, freq_mask=freq_mask)
+    assert_array_equal(freqs_band, freqs[freq_mask])
+    assert_array_equal(x_mt_band, x_mt[:, :, freq_mask])
+    # all signals at once match each signal on its own
+    psd, weights = _psd_from_mt_adaptive(x_mt, eigvals, freq_mask, return_weights=True)
+    for ii in range(len(data)):
+        psd_1, weights_1 = _psd_from_mt_adaptive(
+            x_mt[ii : ii + 1], eigvals, freq_mask, return_weights=True
+        )
+        assert_allclose(psd[ii], psd_1[0], rtol=1e-12)
+        assert_allclose(weights[ii], weights_1[0], rtol=1e-12)
+    # single precision
+    for adaptive in (False, True):
+        want = psd_array_multitaper(data, sfreq, 5, 30, adaptive=adaptive)[0]
+        with monkeypatch.context() as m:
+            m.setenv("MNE_DATA_DTYPE", "float32")
+            got = psd_array_multitaper(data, sfreq, 5, 30, adaptive=adaptive)[0]
+        assert got.dtype == np.float32
+        assert_allclose(got, want, rtol=1e-3)
+
+
+def test_window_cache(monkeypatch):
+    """Test caching of DPSS tapers and Morlet wavelets across calls."""
+    monkeypatch.setenv("MNE_WINDOW_CACHE_SIZE", "64M")
+    clear_cache("window")
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((2, 3, 500))
+    sfreq = 100.0
+    freqs = np.arange(5.0, 20.0, 5.0)
+    kwargs = dict(sfreq=sfreq, freqs=freqs, n_cycles=2.0, output="power")
+    want_psd = psd_array_multitaper(data, sfreq)[0]
+    want_morlet = tfr_array_morlet(data, **kwargs)
+    want_mt = tfr_array_multitaper(data, **kwargs)
+    info = get_cache_info()["window"]
+    assert info["misses"] == info["size"] > 0
+    assert info["nbytes"] > 0
+    assert_array_equal(psd_array_multitaper(data, sfreq)[0], want_psd)
+    assert_array_equal(tfr_array_morlet(data, **kwargs), want_morlet)
+    assert_array_equal(tfr_array_multitaper(data, **kwargs), want_mt)
+    assert get_cache_info()["window"] == dict(info, hits=info["hits"] + 3)
+    # cached tapers are shared, so read-only; the public function is not cached
+    tapers, _, _ = _compute_mt_params(500, sfreq, None, True, True)
+    assert not tapers.flags.writeable
+    assert dpss_windows(500, 4.0, 7)[0].flags.writeable
+    # bounded size
+    max_nbytes = get_cache_info()["window"]["nbytes"] - 1
+    monkeypatch.setenv("MNE_WINDOW_CACHE_SIZE", str(max_nbytes))
+    tfr_array_morlet(data, **dict(kwargs, n_cycles=3.0))
+    assert 0 < get_cache_info()["window"]["nbytes"] <= max_nbytes
+    monkeypatch.setenv("MNE_WINDOW_CACHE_SIZE", "0")
+    clear_cache("window")
+    tfr_array_morlet(data, **kwargs)
+    assert get_cache_info()["window"] == dict(hits=0, misses=1, size=0, nbytes=0)
+    clear_cache("window")
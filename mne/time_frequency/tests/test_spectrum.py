@@ -19,7 +19,7 @@ from mne import (
     make_fixed_length_epochs,
 )
 from mne.channels import equalize_channels
-from mne.io import RawArray
+from mne.io import RawArray, read_raw_fif
 from mne.time_frequency import read_spectrum
 from mne.time_frequency.multitaper import _psd_from_mt
 from mne.time_frequency.spectrum import (
@@ -309,6 +309,43 @@ def test_spectrum_reject_by_annot(raw):
     assert spect_no_annot != spect_reject_annot
 
 
+@pytest.mark.parametrize("average", ("mean", "median"))
+def test_spectrum_raw_not_preloaded(average, tmp_path, monkeypatch):
+    """Test that Welch PSDs of non-preloaded Raw match the preloaded ones."""
+    import mne.time_frequency.psd as psd_mod
+
+    rng = np.random.default_rng(0)
+    info = create_info(3, 200.0, "eeg")
+    raw = RawArray(rng.standard_normal((3, 20000)) * 1e-5, info)
+    raw.set_annotations(
+        Annotations(
+            [10, 30.05, 40, 41.5, 70],
+            [2.5, 0.5, 1, 3.5, 0.2],
+            ["bad_a", "good", "bad_a", "bad_a", "bad_b"],
+        )
+    )
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    raw_file = read_raw_fif(fname)
+    assert not raw_file.preload
+    raw = raw_file.copy().load_data()
+    # blocks of a few segments
+    monkeypatch.setattr(psd_mod, "_WELCH_BLOCK_BYTES", 3 * 8 * 2000)
+    kw = dict(n_fft=256, n_overlap=64, average=average, fmax=60)
+    for rba in (True, False):
+        for tmin, tmax in ((None, None), (5.0, 80.0)):
+            kw.update(tmin=tmin, tmax=tmax, reject_by_annotation=rba)
+            # the good span from 41 to 41.5 s is shorter than a segment
+            with _record_warnings():
+                want = raw.compute_psd(**kw)
+                got = raw_file.compute_psd(**kw)
+            assert_array_equal(got.freqs, want.freqs)
+            assert_allclose(got.get_data(), want.get_data(), rtol=1e-10)
+    # the (only) supported output can be given explicitly
+    got = raw_file.compute_psd(output="power", **kw)
+    assert_allclose(got.get_data(), want.get_data(), rtol=1e-10)
+
+
 def test_spectrum_bads_exclude(raw):
     """Test bads are not removed unless exclude="bads"."""
     raw.pick("mag")  # get rid of IAS channel
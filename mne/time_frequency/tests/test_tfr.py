@@ -27,7 +27,7 @@ from mne import (
     read_events,
 )
 from mne.epochs import equalize_epoch_counts
-from mne.io import read_raw_fif
+from mne.io import RawArray, read_raw_fif
 from mne.time_frequency import (
     AverageTFR,
     AverageTFRArray,
@@ -434,6 +434,78 @@ def test_tfr_morlet():
     assert_equal(psd.shape, (2, 1, 420))
 
 
+@pytest.mark.parametrize("mode", ("same", "valid"))
+def test_cwt_batched(monkeypatch, mode):
+    """Test FFT wavelet transforms of blocks of signals."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((7, 600))
+    # wavelet lengths that need different FFT lengths
+    Ws = morlet(200.0, [2.0, 5.0, 10.0, 30.0], n_cycles=[3, 5, 7, 7])
+    assert len({W.size for W in Ws}) == 4
+    decim = 3 if mode == "same" else 1
+    want = cwt(data, Ws, use_fft=False, mode=mode, decim=decim)
+    got = cwt(data, Ws, use_fft=True, mode=mode, decim=decim)
+    assert_allclose(got, want, rtol=1e-7, atol=1e-10)
+    monkeypatch.setattr(mne.time_frequency.tfr, "_CWT_BLOCK_BYTES", 2 * 4 * 16 * 1024)
+    got = cwt(data, Ws, use_fft=True, mode=mode, decim=decim)
+    assert_allclose(got, want, rtol=1e-7, atol=1e-10)
+    # complex signals
+    data_c = data + 1j * rng.standard_normal(data.shape)
+    want = cwt(data_c, Ws, use_fft=False, mode=mode, decim=decim)
+    got = cwt(data_c, Ws, use_fft=True, mode=mode, decim=decim)
+    assert_allclose(got, want, rtol=1e-7, atol=1e-10)
+    # single precision
+    kwargs = dict(sfreq=200.0, freqs=[5.0, 10.0, 30.0], n_cycles=5, decim=2)
+    want = tfr_array_morlet(data[np.newaxis], output="complex", **kwargs)
+    want_power = tfr_array_morlet(data[np.newaxis], output="avg_power", **kwargs)
+    assert want.dtype == np.complex128
+    monkeypatch.setenv("MNE_DATA_DTYPE", "float32")
+    got = tfr_array_morlet(data[np.newaxis], output="complex", **kwargs)
+    assert got.dtype == np.complex64
+    assert_allclose(got, want, rtol=1e-4, atol=1e-4 * np.abs(want).max())
+    got = tfr_array_morlet(data[np.newaxis], output="avg_power", **kwargs)
+    assert got.dtype == np.float32
+    assert_allclose(got, want_power, rtol=1e-4, atol=1e-4 * want_power.max())
+
+
+@pytest.mark.parametrize("method", ("morlet", "multitaper"))
+def test_average_tfr_blocks(tmp_path, monkeypatch, method):
+    """Test accumulating average power and ITC over blocks of epochs."""
+    rng = np.random.default_rng(0)
+    info = create_info(3, 200.0, "eeg")
+    raw = RawArray(rng.standard_normal((3, 8000)), info)
+    raw.save(tmp_path / "test_raw.fif")
+    raw = read_raw_fif(tmp_path / "test_raw.fif")
+    events = mne.make_fixed_length_events(raw, duration=1.0)
+    kwargs = dict(freqs=[6.0, 10.0, 20.0], n_cycles=3, decim=2, return_itc=True)
+    epochs = Epochs(raw, events, tmin=-0.5, tmax=0.5, baseline=None, preload=True)
+    data = epochs.get_data()
+    want_power, want_itc = epochs.compute_tfr(method, average=True, **kwargs)
+    # reference from the single-trial transforms
+    func = tfr_array_morlet if method == "morlet" else tfr_array_multitaper
+    kwargs_array = dict(sfreq=200.0, freqs=kwargs["freqs"], n_cycles=3, decim=2)
+    coefs = func(data, output="complex", **kwargs_array)
+    if method == "morlet":
+        power = (np.abs(coefs) ** 2).mean(axis=0)
+        itc = np.abs((coefs / np.abs(coefs)).mean(axis=0))
+        assert_allclose(want_power.data, power, rtol=1e-10)
+        assert_allclose(want_itc.data, itc, rtol=1e-10)
+    # from blocks of a generator
+    blocks = (data[start : start + 3] for start in range(0, len(data), 3))
+    got = func(blocks, output="avg_power_itc", **kwargs_array)
+    assert_allclose(got.real, want_power.data, rtol=1e-10)
+    assert_allclose(got.imag, want_itc.data, rtol=1e-10)
+    with pytest.raises(ValueError, match="only be a generator"):
+        func(iter([data]), output="power", **kwargs_array)
+    # from non-preloaded epochs, in blocks
+    monkeypatch.setattr(mne.utils.mixin, "_EPOCH_BATCH_BYTES", 8 * 3 * 201 * 5)
+    epochs = Epochs(raw, events, tmin=-0.5, tmax=0.5, baseline=None)
+    power, itc = epochs.compute_tfr(method, average=True, **kwargs)
+    assert power.nave == itc.nave == want_power.nave == len(data)
+    assert_allclose(power.data, want_power.data, rtol=1e-10)
+    assert_allclose(itc.data, want_itc.data, rtol=1e-10)
+
+
 def test_dpsswavelet():
     """Test DPSS tapers."""
     freqs = np.arange(5, 25, 3)
@@ -8,8 +8,10 @@ Morlet code inspired by Matlab code from Sheraz Khan & Brainstorm & SPM
 # Copyright the MNE-Python contributors.
 
 import inspect
+from collections.abc import Iterator
 from copy import deepcopy
 from functools import partial
+from itertools import chain
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -40,8 +42,10 @@ from ..utils import (
     _convert_times,
     _ensure_events,
     _freq_mask,
+    _get_float_dtype,
     _import_h5io_funcs,
     _is_numeric,
+    _n_epochs_per_batch,
     _pl,
     _prepare_read_metadata,
     _prepare_write_metadata,
@@ -78,7 +82,11 @@ from ..viz.utils import (
     figure_nobar,
     plt_show,
 )
-from .multitaper import dpss_windows, tfr_array_multitaper
+from .multitaper import (
+    _dpss_windows,
+    _window_cache,
+    tfr_array_multitaper,
+)
 from .spectrum import EpochsSpectrum
 
 
@@ -297,7 +305,7 @@ def _make_dpss(
             oscillation = np.exp(2.0 * 1j * np.pi * f * (t - t_win / 2.0))
 
             # Get dpss tapers
-            tapers, conc = dpss_windows(
+            tapers, conc = _dpss_windows(
                 t.shape[0], time_bandwidth / 2.0, n_taps, sym=False
             )
 
@@ -320,6 +328,9 @@ def _make_dpss(
 
 # Low level convolution
 
+# approximate size of the blocks of wavelet transforms computed at once
+_CWT_BLOCK_BYTES = 2**26
+
 
 def _get_nfft(wavelets, X, use_fft=True, check=True):
     n_times = X.shape[-1]
@@ -340,7 +351,9 @@ def _get_nfft(wavelets, X, use_fft=True, check=True):
     return nfft
 
 
-def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
+def _cwt_gen(
+    X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True, dtype=np.complex128
+):
     """Compute cwt with fft based convolutions or temporal convolutions.
 
     Parameters
@@ -363,6 +376,8 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
 
     use_fft : bool, default True
         Use the FFT for convolutions or not.
+    dtype : dtype, default np.complex128
+        The complex dtype to compute and return the transforms with.
 
     Returns
     -------
@@ -372,55 +387,95 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
     _check_option("mode", mode, ["same", "valid", "full"])
     decim = _ensure_slice(decim)
     X = np.asarray(X)
+    if use_fft:
+        yield from _cwt_fft_gen(X, Ws, fsize, mode, decim, dtype)
+        return
 
     # Precompute wavelets for given frequency range to save time
     _, n_times = X.shape
     n_times_out = X[:, decim].shape[1]
     n_freqs = len(Ws)
 
-    # precompute FFTs of Ws
-    if use_fft:
-        fft_Ws = np.empty((n_freqs, fsize), dtype=np.complex128)
-        for i, W in enumerate(Ws):
-            fft_Ws[i] = fft(W, fsize)
-
     # Make generator looping across signals
-    tfr = np.zeros((n_freqs, n_times_out), dtype=np.complex128)
+    tfr = np.zeros((n_freqs, n_times_out), dtype=dtype)
     for x in X:
-        if use_fft:
-            fft_x = fft(x, fsize)
-
         # Loop across wavelets
         for ii, W in enumerate(Ws):
-            if use_fft:
-                ret = ifft(fft_x * fft_Ws[ii])[: n_times + W.size - 1]
-            else:
-                # Work around multarray.correlate->OpenBLAS bug on ppc64le
-                # ret = np.correlate(x, W, mode=mode)
-                ret = np.convolve(x, W.real, mode=mode) + 1j * np.convolve(
-                    x, W.imag, mode=mode
-                )
-
-            # Center and decimate decomposition
-            if mode == "valid":
-                sz = int(abs(W.size - n_times)) + 1
-                offset = (n_times - sz) // 2
-                this_slice = slice(offset // decim.step, (offset + sz) // decim.step)
-                if use_fft:
-                    ret = _centered(ret, sz)
-                tfr[ii, this_slice] = ret[decim]
-            elif mode == "full" and not use_fft:
-                start = (W.size - 1) // 2
-                end = len(ret) - (W.size // 2)
-                ret = ret[start:end]
-                tfr[ii, :] = ret[decim]
-            else:
-                if use_fft:
-                    ret = _centered(ret, n_times)
-                tfr[ii, :] = ret[decim]
+            # Work around multarray.correlate->OpenBLAS bug on ppc64le
+            # ret = np.correlate(x, W, mode=mode)
+            ret = np.convolve(x, W.real, mode=mode) + 1j * np.convolve(
+                x, W.imag, mode=mode
+            )
+            _cwt_center(tfr[ii], ret, W.size, n_times, mode, decim, use_fft)
         yield tfr
 
 
+def _cwt_fft_gen(X, Ws, fsize, mode, decim, dtype):
+    """Compute cwt with FFT convolutions of blocks of signals at once."""
+    _, n_times = X.shape
+    n_times_out = X[:, decim].shape[1]
+    n_freqs = len(Ws)
+    dtype = np.dtype(dtype)
+    if np.iscomplexobj(X):
+        X = X.astype(np.result_type(X.dtype, dtype), copy=False)
+    else:
+        X = X.astype(np.finfo(dtype).dtype, copy=False)
+
+    # Group the wavelets by the (power of two) FFT length they need, so that
+    # short wavelets do not pay for the FFT length of the longest one, and
+    # precompute the FFTs of each group
+    sizes = np.array([W.size for W in Ws])
+    keys = np.ceil(np.log2(n_times + sizes - 1)).astype(int)
+    groups = list()
+    for key in np.unique(keys):
+        idx = np.where(keys == key)[0]
+        g_fsize = min(next_fast_len(n_times + sizes[idx].max() - 1), fsize)
+        fft_Ws = fft(np.array([_pad_to(Ws[ii], g_fsize) for ii in idx], dtype))
+        groups.append((idx, g_fsize, fft_Ws))
+
+    # Transform as many signals at once as fit in the block size
+    n_block = _CWT_BLOCK_BYTES // (dtype.itemsize * max(n_freqs, 1) * max(fsize, 1))
+    n_block = max(n_block, 1)
+    for b_start in range(0, len(X), n_block):
+        X_block = X[b_start : b_start + n_block]
+        tfrs = np.zeros((len(X_block), n_freqs, n_times_out), dtype=dtype)
+        for idx, g_fsize, fft_Ws in groups:
+            fft_X = fft(X_block, g_fsize, axis=-1)
+            rets = ifft(fft_X[:, np.newaxis] * fft_Ws, axis=-1)
+            for ii, ret in zip(idx, rets.swapaxes(0, 1)):
+                n_w = sizes[ii]
+                ret = ret[:, : n_times + n_w - 1]
+                _cwt_center(tfrs[:, ii], ret, n_w, n_times, mode, decim, True)
+        yield from tfrs
+
+
+def _pad_to(W, n):
+    """Zero-pad (or truncate) a wavelet to n samples, like fft(W, n)."""
+    out = np.zeros(n, W.dtype)
+    out[: min(W.size, n)] = W[:n]
+    return out
+
+
+def _cwt_center(tfr, ret, n_w, n_times, mode, decim, use_fft):
+    """Center and decimate convolutions along the last axis into tfr."""
+    if mode == "valid":
+        sz = int(abs(n_w - n_times)) + 1
+        offset = (n_times - sz) // 2
+        this_slice = slice(offset // decim.step, (offset + sz) // decim.step)
+        if use_fft:
+            ret = _centered_last(ret, sz)
+        tfr[..., this_slice] = ret[..., decim]
+    elif mode == "full" and not use_fft:
+        start = (n_w - 1) // 2
+        end = ret.shape[-1] - (n_w // 2)
+        ret = ret[..., start:end]
+        tfr[...] = ret[..., decim]
+    else:
+        if use_fft:
+            ret = _centered_last(ret, n_times)
+        tfr[...] = ret[..., decim]
+
+
 # Loop of convolution: single trial
 
 
@@ -444,8 +499,11 @@ def _compute_tfr(
 
     Parameters
     ----------
-    epoch_data : array of shape (n_epochs, n_channels, n_times)
+    epoch_data : array of shape (n_epochs, n_channels, n_times) | generator
         The epochs.default ``'complex'``
+        For outputs averaged across epochs, can also be a generator of arrays
+        of shape (n_block_epochs, n_channels, n_times), in which case the
+        averages are accumulated block by block.
     freqs : array-like of floats, shape (n_freqs)
         The frequencies.
     sfreq : float | int, default 1.0
@@ -510,7 +568,19 @@ def _compute_tfr(
         'phase', and return_weights=True.
     """
     # Check data
-    epoch_data = np.asarray(epoch_data)
+    average = ("avg_" in output) or ("itc" in output)
+    if isinstance(epoch_data, Iterator):
+        if not average:
+            raise ValueError(
+                "epoch_data can only be a generator when output is averaged "
+                f"across epochs, got output={repr(output)}"
+            )
+        blocks = epoch_data
+        epoch_data = np.asarray(next(blocks))
+        blocks = chain([epoch_data], blocks)
+    else:
+        epoch_data = np.asarray(epoch_data)
+        blocks = [epoch_data]
     if epoch_data.ndim != 3:
         raise ValueError(
             "epoch_data must be of shape (n_epochs, n_chans, "
@@ -543,12 +613,21 @@ def _compute_tfr(
     # We decimate *after* decomposition, so we need to create our kernels
     # for the original sfreq
     if method == "morlet":
-        W = morlet(sfreq, freqs, n_cycles=n_cycles, zero_mean=zero_mean)
+        W = _window_cache.get(
+            ("morlet", sfreq, freqs, n_cycles, zero_mean),
+            morlet,
+            sfreq,
+            freqs,
+            n_cycles=n_cycles,
+            zero_mean=zero_mean,
+        )
         Ws = [W]  # to have same dimensionality as the 'multitaper' case
         weights = None  # no tapers for Morlet estimates
 
     elif method == "multitaper":
-        Ws, weights = _make_dpss(
+        Ws, weights = _window_cache.get(
+            ("dpss_wavelets", sfreq, freqs, n_cycles, time_bandwidth, zero_mean),
+            _make_dpss,
             sfreq,
             freqs,
             n_cycles=n_cycles,
@@ -571,11 +650,11 @@ def _compute_tfr(
     n_tapers = len(Ws)
     n_epochs, n_chans, n_times = epoch_data[:, :, decim].shape
     if output in ("power", "phase", "avg_power", "itc"):
-        dtype = np.float64
+        dtype = _get_float_dtype(np.float64)
     elif output in ("complex", "avg_power_itc"):
         # avg_power_itc is stored as power + 1i * itc to keep a
         # simple dimensionality
-        dtype = np.complex128
+        dtype = _get_float_dtype(np.complex128)
 
     if ("avg_" in output) or ("itc" in output):
         out = np.empty((n_chans, n_freqs, n_times), dtype)
@@ -587,19 +666,46 @@ def _compute_tfr(
     # Parallel computation
     all_Ws = sum([list(W) for W in Ws], list())
     _get_nfft(all_Ws, epoch_data, use_fft)
-    parallel, my_cwt, n_jobs = parallel_func(_time_frequency_loop, n_jobs)
+    if average:
+        # Accumulate power and phase sums across the blocks of epochs, so that
+        # only one block of complex coefficients is ever held in memory
+        parallel, my_sums, n_jobs = parallel_func(_time_frequency_sums, n_jobs)
+        sums = [(None, None)] * n_chans
+        n_epochs = 0
+        for block in blocks:
+            block = np.asarray(block)
+            if block.shape[1:] != epoch_data.shape[1:]:
+                raise ValueError(
+                    "All blocks of epoch_data must have the same number of "
+                    f"channels and times, got {block.shape} and {epoch_data.shape}"
+                )
+            # Parallelization is applied across channels.
+            block_sums = parallel(
+                my_sums(channel, Ws, output, use_fft, "same", decim, weights)
+                for channel in block.transpose(1, 0, 2)
+            )
+            sums = [
+                tuple(_add_or_none(a, b) for a, b in zip(this_sums, this_block))
+                for this_sums, this_block in zip(sums, block_sums)
+            ]
+            n_epochs += len(block)
+        for channel_idx, (power, plf) in enumerate(sums):
+            out[channel_idx] = _time_frequency_average(
+                power, plf, n_epochs, output, weights
+            )
+    else:
+        parallel, my_cwt, n_jobs = parallel_func(_time_frequency_loop, n_jobs)
 
-    # Parallelization is applied across channels.
-    tfrs = parallel(
-        my_cwt(channel, Ws, output, use_fft, "same", decim, weights)
-        for channel in epoch_data.transpose(1, 0, 2)
-    )
+        # Parallelization is applied across channels.
+        tfrs = parallel(
+            my_cwt(channel, Ws, output, use_fft, "same", decim, weights)
+            for channel in epoch_data.transpose(1, 0, 2)
+        )
 
-    # FIXME: to avoid overheads we should use np.array_split()
-    for channel_idx, tfr in enumerate(tfrs):
-        out[channel_idx] = tfr
+        # FIXME: to avoid overheads we should use np.array_split()
+        for channel_idx, tfr in enumerate(tfrs):
+            out[channel_idx] = tfr
 
-    if ("avg_" not in output) and ("itc" not in output):
         # This is to enforce that the first dimension is for epochs
         out = np.moveaxis(out, 1, 0)
 
@@ -707,19 +813,22 @@ def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, weights=None):
     weights : array, shape (n_tapers, n_wavelets) | None
         Concentration weights for each taper in the wavelets, if present.
     """
+    if ("avg_" in output) or ("itc" in output):
+        power, plf = _time_frequency_sums(X, Ws, output, use_fft, mode, decim, weights)
+        return _time_frequency_average(power, plf, len(X), output, weights)
+
     # Set output type
-    dtype = np.float64
-    if output in ["complex", "avg_power_itc"]:
-        dtype = np.complex128
+    cwt_dtype = _get_float_dtype(np.complex128)
+    dtype = _get_float_dtype(np.float64)
+    if output == "complex":
+        dtype = cwt_dtype
 
     # Init outputs
     decim = _ensure_slice(decim)
     n_tapers = len(Ws)
     n_epochs, n_times = X[:, decim].shape
     n_freqs = len(Ws[0])
-    if ("avg_" in output) or ("itc" in output):
-        tfrs = np.zeros((n_freqs, n_times), dtype=dtype)
-    elif output in ["complex", "phase"] and weights is not None:
+    if output in ["complex", "phase"] and weights is not None:
         tfrs = np.zeros((n_epochs, n_tapers, n_freqs, n_times), dtype=dtype)
     else:
         tfrs = np.zeros((n_epochs, n_freqs, n_times), dtype=dtype)
@@ -730,58 +839,130 @@ def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, weights=None):
     for taper_idx, W in enumerate(Ws):
         # No need to check here, it's done earlier (outside parallel part)
         nfft = _get_nfft(W, X, use_fft, check=False)
-        coefs = _cwt_gen(X, W, fsize=nfft, mode=mode, decim=decim, use_fft=use_fft)
-
-        # Inter-trial phase locking is apparently computed per taper...
-        if "itc" in output:
-            plf = np.zeros((n_freqs, n_times), dtype=np.complex128)
+        coefs = _cwt_gen(
+            X, W, fsize=nfft, mode=mode, decim=decim, use_fft=use_fft, dtype=cwt_dtype
+        )
 
         # Loop across epochs
         for epoch_idx, tfr in enumerate(coefs):
             # Transform complex values
             if output not in ["complex", "phase"] and weights is not None:
                 tfr = weights[taper_idx] * tfr  # weight each taper estimate
-            if output in ["power", "avg_power"]:
+            if output == "power":
                 tfr = (tfr * tfr.conj()).real  # power
             elif output == "phase":
                 tfr = np.angle(tfr)
-            elif output == "avg_power_itc":
-                tfr_abs = np.abs(tfr)
-                plf += tfr / tfr_abs  # phase
-                tfr = tfr_abs**2  # power
-            elif output == "itc":
-                plf += tfr / np.abs(tfr)  # phase
-                continue  # not need to stack anything else than plf
-
-            # Stack or add
-            if ("avg_" in output) or ("itc" in output):
-                tfrs += tfr
-            elif output in ["complex", "phase"] and weights is not None:
+
+            # Stack
+            if output in ["complex", "phase"] and weights is not None:
                 tfrs[epoch_idx, taper_idx] += tfr
             else:
                 tfrs[epoch_idx] += tfr
 
-        # Compute inter trial coherence
-        if output == "avg_power_itc":
-            tfrs += 1j * np.abs(plf)
-        elif output == "itc":
-            tfrs += np.abs(plf)
+    # Normalization by taper weights
+    if n_tapers > 1 and output not in ["complex", "phase"]:
+        # add singleton epochs dimension to weights
+        weights = np.expand_dims(weights, axis=0)
+        tfrs *= 2 / (weights * weights.conj()).real.sum(axis=-3)
+
+    return tfrs
+
+
+def _time_frequency_sums(X, Ws, output, use_fft, mode, decim, weights=None):
+    """Aux. function to _compute_tfr for outputs averaged across epochs.
+
+    Sums the (taper-weighted) power and, per taper, the phase unit vectors of
+    the time-frequency transforms across the epochs of a single channel.
+
+    Returns
+    -------
+    power : array, shape (n_wavelets, n_times) | None
+        The sum of power across epochs, None if output is ``'itc'``.
+    plf : array, shape (n_tapers, n_wavelets, n_times) | None
+        The sum of phase unit vectors across epochs for each taper, None if
+        output is ``'avg_power'``.
+    """
+    cwt_dtype = _get_float_dtype(np.complex128)
+    decim = _ensure_slice(decim)
+    n_tapers = len(Ws)
+    n_times = X[:, decim].shape[1]
+    n_freqs = len(Ws[0])
+    power = plf = None
+    if output != "itc":
+        power = np.zeros((n_freqs, n_times), dtype=_get_float_dtype(np.float64))
+    if "itc" in output:
+        plf = np.zeros((n_tapers, n_freqs, n_times), dtype=cwt_dtype)
+    if weights is not None:
+        weights = np.expand_dims(weights, axis=-1)  # add singleton time dimension
+
+    # Loops across tapers.
+    for taper_idx, W in enumerate(Ws):
+        # No need to check here, it's done earlier (outside parallel part)
+        nfft = _get_nfft(W, X, use_fft, check=False)
+        coefs = _cwt_gen(
+            X, W, fsize=nfft, mode=mode, decim=decim, use_fft=use_fft, dtype=cwt_dtype
+        )
+
+        # Loop across epochs
+        for tfr in coefs:
+            if weights is not None:
+                tfr = weights[taper_idx] * tfr  # weight each taper estimate
+            # Inter-trial phase locking is apparently computed per taper...
+            if plf is not None:
+                tfr_abs = np.abs(tfr)
+                plf[taper_idx] += tfr / tfr_abs  # phase
+                if power is not None:
+                    power += tfr_abs**2
+            else:
+                power += (tfr * tfr.conj()).real
+    return power, plf
+
+
+def _time_frequency_average(power, plf, n_epochs, output, weights=None):
+    """Aux. function to _compute_tfr to average sums across epochs.
+
+    Parameters
+    ----------
+    power, plf : array | None
+        The sums returned by :func:`_time_frequency_sums` (possibly added
+        across blocks of epochs).
+    n_epochs : int
+        The number of summed epochs.
+    output : str
+        Can be ``'avg_power'``, ``'itc'`` or ``'avg_power_itc'``.
+    weights : array, shape (n_tapers, n_wavelets) | None
+        Concentration weights for each taper in the wavelets, if present.
+    """
+    # avg_power_itc is stored as power + 1i * itc
+    if output == "avg_power_itc":
+        tfrs = power + 1j * np.abs(plf).sum(axis=0)
+    elif output == "itc":
+        tfrs = np.abs(plf).sum(axis=0)
+    else:
+        tfrs = power.copy()
 
     # Normalization of average metrics
-    if ("avg_" in output) or ("itc" in output):
-        tfrs /= n_epochs
+    tfrs /= n_epochs
 
     # Normalization by taper weights
-    if n_tapers > 1 and output not in ["complex", "phase", "itc"]:
-        if "avg_" not in output:  # add singleton epochs dimension to weights
-            weights = np.expand_dims(weights, axis=0)
+    n_tapers = 1 if weights is None else len(weights)
+    if n_tapers > 1 and output != "itc":
+        weights = np.expand_dims(weights, axis=-1)  # add singleton time dimension
         tfrs.real *= 2 / (weights * weights.conj()).real.sum(axis=-3)
         if output == "avg_power_itc":  # weight itc by the number of tapers
             tfrs.imag = tfrs.imag / n_tapers
-
     return tfrs
 
 
+def _add_or_none(a, b):
+    """Add two arrays, either of which may be None."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a + b
+
+
 @fill_doc
 def cwt(X, Ws, use_fft=True, mode="same", decim=1):
     """Compute time-frequency decomposition with continuous wavelet transform.
@@ -2970,11 +3151,26 @@ class AverageTFR(BaseTFR):
     def _get_instance_data(self, time_mask):
         # AverageTFRs can be constructed from Epochs data, so we triage shape here.
         # Evoked data get a fake singleton "epoch" axis prepended
-        dim = slice(None) if _get_instance_type_string(self) == "Epochs" else np.newaxis
+        is_epochs = _get_instance_type_string(self) == "Epochs"
+        output = self._tfr_func.keywords.get("output", "")
+        if is_epochs and ("avg_" in output or "itc" in output):
+            # the average is accumulated while the blocks of epochs are consumed
+            self.inst.drop_bad()
+            self._nave = len(self.inst)
+            if self._nave:
+                return self._iter_instance_data(time_mask)
+        dim = slice(None) if is_epochs else np.newaxis
         data = self.inst.get_data(picks=self._picks)[dim, :, time_mask]
         self._nave = getattr(self.inst, "nave", data.shape[0])
         return data
 
+    def _iter_instance_data(self, time_mask):
+        """Get the data of blocks of epochs, to avoid loading them all at once."""
+        n_block = _n_epochs_per_batch(8 * len(self._picks) * len(self.inst.times))
+        for start in range(0, len(self.inst), n_block):
+            item = slice(start, start + n_block)
+            yield self.inst.get_data(picks=self._picks, item=item)[:, :, time_mask]
+
 
 @fill_doc
 class AverageTFRArray(AverageTFR):
@@ -4023,6 +4219,12 @@ def _centered(arr, newsize):
     return arr[tuple(myslice)]
 
 
+def _centered_last(arr, newsize):
+    """Aux Function to center data along the last axis."""
+    startind = (arr.shape[-1] - newsize) // 2
+    return arr[..., startind : startind + newsize]
+
+
 def _ensure_slice(decim):
     """Aux function checking the decim parameter."""
     _validate_type(decim, ("int-like", slice), "decim")
@@ -10,6 +10,7 @@ __all__ = [
     "ProgressBar",
     "SizeMixin",
     "TimeMixin",
+    "_ArrayCache",
     "_DefaultEventParser",
     "_PCA",
     "_ReuseCycle",
@@ -62,6 +63,7 @@ __all__ = [
     "_click_ch_name",
     "_compute_row_norms",
     "_convert_times",
+    "_cache_key",
     "_custom_lru_cache",
     "_doc_special_members",
     "_date_to_julian",
@@ -76,7 +78,9 @@ __all__ = [
     "_get_argvalues",
     "_get_blas_funcs",
     "_get_call_line",
+    "_get_config_cached",
     "_get_extra_data_path",
+    "_get_float_dtype",
     "_get_inst_data",
     "_get_numpy_libs",
     "_get_root_dir",
@@ -89,6 +93,7 @@ __all__ = [
     "_is_numeric",
     "_julian_to_date",
     "_mask_to_onsets_offsets",
+    "_n_epochs_per_batch",
     "_on_missing",
     "_open_lock",
     "_parse_verbose",
@@ -108,6 +113,7 @@ __all__ = [
     "_scale_dataframe_data",
     "_scaled_array",
     "_set_pandas_dtype",
+    "_set_read_only",
     "_soft_import",
     "_stamp_to_dt",
     "_suggest",
@@ -129,6 +135,7 @@ __all__ = [
     "assert_stcs_equal",
     "buggy_mkl_svd",
     "catch_logging",
+    "clear_cache",
     "check_fname",
     "check_random_state",
     "check_version",
@@ -142,6 +149,7 @@ __all__ = [
     "eigh",
     "fill_doc",
     "filter_out_warnings",
+    "get_cache_info",
     "get_config",
     "get_config_path",
     "get_subjects_dir",
@@ -282,6 +290,7 @@ from .check import (
     path_like,
 )
 from .config import (
+    _get_config_cached,
     _get_extra_data_path,
     _get_numpy_libs,
     _get_root_dir,
@@ -346,6 +355,7 @@ from .mixin import (
     SizeMixin,
     TimeMixin,
     _check_decim,
+    _n_epochs_per_batch,
     _prepare_read_metadata,
     _prepare_write_metadata,
 )
@@ -356,6 +366,8 @@ from .numerics import (
     _arange_div,
     _array_equal_nan,
     _array_repr,
+    _ArrayCache,
+    _cache_key,
     _check_dt,
     _compute_row_norms,
     _custom_lru_cache,
@@ -363,6 +375,7 @@ from .numerics import (
     _dt_to_stamp,
     _freq_mask,
     _gen_events,
+    _get_float_dtype,
     _get_inst_data,
     _hashable_ndarray,
     _julian_to_date,
@@ -372,13 +385,16 @@ from .numerics import (
     _replace_md5,
     _ReuseCycle,
     _scaled_array,
+    _set_read_only,
     _stamp_to_dt,
     _time_mask,
     _undo_scaling_array,
     _undo_scaling_cov,
     array_split_idx,
+    clear_cache,
     compute_corr,
     create_slices,
+    get_cache_info,
     grand_average,
     hashfunc,
     object_diff,
@@ -181,6 +181,19 @@ _known_config_types = {
     "MNE_DATASETS_REFMEG_NOISE_PATH": "str, path for refmeg_noise data",
     "MNE_DATASETS_SSVEP_PATH": "str, path for ssvep data",
     "MNE_DATASETS_ERP_CORE_PATH": "str, path for erp_core data",
+    "MNE_DATA_DTYPE": (
+        'str, "float64" (default) or "float32", the precision used to store and '
+        "process Raw, Epochs and Evoked data and their time-frequency transforms"
+    ),
+    "MNE_FIFF_DIR_CACHE_SIZE": (
+        "int, number of parsed FIF tag directories to keep in memory to speed up "
+        "re-opening the same files (0 disables the cache), default 32"
+    ),
+    "MNE_FILTER_CACHE_SIZE": (
+        "str, maximum memory used by the designed filters and filter FFTs kept "
+        "to speed up repeated filtering with the same parameters, e.g., 500K or "
+        "1G (0 disables the cache), default 64M"
+    ),
     "MNE_FORCE_SERIAL": "bool, force serial rather than parallel execution",
     "MNE_LOGGING_LEVEL": (
         "str or int, controls the level of verbosity of any function "
@@ -191,6 +204,10 @@ _known_config_types = {
         "str, threshold on the minimum size of arrays passed to the workers that "
         "triggers automated memory mapping, e.g., 1M or 0.5G"
     ),
+    "MNE_MORPH_MAT_CACHE": (
+        "bool, cache the surface morph matrices computed by compute_source_morph "
+        "in the morph-maps directory of SUBJECTS_DIR, default true"
+    ),
     "MNE_REPR_HTML": (
         "bool, represent some of our objects with rich HTML in a notebook environment"
     ),
@@ -211,6 +228,11 @@ _known_config_types = {
     "MNE_USE_NUMBA": (
         "bool, use Numba just-in-time compiler for some of our intensive computations"
     ),
+    "MNE_WINDOW_CACHE_SIZE": (
+        "str, maximum memory used by the DPSS tapers and Morlet wavelets kept to "
+        "speed up repeated spectral estimates with the same parameters, e.g., "
+        "500K or 1G (0 disables the cache), default 64M"
+    ),
     "SUBJECTS_DIR": "path-like, directory of freesurfer MRI files for each subject",
 }
 
@@ -387,6 +409,22 @@ def get_config(key=None, default=None, raise_error=False, home_dir=None, use_env
         return config.get(key, default)
 
 
+def _get_config_cached(key, default=None):
+    """Get a config value, reading the config file only once per session.
+
+    The environment is checked on every call, and :func:`set_config` clears
+    the cached file values.
+    """
+    if key in os.environ:
+        return os.environ[key]
+    return _get_file_config(key, default, os.environ.get("_MNE_FAKE_HOME_DIR"))
+
+
+@lru_cache(maxsize=32)
+def _get_file_config(key, default, home_dir):
+    return get_config(key, default, home_dir=home_dir, use_env=False)
+
+
 def set_config(key, value, home_dir=None, set_env=True):
     """Set a MNE-Python preference key in the config file and environment.
 
@@ -470,6 +508,7 @@ def set_config(key, value, home_dir=None, set_env=True):
         fid.seek(0)
         fid.truncate()
         json.dump(data, fid, sort_keys=True, indent=0)
+    _get_file_config.cache_clear()
 
 
 def _get_extra_data_path(home_dir=None):
@@ -2695,6 +2695,18 @@ _metadata_template = _metadata_attr_template.format(
     is subsetted, the metadata is subsetted accordingly, and the row indices
     will be modified to match ``{obj}.selection``.""",
 )
+
+docdict["memmap_filter"] = """
+memmap : path-like | None
+    If not ``None`` and the data are not preloaded, the data are read from disk
+    in blocks, filtered, and written to a memory-mapped file at this path, so
+    that the memory used is bounded by a few block lengths rather than the
+    length of the recording. Afterward the instance is preloaded, with its data
+    backed by the memory-mapped file. Ignored if the data are already preloaded.
+
+    .. versionadded:: 1.13
+"""
+
 docdict["metadata_attr"] = _metadata_attr_template.format(
     or_none=" (or ``None``)", extra=""
 )
@@ -2903,7 +2915,8 @@ n_jobs : int | str
 docdict["n_jobs_fir"] = """
 n_jobs : int | str
     Number of jobs to run in parallel. Can be ``'cuda'`` if ``cupy``
-    is installed properly and ``method='fir'``.
+    is installed properly and ``method='fir'``. With ``method='fir'``, the
+    jobs are threads that each filter a block of channels.
 """
 
 docdict["n_pca_components_apply"] = """
@@ -3671,7 +3684,9 @@ preload : bool or str (default False)
     If True, the data will be preloaded into memory (fast, requires
     large amount of memory). If preload is a string, preload is the
     file name of a memory-mapped file which is used to store the data
-    on the hard drive (slower, requires less memory)."""
+    on the hard drive (slower, requires less memory). The data are stored
+    in single precision if the ``MNE_DATA_DTYPE`` config value is
+    ``"float32"``, see :ref:`data-precision`."""
 
 docdict["preload_concatenate"] = """
 preload : bool, str, or None (default None)
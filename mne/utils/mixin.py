@@ -19,6 +19,9 @@ from .numerics import _time_mask, object_hash, object_size
 logger = logging.getLogger("mne")  # one selection here used across mne-python
 logger.propagate = False  # don't propagate (in case of multiple imports)
 
+# approximate size of each batch of epochs loaded from non-preloaded data
+_EPOCH_BATCH_BYTES = 2**26
+
 
 class SizeMixin:
     """Estimate MNE object sizes."""
@@ -460,6 +463,11 @@ class GetEpochsMixin:
         self._metadata = metadata
 
 
+def _n_epochs_per_batch(epoch_nbytes):
+    """Get how many epochs to process at once to bound memory usage."""
+    return max(_EPOCH_BATCH_BYTES // max(epoch_nbytes, 1), 1)
+
+
 def _check_decim(info, decim, offset, check_filter=True):
     """Check decimation parameters."""
     if decim < 1 or decim != int(decim):
@@ -10,6 +10,8 @@ import operator
 import os
 import shutil
 import sys
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from datetime import date, datetime, timedelta, timezone
 from io import BytesIO, StringIO
@@ -29,11 +31,13 @@ from ..fixes import (
 )
 from ._logging import logger, verbose, warn
 from .check import (
+    _check_option,
     _check_pandas_installed,
     _ensure_int,
     _validate_type,
     check_random_state,
 )
+from .config import _get_config_cached
 from .docs import fill_doc
 from .misc import _empty_hash, _pl
 
@@ -1120,6 +1124,188 @@ def _custom_lru_cache(maxsize):
     return dec
 
 
+# Caches of computed arrays, keyed by their name
+_ARRAY_CACHES = dict()
+
+
+class _ArrayCache:
+    """Least-recently-used cache of arrays bounded by their size in bytes.
+
+    The cached values are shared between callers, so their arrays are made
+    read-only. The maximum size is read from the ``config_key`` config value,
+    e.g. ``"64M"``, and a size of zero disables the cache.
+    """
+
+    def __init__(self, name, config_key, default_size):
+        self.name = name
+        self.config_key = config_key
+        self.default_size = default_size
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._nbytes = self._hits = self._misses = 0
+        self._lock = threading.Lock()
+        _ARRAY_CACHES[name] = self
+
+    @property
+    def max_nbytes(self):
+        """The maximum size of the cache in bytes."""
+        size = _get_config_cached(self.config_key, self.default_size)
+        return _parse_nbytes(size, self.config_key)
+
+    def get(self, key, fun, *args, **kwargs):
+        """Get a value from the cache, computing it with ``fun`` on a miss."""
+        key = _cache_key(*key)
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+            self._misses += 1
+        # compute without holding the lock, so other threads are not blocked
+        out = fun(*args, **kwargs)
+        _set_read_only(out)
+        nbytes = object_size(key) + object_size(out)
+        max_nbytes = self.max_nbytes
+        with self._lock:
+            if nbytes <= max_nbytes and key not in self._entries:
+                self._entries[key] = (out, nbytes)
+                self._nbytes += nbytes
+            while self._nbytes > max_nbytes:
+                self._nbytes -= self._entries.popitem(last=False)[1][1]
+        return out
+
+    def info(self):
+        """Get the hit and miss counts and the current size of the cache."""
+        with self._lock:
+            return dict(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                nbytes=self._nbytes,
+            )
+
+    def clear(self):
+        """Empty the cache and reset its counts."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = self._hits = self._misses = 0
+
+
+def _cache_key(*args):
+    """Make a hashable cache key from parameters."""
+    key = list()
+    for arg in args:
+        if isinstance(arg, dict):
+            arg = _cache_key(*sorted(arg.items()))
+        elif isinstance(arg, list | tuple):
+            arg = _cache_key(*arg)
+        elif isinstance(arg, np.ndarray):
+            arg = (arg.dtype.str, arg.shape, arg.tobytes())
+        key.append(arg)
+    return tuple(key)
+
+
+def _set_read_only(out):
+    if isinstance(out, np.ndarray):
+        out.flags.writeable = False
+    elif isinstance(out, list | tuple):
+        for o in out:
+            _set_read_only(o)
+
+
+def _parse_nbytes(size, name):
+    """Convert a size such as "64M" to a number of bytes."""
+    size = str(size).strip()
+    scale = dict(K=2**10, M=2**20, G=2**30).get(size[-1:].upper(), 1)
+    try:
+        return int(float(size[:-1] if scale > 1 else size) * scale)
+    except ValueError:
+        raise ValueError(
+            f"{name} must be a size in bytes, optionally in kilo-, mega-, or "
+            f"gigabytes, e.g., 100K, 500M, 1G, got {repr(size)}"
+        ) from None
+
+
+def _get_array_caches():
+    # the caches are created when the modules using them are imported
+    from .._fiff.open import _dir_cache  # noqa: F401
+    from ..filter import _filter_cache  # noqa: F401
+    from ..time_frequency.multitaper import _window_cache  # noqa: F401
+
+    return _ARRAY_CACHES
+
+
+def get_cache_info():
+    """Get the use of the in-memory caches of computed arrays.
+
+    MNE-Python keeps designed filters and their FFTs (``"filter"``), and DPSS
+    tapers and wavelets (``"window"``) in memory, to reuse them when the same
+    parameters are used repeatedly. The maximum sizes of these caches are set
+    by the ``MNE_FILTER_CACHE_SIZE`` and ``MNE_WINDOW_CACHE_SIZE`` config
+    values. The parsed tag directories of recently opened FIF files
+    (``"fiff_dir"``) are kept as well, up to ``MNE_FIFF_DIR_CACHE_SIZE`` files.
+
+    Returns
+    -------
+    info : dict
+        For each cache, a dict with the number of ``hits`` and ``misses``
+        since it was last cleared, and the number of entries (``size``) and
+        the approximate number of bytes (``nbytes``) it holds.
+
+    See Also
+    --------
+    clear_cache
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    return {name: cache.info() for name, cache in _get_array_caches().items()}
+
+
+def clear_cache(name=None):
+    """Empty the in-memory caches of computed arrays and reset their counts.
+
+    Parameters
+    ----------
+    name : str | None
+        The name of the cache to clear, see :func:`mne.utils.get_cache_info`.
+        If None (default), all caches are cleared.
+
+    See Also
+    --------
+    get_cache_info
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    _validate_type(name, (str, None), "name")
+    caches = _get_array_caches()
+    if name is not None:
+        _check_option("name", name, sorted(caches))
+    for cache_name, cache in caches.items():
+        if name in (None, cache_name):
+            cache.clear()
+
+
+def _get_float_dtype(dtype=np.float64):
+    """Get the dtype to store and process data with.
+
+    Double-precision dtypes are demoted to single precision when the
+    ``MNE_DATA_DTYPE`` config value is ``"float32"``.
+    """
+    dtype = np.dtype(dtype)
+    # this is called for every read and filter, so avoid parsing the config
+    # file each time
+    use = _get_config_cached("MNE_DATA_DTYPE", "float64")
+    if use not in ("float64", "float32"):
+        _check_option("MNE_DATA_DTYPE", use, ("float64", "float32"))
+    if use == "float32":
+        single = dict(float64=np.float32, complex128=np.complex64)
+        dtype = np.dtype(single.get(dtype.name, dtype))
+    return dtype
+
+
 def _array_repr(x):
     """Produce compact info about float ndarray x."""
     assert isinstance(x, np.ndarray), type(x)
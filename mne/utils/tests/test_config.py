@@ -18,6 +18,7 @@ import mne
 import mne.utils.config
 from mne.utils import (
     ClosingStringIO,
+    _get_config_cached,
     _get_stim_channel,
     _record_warnings,
     get_config,
@@ -106,6 +107,25 @@ def test_config(tmp_path):
     pytest.raises(TypeError, _get_stim_channel, [1], None)
 
 
+def test_config_cached(tmp_path, monkeypatch):
+    """Test reading config file values once per session."""
+    key = "MNE_DATA_DTYPE"
+    monkeypatch.setenv("_MNE_FAKE_HOME_DIR", str(tmp_path))
+    monkeypatch.delenv(key, raising=False)
+    assert _get_config_cached(key, "float64") == "float64"
+    set_config(key, "float32", set_env=False)
+    assert _get_config_cached(key, "float64") == "float32"
+    monkeypatch.setenv(key, "float16")  # the environment takes precedence
+    assert _get_config_cached(key, "float64") == "float16"
+    monkeypatch.delenv(key)
+    # changes made to the file by others are not seen
+    with open(get_config_path(), "w") as fid:
+        json.dump(dict(), fid)
+    assert _get_config_cached(key, "float64") == "float32"
+    set_config(key, None, set_env=False)
+    assert _get_config_cached(key, "float64") == "float64"
+
+
 def test_sys_info_basic():
     """Test info-showing utility."""
     out = ClosingStringIO()